@@ -125,6 +125,7 @@ except ImportError:
 import tkinter as tk
 from tkinter import ttk, filedialog, scrolledtext, messagebox
 from tkinter.colorchooser import askcolor
+import tkinter.font as tkfont
 
 
 import pyautogui #needed by OCR
@@ -147,8 +148,14 @@ import chardet
 import threading
 from threading import Thread, Event
 import time
+from datetime import datetime
 import re
 import json
+import heapq
+import array
+import bisect
+import itertools
+from collections import deque, OrderedDict
 import pygame
 import pyttsx3
 import importlib
@@ -159,8 +166,15 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 
 import socket
+import asyncio
 import ssl
 import hashlib
+import sqlite3
+import tempfile
+import zlib
+import gzip
+import shutil
+import select
 
 try:
     from plyer import notification
@@ -6150,6 +6164,8 @@ class PluginManager:
             # Update state - use the filename as the key in loaded_plugins
             self.loaded_plugins[plugin_filename] = plugin_instance
             self.plugins[plugin_filename]['enabled'] = True
+            if hasattr(self.app, 'invalidate_filter_plan'):
+                self.app.invalidate_filter_plan()
             self.app.messages(2, 9, f"Plugin loaded: {plugin_filename}")
     
             return True
@@ -6170,6 +6186,8 @@ class PluginManager:
             plugin_instance.teardown()
             del self.loaded_plugins[plugin_name]
             self.plugins[plugin_name]['enabled'] = False
+            if hasattr(self.app, 'invalidate_filter_plan'):
+                self.app.invalidate_filter_plan()
             self.app.messages(2, 9, f"Plugin unloaded: {plugin_name}")
             return True
             
@@ -6258,6 +6276,1180 @@ class CollapsibleFrame(ttk.Frame):
         return self.content_frame
 
 
+# ****************************************************************************
+# *************************** Log View ***************************************
+# ****************************************************************************
+
+class LogLineModel:
+    """Compact ring buffer holding the display history of one log view.
+
+    Line text is stored UTF-8 encoded, back to back, in one preallocated
+    bytearray. Parallel arrays hold each line's byte offset, length,
+    timestamp, tag id and filter-match bitmask. When either the line slots
+    or the byte ring are full, the oldest lines are overwritten in O(1).
+
+    Lines are addressed by absolute index: the first line ever appended is 0
+    and indexes never change. start is the oldest retained index, end is one
+    past the newest.
+
+    Highlight spans, (start column, end column, tag) tuples, are kept in a
+    dict only for the lines that have any.
+    """
+
+    MAX_FILTER_BITS = 64
+
+    def __init__(self, max_lines=200000, avg_line_bytes=96):
+        self.max_lines = max(1, int(max_lines))
+        self.capacity = max(65536, self.max_lines * avg_line_bytes)
+        self.data = bytearray(self.capacity)
+        self.offsets = array.array('I', bytes(4 * self.max_lines))
+        self.lengths = array.array('I', bytes(4 * self.max_lines))
+        self.timestamps = array.array('d', bytes(8 * self.max_lines))
+        self.masks = array.array('Q', bytes(8 * self.max_lines))
+        self.tag_ids = array.array('H', bytes(2 * self.max_lines))
+
+        self.tags = [None]  # tag id -> tag name, id 0 means untagged
+        self.tag_lookup = {None: 0}
+        self.filter_bits = {}  # filter key -> bit number in the match mask
+        self.spans = {}  # absolute index -> highlight spans
+
+        self.start = 0  # Absolute index of the oldest retained line
+        self.count = 0
+        self.write_pos = 0  # Byte offset for the next line
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def end(self):
+        return self.start + self.count
+
+    def tag_id(self, tag):
+        """Small integer id for a tag name"""
+        tag_id = self.tag_lookup.get(tag)
+        if tag_id is None:
+            tag_id = len(self.tags)
+            self.tags.append(tag)
+            self.tag_lookup[tag] = tag_id
+        return tag_id
+
+    def filter_bit(self, filter_key):
+        """Bit assigned to a filter in the match mask, None once all bits are used"""
+        bit = self.filter_bits.get(filter_key)
+        if bit is None and len(self.filter_bits) < self.MAX_FILTER_BITS:
+            bit = len(self.filter_bits)
+            self.filter_bits[filter_key] = bit
+        return bit
+
+    def mask_for(self, filter_keys):
+        """Match mask for a collection of filter keys"""
+        mask = 0
+        for filter_key in filter_keys:
+            bit = self.filter_bit(filter_key)
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+
+    def _evict_oldest(self):
+        if self.spans:
+            self.spans.pop(self.start, None)
+        self.start += 1
+        self.count -= 1
+
+    def append(self, text, tag=None, mask=0, timestamp=None, spans=None):
+        """Store a line and return its absolute index"""
+        encoded = text.encode('utf-8', errors='replace')[:self.capacity]
+        size = len(encoded)
+
+        if self.count == self.max_lines:
+            self._evict_oldest()
+
+        pos = self.write_pos
+        if pos + size > self.capacity:
+            # Wrap: lines still in the skipped tail are the oldest ones, drop them
+            while self.count and self.offsets[self.start % self.max_lines] >= pos:
+                self._evict_oldest()
+            pos = 0
+
+        # Overwrite the oldest lines whose bytes overlap the write region,
+        # empty lines inside it count as overlapping too
+        while self.count:
+            slot = self.start % self.max_lines
+            offset = self.offsets[slot]
+            if offset < pos + size and (offset >= pos or offset + self.lengths[slot] > pos):
+                self._evict_oldest()
+            else:
+                break
+
+        self.data[pos:pos + size] = encoded
+        slot = self.end % self.max_lines
+        self.offsets[slot] = pos
+        self.lengths[slot] = size
+        self.timestamps[slot] = time.time() if timestamp is None else timestamp
+        self.masks[slot] = mask
+        self.tag_ids[slot] = self.tag_id(tag)
+        self.count += 1
+        self.write_pos = pos + size
+        if spans:
+            self.spans[self.end - 1] = spans
+        return self.end - 1
+
+    def _slot(self, index):
+        if index < self.start or index >= self.end:
+            raise IndexError(index)
+        return index % self.max_lines
+
+    def get_bytes(self, index):
+        """Zero-copy view of a line's encoded bytes"""
+        slot = self._slot(index)
+        offset = self.offsets[slot]
+        return memoryview(self.data)[offset:offset + self.lengths[slot]]
+
+    def get_text(self, index):
+        return bytes(self.get_bytes(index)).decode('utf-8', errors='replace')
+
+    def get(self, index):
+        """Return (text, tag) for an absolute index"""
+        return self.get_text(index), self.tags[self.tag_ids[self._slot(index)]]
+
+    def get_mask(self, index):
+        return self.masks[self._slot(index)]
+
+    def get_timestamp(self, index):
+        return self.timestamps[self._slot(index)]
+
+    def get_spans(self, index):
+        return self.spans.get(index, ())
+
+    def range(self, start, stop):
+        """Yield (index, text, tag) for absolute indexes in [start, stop)"""
+        start = max(start, self.start)
+        stop = min(stop, self.end)
+        data = self.data
+        for index in range(start, stop):
+            slot = index % self.max_lines
+            offset = self.offsets[slot]
+            text = data[offset:offset + self.lengths[slot]].decode('utf-8', errors='replace')
+            yield index, text, self.tags[self.tag_ids[slot]]
+
+    def clear(self):
+        """Drop all lines, indexes keep counting from where they were"""
+        self.start = self.end
+        self.count = 0
+        self.write_pos = 0
+        self.spans.clear()
+
+    def memory_usage(self):
+        """Approximate bytes held by the buffer and its columns"""
+        columns = (self.offsets, self.lengths, self.timestamps, self.masks, self.tag_ids)
+        return self.capacity + sum(column.itemsize * len(column) for column in columns)
+
+class LogViewQuery:
+    """Transient predicate selecting which history lines a view shows.
+
+    Cheap checks run first: the filter-match mask and the time range only
+    read the model's columns, text is decoded only for lines that pass them.
+    The time range applies to each line's arrival timestamp in the model.
+    Empty criteria match everything.
+    """
+
+    def __init__(self, text="", regex=False, mask=0, since=None, until=None):
+        self.text = text
+        self.mask = mask  # Lines must match at least one of these filter bits
+        self.since = since
+        self.until = until
+        self.pattern = re.compile(text, re.IGNORECASE) if text and regex else None  # Raises re.error
+        self.needle = text.lower() if text and not regex else None
+
+    def is_empty(self):
+        return not (self.text or self.mask or self.since is not None or self.until is not None)
+
+    def matches(self, model, index):
+        """True if the line at absolute index passes the query"""
+        slot = model._slot(index)
+        if self.mask and not model.masks[slot] & self.mask:
+            return False
+        timestamp = model.timestamps[slot]
+        if self.since is not None and timestamp < self.since:
+            return False
+        if self.until is not None and timestamp > self.until:
+            return False
+        if self.pattern is not None:
+            return self.pattern.search(model.get_text(index)) is not None
+        if self.needle is not None:
+            return self.needle in model.get_text(index).lower()
+        return True
+
+    def select(self, model):
+        """Sorted array of absolute indexes in the model that pass the query"""
+        rows = array.array('Q')
+        max_lines, masks, timestamps = model.max_lines, model.masks, model.timestamps
+        offsets, lengths, data = model.offsets, model.lengths, model.data
+        mask, since, until = self.mask, self.since, self.until
+        pattern, needle = self.pattern, self.needle
+        for index in range(model.start, model.end):
+            slot = index % max_lines
+            if mask and not masks[slot] & mask:
+                continue
+            if since is not None and timestamps[slot] < since:
+                continue
+            if until is not None and timestamps[slot] > until:
+                continue
+            if pattern is not None or needle is not None:
+                offset = offsets[slot]
+                text = data[offset:offset + lengths[slot]].decode('utf-8', errors='replace')
+                if pattern is not None:
+                    if pattern.search(text) is None:
+                        continue
+                elif needle not in text.lower():
+                    continue
+            rows.append(index)
+        return rows
+
+class StyleTagPool:
+    """One Text widget tag per distinct (foreground, background) pair.
+
+    Filters with the same colors share a tag, so the number of Tk tags
+    stays bounded by the number of color combinations in use.
+    """
+
+    def __init__(self, text_widget, prefix="style"):
+        self.text = text_widget
+        self.prefix = prefix
+        self.tags = {}  # (fg, bg) -> tag name
+
+    def tag_for(self, fg, bg):
+        key = (fg or "", bg or "")
+        tag = self.tags.get(key)
+        if tag is None:
+            tag = f"{self.prefix}_{len(self.tags)}"
+            self.text.tag_configure(tag, foreground=key[0], background=key[1])
+            self.tags[key] = tag
+        return tag
+
+class VirtualLogView:
+    """Render only the visible part of a LogLineModel into a Tk Text widget.
+
+    The widget holds the rows on screen plus a small margin. Scrolling moves
+    a window over the model and re-renders it, so cost stays constant no
+    matter how much history is kept. While following the tail, new lines
+    are appended and the oldest rendered row is trimmed.
+
+    With a LogViewQuery set, the view shows only the matching lines. Their
+    absolute indexes are kept in a sorted array and scrolling works on
+    positions in that array; without a query a position is the absolute
+    line index itself.
+
+    A hidden view (set_visible(False)) does no widget work at all; showing
+    it again renders the current window once.
+    """
+
+    def __init__(self, text_widget, scrollbar, model, margin=20):
+        self.text = text_widget
+        self.scrollbar = scrollbar
+        self.model = model
+        self.margin = margin
+        self.query = None  # LogViewQuery restricting the shown lines
+        self.rows = None  # Sorted absolute indexes passing the query
+        self.rows_first = 0  # First entry of rows not yet evicted from the model
+        self.top = 0  # Position of the first visible line when not following
+        self.follow = True
+        self.rendered_start = 0  # Absolute index of widget row 1
+        self.rendered_stop = 0
+        self.rendered_pos_start = 0  # Same range as positions
+        self.rendered_pos_stop = 0
+        self.render_hooks = []  # Called with (rendered_start, rendered_stop) after a render
+        self._render_pending = False
+        self._span_lines = []  # Appended lines whose spans are tagged in the next frame
+        self.visible = True
+        self._rows_fit = None  # (font, rows) cached until the widget is resized
+
+        self.scrollbar.config(command=self.on_scrollbar)
+        self.text.bind("<MouseWheel>", self.on_mousewheel)
+        self.text.bind("<Button-4>", lambda e: self.scroll(-3))
+        self.text.bind("<Button-5>", lambda e: self.scroll(3))
+        self.text.bind("<Prior>", lambda e: self.scroll(-self.visible_rows()))
+        self.text.bind("<Next>", lambda e: self.scroll(self.visible_rows()))
+        self.text.bind("<Control-Home>", lambda e: self.scroll_to_position(self.bounds()[0]))
+        self.text.bind("<Control-End>", lambda e: self.scroll_to_end())
+        self.text.bind("<Configure>", self.on_configure)
+
+    def set_model(self, model):
+        self.model = model
+        self.follow = True
+        self.set_query(self.query)
+
+    def set_visible(self, visible):
+        """Switch between rendering and headless mode"""
+        if visible == self.visible:
+            return
+        self.visible = visible
+        if visible:
+            self.render()
+
+    def set_query(self, query):
+        """Show only the lines passing query, None or an empty query shows all"""
+        if query is not None and query.is_empty():
+            query = None
+        # Keep the first visible line anchored when not following
+        first, end = self.bounds()
+        anchor = self.line_at(self.top) if first <= self.top < end else self.model.start
+        self.query = query
+        self.rows = query.select(self.model) if query else None
+        self.rows_first = 0
+        self.top = self.position_of(anchor)
+        self.render()
+        return 0 if self.rows is None else len(self.rows)
+
+    def bounds(self):
+        """[first, end) positions currently available"""
+        if self.rows is None:
+            return self.model.start, self.model.end
+        self.rows_first = bisect.bisect_left(self.rows, self.model.start, self.rows_first)
+        return self.rows_first, len(self.rows)
+
+    def line_at(self, position):
+        return position if self.rows is None else self.rows[position]
+
+    def position_of(self, index):
+        """Position of the first shown line at or after absolute index"""
+        if self.rows is None:
+            return index
+        return bisect.bisect_left(self.rows, index, self.rows_first)
+
+    def shown_count(self):
+        first, end = self.bounds()
+        return end - first
+
+    def on_configure(self, event=None):
+        """Widget resized: measure the rows again and re-render"""
+        self._rows_fit = None
+        self.schedule_render()
+
+    def visible_rows(self):
+        """Number of text rows that fit in the widget, measured once per size and font"""
+        font = self.text.cget("font")
+        if self._rows_fit is not None and self._rows_fit[0] == font:
+            return self._rows_fit[1]
+        try:
+            linespace = tkfont.Font(font=font).metrics("linespace")
+            height = self.text.winfo_height()
+            if height > 1 and linespace > 0:
+                self._rows_fit = (font, max(1, height // linespace))
+                return self._rows_fit[1]
+        except tk.TclError:
+            pass
+        return int(self.text.cget("height"))
+
+    def window(self):
+        """[start, stop) positions that should be rendered"""
+        rows = self.visible_rows()
+        first, end = self.bounds()
+        if self.follow:
+            stop = end
+            start = max(first, stop - rows - self.margin)
+        else:
+            start = min(max(self.top, first), max(first, end - rows))
+            self.top = start
+            stop = min(end, start + rows + self.margin)
+        return start, stop
+
+    def _needs_compaction(self):
+        return self.rows is not None and self.rows_first >= max(65536, len(self.rows) // 2)
+
+    def _compact_rows(self):
+        """Drop evicted entries from the front of rows, shifting positions"""
+        if not self._needs_compaction():
+            return
+        shift = self.rows_first
+        self.rows = self.rows[shift:]
+        self.rows_first = 0
+        self.top = max(0, self.top - shift)
+
+    def render(self):
+        """Replace the widget content with the current window, one insert call"""
+        self._render_pending = False
+        self._span_lines = []  # Tagged again below with the whole window
+        if not self.visible:
+            return
+        self._compact_rows()
+        start, stop = self.window()
+        chunks = []
+        if self.rows is None:
+            for index, text, tag in self.model.range(start, stop):
+                chunks.append(text + "\n")
+                chunks.append((tag,) if tag else ())
+        else:
+            for position in range(start, stop):
+                text, tag = self.model.get(self.rows[position])
+                chunks.append(text + "\n")
+                chunks.append((tag,) if tag else ())
+        self.text.delete("1.0", tk.END)
+        if chunks:
+            self.text.insert(tk.END, *chunks)
+            self.tag_spans(1, (self.line_at(position) for position in range(start, stop)))
+        self.rendered_pos_start, self.rendered_pos_stop = start, stop
+        if start < stop:
+            self.rendered_start = self.line_at(start)
+            self.rendered_stop = self.line_at(stop - 1) + 1
+        else:
+            self.rendered_start = self.rendered_stop = self.model.end
+        for hook in self.render_hooks:
+            hook(self.rendered_start, self.rendered_stop)
+        if self.follow:
+            self.text.see(tk.END)
+        else:
+            self.text.yview_moveto(0)
+        self.update_scrollbar()
+
+    def tag_spans(self, first_row, indexes):
+        """Apply the highlight spans of consecutive rows, one tag_add per tag"""
+        self.tag_rows(enumerate(indexes, first_row))
+
+    def tag_rows(self, rows):
+        """Apply the highlight spans of (widget row, absolute index) pairs, one tag_add per tag"""
+        spans = self.model.spans
+        if not spans:
+            return
+        ranges = {}
+        for row, index in rows:
+            for start, end, tag in spans.get(index, ()):
+                ranges.setdefault(tag, []).extend((f"{row}.{start}", f"{row}.{end}"))
+        for tag, tag_ranges in ranges.items():
+            self.text.tag_add(tag, *tag_ranges)
+
+    def schedule_render(self):
+        """Coalesce render requests into one per event loop pass"""
+        if self.visible and not self._render_pending:
+            self._render_pending = True
+            self.text.after_idle(self.render)
+
+    def flush_spans(self):
+        """Frame pass: tag the spans of every line appended since the last one"""
+        indexes, self._span_lines = self._span_lines, []
+        if not indexes or self._render_pending:
+            return  # The pending render tags the whole window
+        rows = []
+        for index in indexes:
+            if self.rendered_start <= index < self.rendered_stop:
+                rows.append((self.position_of(index) - self.rendered_pos_start + 1, index))
+        self.tag_rows(rows)
+
+    def on_append(self, index):
+        """React to a new model line at absolute index"""
+        if self.rows is not None:
+            if not self.query.matches(self.model, index):
+                return
+            self.rows.append(index)
+        if not self.visible:
+            return
+        position = self.position_of(index)
+        if not self.follow:
+            self.update_scrollbar()
+            return
+        if self._render_pending or position != self.rendered_pos_stop:
+            self.schedule_render()
+            return
+        text, tag = self.model.get(index)
+        self.text.insert(tk.END, text + "\n", (tag,) if tag else ())
+        if index in self.model.spans:
+            # Collected and tagged once per frame, not one tag_add per line
+            if not self._span_lines:
+                self.text.after_idle(self.flush_spans)
+            self._span_lines.append(index)
+        self.rendered_pos_stop = position + 1
+        self.rendered_stop = index + 1
+        # Trim from the top so the widget never grows past the window size
+        first, end = self.bounds()
+        excess = (self.rendered_pos_stop - self.rendered_pos_start) - (self.visible_rows() + self.margin)
+        if excess > 0 or self.rendered_pos_start < first:
+            excess = max(excess, first - self.rendered_pos_start)
+            self.text.delete("1.0", f"{excess + 1}.0")
+            self.rendered_pos_start += excess
+            self.rendered_start = self.line_at(self.rendered_pos_start)
+        self.text.see(tk.END)
+        self.update_scrollbar()
+        if self._needs_compaction():
+            self.schedule_render()  # Lets render compact rows
+
+    def update_scrollbar(self):
+        first, end = self.bounds()
+        total = end - first
+        if total == 0:
+            self.scrollbar.set(0.0, 1.0)
+            return
+        rows = self.visible_rows()
+        top = end - rows if self.follow else self.top
+        top = max(0, top - first)
+        self.scrollbar.set(top / total, min(1.0, (top + rows) / total))
+
+    def on_scrollbar(self, *args):
+        """Scrollbar command: moveto fraction or scroll n units/pages"""
+        if args[0] == "moveto":
+            first, end = self.bounds()
+            self.scroll_to_position(first + int(float(args[1]) * (end - first)))
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= self.visible_rows()
+            self.scroll(amount)
+
+    def on_mousewheel(self, event):
+        self.scroll(-3 if event.delta > 0 else 3)
+        return "break"
+
+    def scroll(self, delta):
+        current = self.bounds()[1] - self.visible_rows() if self.follow else self.top
+        self.scroll_to_position(current + delta)
+        return "break"
+
+    def scroll_to_position(self, position):
+        """Show position as the first visible line, following again at the bottom"""
+        first, end = self.bounds()
+        if position >= end - self.visible_rows():
+            self.follow = True
+        else:
+            self.follow = False
+            self.top = max(first, position)
+        self.render()
+        return "break"
+
+    def scroll_to(self, index):
+        """Show absolute index (or the next shown line) as the first visible line"""
+        return self.scroll_to_position(self.position_of(index))
+
+    def scroll_to_end(self):
+        self.follow = True
+        self.render()
+        return "break"
+
+    def see_line(self, index):
+        """Bring an absolute line index into view, a few rows from the top"""
+        first = self.bounds()[0]
+        self.scroll_to_position(max(first, self.position_of(index) - max(1, self.visible_rows() // 3)))
+
+    def index_at(self, widget_index):
+        """Absolute line index shown at a Text widget index, None past the end"""
+        position = self.rendered_pos_start + int(self.text.index(widget_index).split(".")[0]) - 1
+        if position >= self.rendered_pos_stop:
+            return None
+        return self.line_at(position)
+
+    def widget_index(self, index, column=0):
+        """Text widget index for an absolute line and column, None if not rendered"""
+        if not self.rendered_start <= index < self.rendered_stop:
+            return None
+        if self.rows is None:
+            return f"{index - self.rendered_start + 1}.{column}"
+        position = bisect.bisect_left(self.rows, index, self.rendered_pos_start, self.rendered_pos_stop)
+        if position < self.rendered_pos_stop and self.rows[position] == index:
+            return f"{position - self.rendered_pos_start + 1}.{column}"
+        return None
+
+class LogSearch:
+    """Search a LogLineModel on a worker thread.
+
+    The worker scans the history as it was when the search started, in
+    chunks of chunk_lines, and queues (index, column, length) matches for
+    the UI thread to pick up with poll(). Queries are literal and
+    case-insensitive unless regex is set. Lines truncated for display are
+    searched in full through long_lines, a LongLineStore. cancel() stops
+    the worker at the next chunk boundary.
+    """
+
+    def __init__(self, model, query, regex=False, chunk_lines=5000, long_lines=None):
+        self.model = model
+        self.long_lines = long_lines
+        self.query = query
+        self.chunk_lines = chunk_lines
+        if regex:
+            self.pattern = re.compile(query, re.IGNORECASE)  # Raises re.error on a bad query
+            self.needle = None
+        else:
+            self.pattern = None
+            self.needle = query.lower()
+        self.first = model.start
+        self.stop = model.end
+        self.scanned = 0
+        self.done = False
+        self.cancelled = threading.Event()
+        self.results = deque()  # Lists of matches, one per chunk
+        self.thread = threading.Thread(target=self._run, daemon=True, name="LogSearch")
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def cancel(self):
+        self.cancelled.set()
+
+    @property
+    def progress(self):
+        total = self.stop - self.first
+        return 1.0 if total <= 0 else min(1.0, self.scanned / total)
+
+    def _find(self, text):
+        """Yield (column, length) for every match in one line"""
+        if self.pattern is not None:
+            for match in self.pattern.finditer(text):
+                if match.end() > match.start():
+                    yield match.start(), match.end() - match.start()
+            return
+        length = len(self.needle)
+        text_lower = text.lower()
+        column = text_lower.find(self.needle)
+        while column != -1:
+            yield column, length
+            column = text_lower.find(self.needle, column + length)
+
+    def _run(self):
+        model = self.model
+        long_lines = self.long_lines
+        index = self.first
+        try:
+            while index < self.stop and not self.cancelled.is_set():
+                # Lines evicted while we were behind are skipped
+                index = max(index, model.start)
+                chunk_stop = min(self.stop, index + self.chunk_lines)
+                matches = []
+                for line_index in range(index, chunk_stop):
+                    text = long_lines.get(line_index) if long_lines and line_index in long_lines else None
+                    try:
+                        if text is None:
+                            text = model.get_text(line_index)
+                    except IndexError:
+                        continue
+                    for column, length in self._find(text):
+                        matches.append((line_index, column, length))
+                # Drop anything the UI thread overwrote while we were reading it
+                if matches and matches[0][0] < model.start:
+                    matches = [m for m in matches if m[0] >= model.start]
+                if matches:
+                    self.results.append(matches)
+                self.scanned = chunk_stop - self.first
+                index = chunk_stop
+        finally:
+            self.done = True
+
+    def poll(self):
+        """Return the matches found since the last poll, in index order"""
+        matches = []
+        while self.results:
+            matches.extend(self.results.popleft())
+        return matches
+
+class LongLineStore:
+    """Full text of display lines that were truncated for rendering.
+
+    The text goes to an anonymous temporary file and only its offset and
+    length are kept, keyed by absolute line index, so multi-MB lines cost
+    no memory until someone expands them. When the file would pass
+    max_bytes it is reset and older entries are forgotten. get() may be
+    called from a search worker while the UI thread adds lines.
+    """
+
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()  # Guards the shared file position
+        self.file = None
+        self.write_pos = 0
+        self.entries = OrderedDict()  # absolute index -> (offset, length), oldest first
+
+    def __contains__(self, index):
+        return index in self.entries
+
+    def add(self, index, text):
+        data = text.encode('utf-8', errors='replace')
+        with self.lock:
+            if self.file is None:
+                self.file = tempfile.TemporaryFile()
+            if self.write_pos + len(data) > self.max_bytes:
+                self.entries.clear()
+                self.file.seek(0)
+                self.file.truncate()
+                self.write_pos = 0
+            self.file.seek(self.write_pos)
+            self.file.write(data)
+            self.entries[index] = (self.write_pos, len(data))
+            self.write_pos += len(data)
+
+    def get(self, index):
+        """Full text of a truncated line, None if it is no longer stored"""
+        with self.lock:
+            entry = self.entries.get(index)
+            if entry is None or self.file is None:
+                return None
+            offset, length = entry
+            self.file.seek(offset)
+            return self.file.read(length).decode('utf-8', errors='replace')
+
+    def discard_before(self, start):
+        """Forget lines the history model has evicted"""
+        while self.entries:
+            index = next(iter(self.entries))
+            if index >= start:
+                break
+            del self.entries[index]
+
+    def indexes(self, start, stop):
+        """Stored indexes in [start, stop)"""
+        return [index for index in self.entries if start <= index < stop]
+
+    def close(self):
+        with self.lock:
+            self.entries.clear()
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+            self.write_pos = 0
+
+class SpillBuffer:
+    """FIFO of display lines held back while a view is paused.
+
+    Up to max_memory entries stay in a deque. Beyond that, entries are
+    appended to an anonymous temporary file and read back in order once
+    the in-memory ones are consumed. Past max_file_bytes new entries are
+    dropped and counted in dropped.
+    """
+
+    def __init__(self, max_memory=50000, max_file_bytes=512 * 1024 * 1024):
+        self.max_memory = max_memory
+        self.max_file_bytes = max_file_bytes
+        self.memory = deque()
+        self.file = None
+        self.file_count = 0  # Entries written to the file and not yet read back
+        self.read_pos = 0
+        self.write_pos = 0
+        self.dropped = 0
+
+    def __len__(self):
+        return len(self.memory) + self.file_count
+
+    def push(self, line, tag=None, mask=0, timestamp=None, spans=None):
+        entry = (line, tag, mask, time.time() if timestamp is None else timestamp, spans)
+        # Once spilling, keep writing to the file so order is preserved
+        if not self.file_count and len(self.memory) < self.max_memory:
+            self.memory.append(entry)
+            return
+        if self.write_pos >= self.max_file_bytes:
+            self.dropped += 1
+            return
+        if self.file is None:
+            self.file = tempfile.TemporaryFile()
+        record = (json.dumps(entry) + "\n").encode('utf-8', errors='replace')
+        self.file.seek(self.write_pos)
+        self.file.write(record)
+        self.write_pos += len(record)
+        self.file_count += 1
+
+    def pop_many(self, limit):
+        """Remove and return up to limit of the oldest entries"""
+        entries = []
+        while self.memory and len(entries) < limit:
+            entries.append(self.memory.popleft())
+        if len(entries) < limit and self.file_count:
+            self.file.seek(self.read_pos)
+            while self.file_count and len(entries) < limit:
+                record = self.file.readline()
+                self.read_pos += len(record)
+                self.file_count -= 1
+                entries.append(tuple(json.loads(record)))
+            if not self.file_count:
+                # Drained: reuse the file from the start
+                self.file.seek(0)
+                self.file.truncate()
+                self.read_pos = self.write_pos = 0
+        return entries
+
+    def skip(self, count):
+        """Discard the count oldest entries"""
+        while count > 0 and self.memory:
+            self.memory.popleft()
+            count -= 1
+        while count > 0 and self.file_count:
+            count -= len(self.pop_many(min(count, 10000)))
+
+    def close(self):
+        self.memory.clear()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        self.file_count = 0
+        self.read_pos = self.write_pos = 0
+
+# ****************************************************************************
+# *************************** Log Index **************************************
+# ****************************************************************************
+
+class LogIndexer:
+    """Background full-text index over a log file and its rotated siblings.
+
+    Lines are stored in an SQLite FTS5 table (trigram tokenizer when the
+    SQLite build has it, word tokens otherwise) together with the file they
+    came from, their byte offset and line number. A worker thread indexes
+    the siblings oldest first, then keeps polling the live file for new
+    complete lines. A file whose size shrinks or whose first bytes change is
+    treated as replaced and re-indexed from the start.
+    """
+
+    HEAD_BYTES = 256
+    SKIP_SUFFIXES = ('.gz', '.bz2', '.xz', '.zip', '.7z', '.db', '.db-wal', '.db-shm')
+
+    def __init__(self, db_path, log_path, encoding='utf-8', poll_interval=2.0, batch_lines=5000, report=None):
+        self.db_path = str(db_path)
+        self.log_path = Path(log_path)
+        self.encoding = encoding or 'utf-8'
+        self.poll_interval = poll_interval
+        self.batch_lines = batch_lines
+        self.tokenizer = None
+        self.indexing = False
+        self.indexed_lines = 0
+        self.last_error = None
+        self.report = report  # report(message) from the worker, must be thread safe
+        self.stop_event = Event()
+        self.thread = None
+
+    @staticmethod
+    def available():
+        """True if this Python's SQLite build supports FTS5"""
+        try:
+            conn = sqlite3.connect(":memory:")
+            try:
+                conn.execute("CREATE VIRTUAL TABLE t USING fts5(x)")
+            finally:
+                conn.close()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return self
+        self.stop_event.clear()
+        self.thread = Thread(target=self._run, daemon=True, name="LogIndexer")
+        self.thread.start()
+        return self
+
+    def stop(self, timeout=2.0):
+        self.stop_event.set()
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=timeout)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=5.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _create_schema(self, conn):
+        conn.execute("""CREATE TABLE IF NOT EXISTS files (
+                            id INTEGER PRIMARY KEY,
+                            path TEXT UNIQUE,
+                            indexed INTEGER DEFAULT 0,
+                            line_count INTEGER DEFAULT 0,
+                            head BLOB)""")
+        try:
+            conn.execute("""CREATE VIRTUAL TABLE IF NOT EXISTS lines USING fts5(
+                                text, file_id UNINDEXED, offset UNINDEXED, lineno UNINDEXED,
+                                tokenize='trigram')""")
+        except sqlite3.OperationalError:
+            # SQLite older than 3.34 has no trigram tokenizer
+            conn.execute("""CREATE VIRTUAL TABLE IF NOT EXISTS lines USING fts5(
+                                text, file_id UNINDEXED, offset UNINDEXED, lineno UNINDEXED)""")
+        sql = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'lines'").fetchone()[0]
+        self.tokenizer = 'trigram' if 'trigram' in sql else 'unicode61'
+        conn.commit()
+
+    def sibling_files(self):
+        """The live file and its rotated siblings, oldest first"""
+        directory = self.log_path.parent
+        name, stem, suffix = self.log_path.name, self.log_path.stem, self.log_path.suffix
+        found = {}
+        try:
+            for path in directory.iterdir():
+                if path == self.log_path or not path.is_file():
+                    continue
+                if path.name.lower().endswith(self.SKIP_SUFFIXES):
+                    continue
+                rotated = path.name.startswith(name + ".")
+                if suffix and not rotated:
+                    rotated = path.name.startswith(stem + ".") and path.name.endswith(suffix)
+                if rotated:
+                    found[path] = path.stat().st_mtime
+        except OSError:
+            pass
+        files = sorted(found, key=found.get)
+        if self.log_path.exists():
+            files.append(self.log_path)
+        return files
+
+    def _run(self):
+        try:
+            conn = self._connect()
+            self._create_schema(conn)
+        except sqlite3.Error as e:
+            self.last_error = str(e)
+            if self.report:
+                self.report(f"Log index unavailable: {e}")
+            return
+        try:
+            while not self.stop_event.is_set():
+                files = self.sibling_files()
+                self._forget_missing(conn, files)
+                self.indexing = True
+                for path in files:
+                    if self.stop_event.is_set():
+                        break
+                    try:
+                        self._index_file(conn, path)
+                    except (OSError, sqlite3.Error) as e:
+                        self.last_error = f"{path.name}: {e}"
+                self.indexing = False
+                self.indexed_lines = conn.execute("SELECT COALESCE(SUM(line_count), 0) FROM files").fetchone()[0]
+                self.stop_event.wait(self.poll_interval)
+        finally:
+            self.indexing = False
+            conn.close()
+
+    def _forget_missing(self, conn, files):
+        """Drop index rows for files that no longer exist"""
+        present = {str(path) for path in files}
+        for file_id, path in conn.execute("SELECT id, path FROM files").fetchall():
+            if path not in present:
+                conn.execute("DELETE FROM lines WHERE file_id = ?", (file_id,))
+                conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+        conn.commit()
+
+    def _index_file(self, conn, path):
+        """Index the complete lines appended to path since the last pass"""
+        size = path.stat().st_size
+        row = conn.execute("SELECT id, indexed, line_count, head FROM files WHERE path = ?",
+                           (str(path),)).fetchone()
+        with open(path, 'rb') as f:
+            head = f.read(self.HEAD_BYTES)
+            if row is None:
+                cursor = conn.execute("INSERT INTO files (path, head) VALUES (?, ?)", (str(path), head))
+                file_id, offset, lineno = cursor.lastrowid, 0, 0
+            else:
+                file_id, offset, lineno, old_head = row
+                old_head = old_head or b""
+                if size < offset or head[:len(old_head)] != old_head:
+                    # Truncated or replaced by rotation
+                    conn.execute("DELETE FROM lines WHERE file_id = ?", (file_id,))
+                    offset, lineno = 0, 0
+                if len(old_head) < self.HEAD_BYTES:
+                    conn.execute("UPDATE files SET head = ? WHERE id = ?", (head, file_id))
+            if size == offset:
+                conn.commit()
+                return
+
+            f.seek(offset)
+            pending = b""
+            while not self.stop_event.is_set():
+                block = f.read(1 << 20)
+                if not block:
+                    break
+                data = pending + block
+                end = data.rfind(b"\n")
+                if end == -1:
+                    pending = data
+                    continue
+                pending = data[end + 1:]
+                rows = []
+                position = offset
+                for raw in data[:end].split(b"\n"):
+                    text = raw.rstrip(b"\r").decode(self.encoding, errors='replace')
+                    if text:
+                        rows.append((text, file_id, position, lineno))
+                    position += len(raw) + 1
+                    lineno += 1
+                    if len(rows) >= self.batch_lines:
+                        conn.executemany("INSERT INTO lines (text, file_id, offset, lineno) VALUES (?, ?, ?, ?)", rows)
+                        rows = []
+                if rows:
+                    conn.executemany("INSERT INTO lines (text, file_id, offset, lineno) VALUES (?, ?, ?, ?)", rows)
+                offset = position
+                conn.execute("UPDATE files SET indexed = ?, line_count = ? WHERE id = ?", (offset, lineno, file_id))
+                conn.commit()
+
+    def search(self, query, limit=500):
+        """Return (path, offset, lineno, text) rows matching query, oldest first.
+
+        Runs on the calling thread with its own connection; WAL mode lets
+        it read while the worker writes. Use IndexSearch to keep it off the
+        UI thread. Raises sqlite3.Error if the query fails.
+        """
+        query = query.strip()
+        if not query:
+            return []
+        conn = sqlite3.connect(self.db_path, timeout=5.0)
+        try:
+            if self.tokenizer == 'trigram' and len(query) < 3:
+                # Trigram MATCH needs three characters, LIKE still works below that
+                escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                where, args = "lines.text LIKE ? ESCAPE '\\'", (f"%{escaped}%",)
+            else:
+                where, args = "lines MATCH ?", ('"' + query.replace('"', '""') + '"',)
+            return conn.execute(
+                f"""SELECT files.path, lines.offset, lines.lineno, lines.text
+                    FROM lines JOIN files ON files.id = lines.file_id
+                    WHERE {where}
+                    ORDER BY lines.rowid LIMIT ?""", args + (limit,)).fetchall()
+        finally:
+            conn.close()
+
+
+class IndexSearch(LogSearch):
+    """Run a LogIndexer query on a LogSearch worker thread.
+
+    poll() returns the (path, offset, lineno, text) rows once the query has
+    finished; a failed query leaves its message in error.
+    """
+
+    def __init__(self, indexer, query, limit=500):
+        self.indexer = indexer
+        self.query = query
+        self.limit = limit
+        self.first = self.stop = 0
+        self.scanned = 0
+        self.done = False
+        self.error = None
+        self.cancelled = threading.Event()
+        self.results = deque()
+        self.thread = threading.Thread(target=self._run, daemon=True, name="LogSearch")
+
+    def _run(self):
+        try:
+            rows = self.indexer.search(self.query, self.limit)
+            if rows and not self.cancelled.is_set():
+                self.results.append(rows)
+        except sqlite3.Error as e:
+            self.error = str(e)
+        finally:
+            self.done = True
+
+
+class HistorySearchDialog(tk.Toplevel):
+    """Query a LogIndexer and open the file region around a result"""
+
+    CONTEXT_BYTES = 32768
+
+    def __init__(self, parent, indexer):
+        super().__init__(parent)
+        self.indexer = indexer
+        self.results = []
+        self.active_search = None
+        self.search_started = 0.0
+
+        self.title(f"History Search - {indexer.log_path.name}")
+        self.geometry("900x450")
+        self.create_widgets()
+        self.update_status()
+
+    def create_widgets(self):
+        main_frame = ttk.Frame(self, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        query_frame = ttk.Frame(main_frame)
+        query_frame.pack(fill=tk.X, pady=(0, 5))
+        ttk.Label(query_frame, text="Search:").pack(side=tk.LEFT, padx=(0, 5))
+        self.query_var = tk.StringVar()
+        query_entry = ttk.Entry(query_frame, textvariable=self.query_var, width=50)
+        query_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+        query_entry.bind('<Return>', lambda e: self.run_search())
+        query_entry.focus_set()
+        ttk.Button(query_frame, text="Find", command=self.run_search, style='Primary.TButton').pack(side=tk.LEFT)
+
+        tree_frame = ttk.Frame(main_frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True)
+        self.tree = ttk.Treeview(tree_frame, columns=("file", "line", "text"), show="headings")
+        self.tree.heading("file", text="File")
+        self.tree.heading("line", text="Line")
+        self.tree.heading("text", text="Text")
+        self.tree.column("file", width=140, stretch=False)
+        self.tree.column("line", width=70, stretch=False, anchor="e")
+        self.tree.column("text", width=640)
+        tree_scroll = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=tree_scroll.set)
+        tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(fill=tk.BOTH, expand=True)
+        self.tree.bind("<Double-1>", self.open_selected)
+
+        self.status_var = tk.StringVar()
+        ttk.Label(main_frame, textvariable=self.status_var).pack(fill=tk.X, pady=(5, 0))
+
+    def update_status(self, extra=""):
+        state = "indexing" if self.indexer.indexing else "up to date"
+        status = f"{self.indexer.indexed_lines} lines indexed ({state})"
+        if self.indexer.last_error:
+            status += f" - last error: {self.indexer.last_error}"
+        self.status_var.set(f"{extra}  {status}" if extra else status)
+
+    def run_search(self):
+        """Start the query on a worker, poll_search shows the rows"""
+        if self.active_search:
+            self.active_search.cancel()
+        self.search_started = time.perf_counter()
+        self.active_search = IndexSearch(self.indexer, self.query_var.get()).start()
+        self.update_status("Searching...")
+        self.after(50, self.poll_search, self.active_search)
+
+    def poll_search(self, search):
+        if search is not self.active_search:
+            return  # Superseded by a newer query
+        if not search.done:
+            self.after(50, self.poll_search, search)
+            return
+        self.active_search = None
+        elapsed = (time.perf_counter() - self.search_started) * 1000
+        self.results = search.poll()
+        self.tree.delete(*self.tree.get_children())
+        for number, (path, offset, lineno, text) in enumerate(self.results):
+            self.tree.insert("", tk.END, iid=str(number),
+                             values=(Path(path).name, lineno + 1, text[:300]))
+        if search.error:
+            self.master.messages(2, 3, f"Log index search failed: {search.error}")
+            self.update_status(f"Search failed: {search.error}.")
+            return
+        self.update_status(f"{len(self.results)} result(s) in {elapsed:.0f} ms.")
+
+    def open_selected(self, event=None):
+        selection = self.tree.selection()
+        if selection:
+            path, offset, lineno, text = self.results[int(selection[0])]
+            self.show_region(path, offset, lineno)
+
+    def show_region(self, path, offset, lineno):
+        """Open a window with the file content around a byte offset"""
+        try:
+            start = max(0, offset - self.CONTEXT_BYTES)
+            with open(path, 'rb') as f:
+                f.seek(start)
+                data = f.read(offset - start + self.CONTEXT_BYTES)
+        except OSError as e:
+            messagebox.showerror("History Search", f"Cannot read {path}: {e}", parent=self)
+            return
+        if start > 0:
+            # Drop the partial first line
+            cut = data.find(b"\n") + 1
+            data, start = data[cut:], start + cut
+        end = data.rfind(b"\n")
+        if end != -1 and start + end > offset:
+            data = data[:end]
+        target_row = data[:offset - start].count(b"\n") + 1
+        text = data.decode(self.indexer.encoding, errors='replace').replace("\r\n", "\n")
+
+        window = tk.Toplevel(self)
+        window.title(f"{Path(path).name} - line {lineno + 1}")
+        window.geometry("900x500")
+        viewer = scrolledtext.ScrolledText(window, wrap=tk.NONE, font=('IBM Plex Mono Text', 10))
+        viewer.pack(fill=tk.BOTH, expand=True)
+        viewer.insert("1.0", text)
+        viewer.tag_configure("target", background="yellow", foreground="black")
+        viewer.tag_add("target", f"{target_row}.0", f"{target_row}.end")
+        viewer.see(f"{target_row}.0")
+        viewer.config(state=tk.DISABLED)
+
 # ****************************************************************************
 # *************************** Config******************************************
 # ****************************************************************************
@@ -6297,6 +7489,13 @@ class ConfigManager:
         return {
             "log_file": "",
             "initial_lines": 50,
+            "history_lines": 200000,  # Lines kept in the scrollable display history
+            "index_history": False,  # Full-text index the log file and its rotated siblings
+            "pause_buffer_lines": 50000,  # Lines held in memory while paused before spilling to disk
+            "pause_spill_mb": 512,  # Temp file limit for paused lines, newer lines are dropped past it
+            "initial_actions": "summarize",  # Actions for initial lines: run, summarize or suppress
+            "line_scan_kb": 64,  # Filters scan this much at each end of longer lines, unless full_line is set
+            "line_display_chars": 8192,  # Longer lines are shown truncated, click to expand
             "refresh_interval": 100,
             "auto_load_config": True,
             "last_directory": str(Path.home()),
@@ -6304,7 +7503,14 @@ class ConfigManager:
             "advanced_filters_file": "",  # Empty by default
             "recent_filters": [],
             "recent_advanced_filters": [],
-            "verbose": True
+            "verbose": True,
+            "action_queue_size": 32,  # Pending actions per action type
+            "action_max_age": 10.0,  # Seconds before a queued alert is considered stale
+            "action_cooldown": 0.0,  # Default per-filter cooldown in seconds
+            "action_rate_limit": 0,  # Default per-filter actions per minute, 0 = unlimited
+            "sound_cache_size": 32,  # Decoded sounds kept in memory
+            "sound_channels": 8,  # Mixer channels for overlapping alerts
+            "notification_window": 2.0  # Seconds to batch notifications and dialogs, 0 = no batching
         }
     
     def load_config(self):
@@ -6390,6 +7596,203 @@ class ConfigManager:
                 
         return config
 
+# ****************************************************************************
+# *************************** Filter Plan ************************************
+# ****************************************************************************
+
+try:
+    import re._parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
+class FilterPlan:
+    """Compiled, ordered view of every filter evaluated against a line.
+
+    Plugin, simple and advanced filters are compiled once into entries, in
+    that order. Entries carry a prefilter literal that must appear in the
+    line for the entry to match, so most lines never reach the regex engine.
+    Plugin entries are routed to their callbacks through a table built with
+    the plan, not looked up on every line. Rebuild the plan whenever filters
+    or plugins change.
+
+    With a scan_limit, lines longer than twice the limit are only scanned in
+    their first and last scan_limit characters, unless a filter sets
+    full_line.
+
+    Simple and advanced entries report their match spans, found in the same
+    pass that decides the match, so highlighting needs no second scan.
+    """
+
+    KIND_PLUGIN = "plugin"
+    KIND_SIMPLE = "simple"
+    KIND_ADVANCED = "advanced"
+
+    def __init__(self, scan_limit=0):
+        self.scan_limit = scan_limit  # Characters scanned at each end of a long line, 0 = all
+        self.entries = []
+        self.routes = {}  # entry id -> (plugin_filename, filter_id, callback)
+        self.errors = []  # (filter key, message) for filters that failed to compile
+
+    @classmethod
+    def build(cls, simple_filters, advanced_filters, plugin_filters=None,
+              plugin_callbacks=None, loaded_plugins=None, scan_limit=0):
+        """Compile the current filters into a new plan"""
+        plan = cls(scan_limit)
+
+        # Plugin filters go first, they were always dispatched before user filters
+        for plugin_filename, filters in (plugin_filters or {}).items():
+            if loaded_plugins is not None and plugin_filename not in loaded_plugins:
+                continue
+            callback = (plugin_callbacks or {}).get(plugin_filename)
+            if not callback:
+                continue
+            for filter_obj in filters:
+                if not filter_obj.get('regex'):
+                    continue
+                entry = plan._add(cls.KIND_PLUGIN, filter_obj['id'], filter_obj['regex'], None, filter_obj)
+                plan.routes[entry['id']] = (plugin_filename, filter_obj['id'], callback)
+
+        for filter_key, filter_data in simple_filters.items():
+            pattern = filter_data.get('pattern', '')
+            if not pattern:
+                continue
+            regex = None
+            if filter_data.get('is_regex', False):
+                try:
+                    regex = re.compile(pattern)
+                except re.error:
+                    regex = None  # Invalid regex falls back to a substring test
+            entry = plan._add(cls.KIND_SIMPLE, filter_key, regex, None if regex else pattern, filter_data)
+            entry['style'] = (filter_data.get('fg_color', 'black'), filter_data.get('bg_color', 'yellow'))
+
+        for filter_key, filter_data in advanced_filters.items():
+            if not filter_data.get('enabled', True):
+                continue
+            pattern = filter_data.get('generated_regex', '')
+            if not pattern:
+                continue
+            try:
+                regex = re.compile(pattern)
+            except re.error as e:
+                plan.errors.append((filter_key, str(e)))
+                continue
+            entry = plan._add(cls.KIND_ADVANCED, filter_key, regex, None, filter_data)
+            actions = filter_data.get('actions', {})
+            entry['style'] = (actions.get('fg_color', 'black'), actions.get('bg_color', 'yellow'))
+
+        return plan
+
+    def _add(self, kind, key, regex, literal, data):
+        entry = {
+            'id': len(self.entries),
+            'kind': kind,
+            'key': key,
+            'regex': regex,
+            'literal': literal,
+            'prefilter': literal if literal is not None else self.required_literal(regex),
+            'full_line': bool(data.get('full_line', False)),
+            'data': data
+        }
+        self.entries.append(entry)
+        return entry
+
+    @staticmethod
+    def required_literal(regex, min_length=3):
+        """Longest literal run every match of regex must contain, or None"""
+        if regex is None or regex.flags & re.IGNORECASE:
+            return None
+        try:
+            parsed = sre_parse.parse(regex.pattern, regex.flags)
+            state = getattr(parsed, 'state', None) or getattr(parsed, 'pattern', None)
+            if state is not None and state.flags & re.IGNORECASE:
+                return None
+        except Exception:
+            return None
+
+        best, run = "", []
+        for op, av in parsed:
+            if op is sre_parse.LITERAL:
+                run.append(chr(av))
+                continue
+            if len(run) > len(best):
+                best = "".join(run)
+            run = []
+        if len(run) > len(best):
+            best = "".join(run)
+        return best if len(best) >= min_length else None
+
+    def match(self, line, entries=None):
+        """Return (entry, result) for matching entries, in plan order.
+
+        result is the findall() list for plugin entries and a list of
+        (start, end) match spans in line otherwise.
+        """
+        results = []
+        window = line
+        shift = 0  # Added to window positions past the head to map them back into line
+        limit = self.scan_limit
+        if limit and len(line) > 2 * limit:
+            # Bound regex work on huge lines: scan both ends only
+            window = line[:limit] + "\n" + line[-limit:]
+            shift = len(line) - 2 * limit - 1
+        for entry in (self.entries if entries is None else entries):
+            text = line if entry['full_line'] else window
+            prefilter = entry['prefilter']
+            if prefilter is not None and prefilter not in text:
+                continue
+            regex = entry['regex']
+            if entry['kind'] == self.KIND_PLUGIN:
+                found = regex.findall(text)
+                if found:
+                    results.append((entry, found))
+                continue
+            if regex is None:
+                spans = self.literal_spans(text, entry['literal'])
+            else:
+                spans = [m.span() for m in regex.finditer(text) if m.end() > m.start()]
+                if not spans and regex.search(text):
+                    spans = [(0, 0)]  # Matches only the empty string, still a match
+            if spans:
+                if text is window and shift:
+                    spans = [(start + shift, end + shift) if start > limit else (start, min(end, limit))
+                             for start, end in spans]
+                results.append((entry, spans))
+        return results
+
+    @staticmethod
+    def literal_spans(text, literal):
+        spans = []
+        size = len(literal)
+        position = text.find(literal)
+        while position != -1:
+            spans.append((position, position + size))
+            position = text.find(literal, position + size)
+        return spans
+
+    def match_batch(self, lines):
+        """Match many lines at once, returns one result list per line.
+
+        Entries whose prefilter appears nowhere in the batch are dropped
+        before any per-line work.
+        """
+        if not lines:
+            return []
+        block = "\n".join(lines)
+        candidates = [entry for entry in self.entries
+                      if entry['prefilter'] is None or entry['prefilter'] in block]
+        return [self.match(line, candidates) for line in lines]
+
+    def dispatch_plugin_matches(self, results, line, instance_id):
+        """Invoke plugin callbacks for the plugin entries in results"""
+        for entry, found in results:
+            route = self.routes.get(entry['id'])
+            if route:
+                plugin_filename, filter_id, callback = route
+                try:
+                    callback(filter_id, found, line, instance_id)
+                except Exception as e:
+                    print(f"Plugin filter callback error ({plugin_filename}): {e}")
+
 # ****************************************************************************
 # *************************** Action Handler *********************************
 # ****************************************************************************
@@ -6405,38 +7808,558 @@ def get_root_window(self):
         # Fallback to winfo_toplevel
         return self.winfo_toplevel()
 
+class ActionDispatcher:
+    """Run queued actions on one long-lived worker thread per action type.
+
+    A type's worker is started on its first submitted action, so instances
+    that never fire an alert hold no threads. Each action type gets a bounded
+    priority queue. Identical pending actions
+    are coalesced, per-filter cooldowns and rate limits are checked before
+    queueing, the oldest entry is dropped when a queue is full and alerts that
+    waited longer than max_age are discarded instead of played late.
+    """
+
+    def __init__(self, max_pending=32, max_age=10.0, default_cooldown=0.0, default_rate_limit=0):
+        self.max_pending = max(1, int(max_pending))
+        self.max_age = float(max_age)
+        self.default_cooldown = float(default_cooldown)
+        self.default_rate_limit = int(default_rate_limit)  # Actions per minute, 0 = unlimited
+
+        self.lock = threading.Lock()
+        self.handlers = {}  # action_type -> callable(payload)
+        self.queues = {}  # action_type -> heap of [priority, seq, enqueued_at, key, payload]
+        self.pending = {}  # action_type -> {coalesce key: heap entry}
+        self.conditions = {}  # action_type -> Condition sharing self.lock
+        self.workers = {}  # action_type -> Thread
+        self.last_fired = {}  # filter_key -> last accepted timestamp
+        self.fire_history = {}  # filter_key -> deque of accepted timestamps (last 60s)
+        self.sequence = itertools.count()
+        self.running = True
+        self.stats = {'queued': 0, 'coalesced': 0, 'throttled': 0, 'dropped': 0, 'stale': 0, 'executed': 0}
+
+    def register(self, action_type, handler):
+        """Register the handler for an action type, its worker starts on first use"""
+        with self.lock:
+            self.handlers[action_type] = handler
+            self.queues.setdefault(action_type, [])
+            self.pending.setdefault(action_type, {})
+            self.conditions.setdefault(action_type, threading.Condition(self.lock))
+
+    def _ensure_worker(self, action_type):
+        """Start the worker for an action type if needed, caller holds the lock"""
+        if action_type not in self.workers:
+            worker = threading.Thread(target=self._worker_loop, args=(action_type,),
+                                      name=f"ETailAction-{action_type}", daemon=True)
+            self.workers[action_type] = worker
+            worker.start()
+
+    def submit(self, action_type, payload, filter_key=None, priority=5, cooldown=None, rate_limit=None):
+        """Queue an action, returns False if it was throttled or not handled"""
+        now = time.time()
+        coalesce_key = (filter_key, repr(payload))
+        with self.lock:
+            if not self.running or action_type not in self.handlers:
+                return False
+
+            queue = self.queues[action_type]
+            pending = self.pending[action_type]
+
+            # An identical action is already waiting, refresh it instead of queueing again
+            entry = pending.get(coalesce_key)
+            if entry is not None:
+                entry[2] = now
+                self.stats['coalesced'] += 1
+                return True
+
+            if not self._allow(filter_key, now, cooldown, rate_limit):
+                self.stats['throttled'] += 1
+                return False
+
+            # Full queue: drop the oldest pending alert to make room
+            if len(queue) >= self.max_pending:
+                oldest = min(queue, key=lambda item: item[2])
+                queue.remove(oldest)
+                heapq.heapify(queue)
+                pending.pop(oldest[3], None)
+                self.stats['dropped'] += 1
+
+            entry = [priority, next(self.sequence), now, coalesce_key, payload]
+            heapq.heappush(queue, entry)
+            pending[coalesce_key] = entry
+            self.stats['queued'] += 1
+            self._ensure_worker(action_type)
+            self.conditions[action_type].notify()
+            return True
+
+    def _allow(self, filter_key, now, cooldown, rate_limit):
+        """Apply per-filter cooldown and rate limit, caller holds the lock"""
+        if filter_key is None:
+            return True
+
+        cooldown = self.default_cooldown if cooldown in (None, "") else float(cooldown)
+        rate_limit = self.default_rate_limit if rate_limit in (None, "") else int(rate_limit)
+
+        if cooldown > 0 and now - self.last_fired.get(filter_key, 0) < cooldown:
+            return False
+
+        if rate_limit > 0:
+            history = self.fire_history.setdefault(filter_key, deque())
+            while history and now - history[0] >= 60:
+                history.popleft()
+            if len(history) >= rate_limit:
+                return False
+            history.append(now)
+
+        self.last_fired[filter_key] = now
+        return True
+
+    def _worker_loop(self, action_type):
+        """Drain one action type's queue, running its handler sequentially"""
+        condition = self.conditions[action_type]
+        queue = self.queues[action_type]
+        while True:
+            with condition:
+                while self.running and not queue:
+                    condition.wait()
+                if not self.running:
+                    return
+                priority, seq, enqueued_at, coalesce_key, payload = heapq.heappop(queue)
+                self.pending[action_type].pop(coalesce_key, None)
+                handler = self.handlers.get(action_type)
+
+            if self.max_age > 0 and time.time() - enqueued_at > self.max_age:
+                with self.lock:
+                    self.stats['stale'] += 1
+                continue
+
+            try:
+                handler(payload)
+                with self.lock:
+                    self.stats['executed'] += 1
+            except Exception as e:
+                print(f"Action worker error ({action_type}): {e}")
+
+    def clear(self, action_type=None):
+        """Discard pending actions for one or all action types"""
+        with self.lock:
+            for name in ([action_type] if action_type else list(self.queues.keys())):
+                if name in self.queues:
+                    self.stats['dropped'] += len(self.queues[name])
+                    self.queues[name].clear()
+                    self.pending[name].clear()
+
+    def shutdown(self):
+        """Stop all workers, pending actions are discarded"""
+        with self.lock:
+            self.running = False
+            for name in self.queues:
+                self.queues[name].clear()
+                self.pending[name].clear()
+            for condition in self.conditions.values():
+                condition.notify_all()
+
+    def get_stats(self):
+        """Return dispatcher counters and current queue depths"""
+        with self.lock:
+            stats = dict(self.stats)
+            stats['pending'] = {name: len(queue) for name, queue in self.queues.items()}
+        return stats
+
+class TTSService:
+    """Process-wide text-to-speech service shared by every instance.
+
+    The pyttsx3 engine is created and used only on the service thread, which
+    consumes an utterance queue. Voices are switched with setProperty between
+    utterances, identical queued utterances are merged and utterances that
+    waited longer than max_age are cancelled. Use get_instance() to obtain the
+    shared service, it is started on first use without waiting for the engine;
+    `ready` is set once the engine and its voice list are loaded.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls):
+        """Return the shared service, starting it on first use"""
+        with cls._instance_lock:
+            if cls._instance is None or not cls._instance.thread.is_alive():
+                cls._instance = cls()
+            return cls._instance
+
+    @classmethod
+    def shutdown_instance(cls):
+        """Stop the shared service if it was started"""
+        with cls._instance_lock:
+            if cls._instance is not None:
+                cls._instance.shutdown()
+                cls._instance = None
+
+    def __init__(self, rate=150, volume=0.8, max_pending=16, max_age=10.0):
+        self.rate = rate
+        self.volume = volume
+        self.max_pending = max_pending
+        self.max_age = max_age
+        self.condition = threading.Condition()
+        self.queue = deque()  # Queued utterances
+        self.running = True
+        self.engine_available = False
+        self.default_voice = None
+        self.current_voice = None
+        self.voices = []  # Read once at engine start, runAndWait blocks later queries
+        self.stats = {'spoken': 0, 'deduplicated': 0, 'cancelled': 0, 'errors': 0}
+
+        self.ready = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="ETailTTS", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        """Service thread: own the engine and speak queued utterances"""
+        engine = None
+        try:
+            engine = pyttsx3.init()
+            engine.setProperty('rate', self.rate)
+            engine.setProperty('volume', self.volume)
+            self.default_voice = engine.getProperty('voice')
+            self.current_voice = self.default_voice
+            self.voices = list(engine.getProperty('voices') or [])
+            self.engine_available = True
+            print("TTS service started")
+        except Exception as e:
+            print(f"TTS initialization failed: {e}")
+        finally:
+            self.ready.set()
+
+        while True:
+            with self.condition:
+                while self.running and not self.queue:
+                    self.condition.wait()
+                if not self.running:
+                    break
+                item = self.queue.popleft()
+
+            if not engine:
+                continue
+            if self.max_age > 0 and time.time() - item['queued_at'] > self.max_age:
+                self.stats['cancelled'] += 1
+                continue
+
+            try:
+                voice = item['voice'] or self.default_voice
+                if voice and voice != self.current_voice:
+                    engine.setProperty('voice', voice)
+                    self.current_voice = voice
+                engine.say(item['text'])
+                engine.runAndWait()
+                self.stats['spoken'] += 1
+            except Exception as e:
+                self.stats['errors'] += 1
+                print(f"TTS error: {e} text: {item['text']}")
+
+        if engine:
+            try:
+                engine.stop()
+            except Exception:
+                pass
+
+    def speak(self, text, voice=None):
+        """Queue an utterance, returns False if it duplicates a queued one"""
+        if not text:
+            return False
+        with self.condition:
+            for item in self.queue:
+                if item['kind'] == 'say' and item['text'] == text and item['voice'] == voice:
+                    item['queued_at'] = time.time()
+                    self.stats['deduplicated'] += 1
+                    return False
+
+            utterances = [item for item in self.queue if item['kind'] == 'say']
+            if len(utterances) >= self.max_pending:
+                self.queue.remove(utterances[0])
+                self.stats['cancelled'] += 1
+
+            self.queue.append({'kind': 'say', 'text': text, 'voice': voice, 'queued_at': time.time()})
+            self.condition.notify()
+        return True
+
+    def get_voices(self):
+        """Return the engine's voice objects, empty until the service is ready"""
+        return list(self.voices)
+
+    def cancel_stale(self, max_age=None):
+        """Drop queued utterances older than max_age seconds"""
+        max_age = self.max_age if max_age is None else max_age
+        now = time.time()
+        with self.condition:
+            keep = deque(item for item in self.queue
+                         if item['kind'] != 'say' or now - item['queued_at'] <= max_age)
+            self.stats['cancelled'] += len(self.queue) - len(keep)
+            self.queue = keep
+
+    def cancel_all(self):
+        """Drop every queued utterance"""
+        with self.condition:
+            keep = deque(item for item in self.queue if item['kind'] != 'say')
+            self.stats['cancelled'] += len(self.queue) - len(keep)
+            self.queue = keep
+
+    def shutdown(self):
+        """Stop the service thread"""
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+
+class SoundCache:
+    """Process-wide LRU cache of decoded pygame Sounds.
+
+    Entries are keyed by absolute path and mtime, so editing a sound file on
+    disk is picked up on its next use. Sounds play on a pool of mixer
+    channels, overlapping alerts mix instead of cutting each other off.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls, max_entries=32, channels=8):
+        """Return the shared cache, creating it on first use"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(max_entries, channels)
+            return cls._instance
+
+    def __init__(self, max_entries=32, channels=8):
+        self.max_entries = max(1, int(max_entries))
+        self.channels = max(1, int(channels))
+        self.cache = OrderedDict()  # (path, mtime) -> pygame.mixer.Sound
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'fallbacks': 0}
+        try:
+            pygame.mixer.set_num_channels(self.channels)
+        except Exception as e:
+            print(f"Could not set mixer channels: {e}")
+
+    def get(self, sound_file):
+        """Return the decoded Sound for a file, loading it on a miss"""
+        try:
+            path = os.path.abspath(sound_file)
+            key = (path, os.path.getmtime(path))
+        except OSError:
+            return None
+
+        with self.lock:
+            sound = self.cache.get(key)
+            if sound is not None:
+                self.cache.move_to_end(key)
+                self.stats['hits'] += 1
+                return sound
+            self.stats['misses'] += 1
+
+        # Decode outside the lock, other sounds keep playing meanwhile
+        sound = pygame.mixer.Sound(path)
+
+        with self.lock:
+            # Forget older versions of a file that changed on disk
+            for old_key in [k for k in self.cache if k[0] == path]:
+                del self.cache[old_key]
+            self.cache[key] = sound
+            while len(self.cache) > self.max_entries:
+                self.cache.popitem(last=False)
+                self.stats['evictions'] += 1
+        return sound
+
+    def preload(self, sound_files):
+        """Decode every existing file in sound_files into the cache"""
+        loaded = 0
+        for sound_file in sound_files:
+            if not sound_file or not os.path.exists(sound_file):
+                continue
+            try:
+                if self.get(sound_file) is not None:
+                    loaded += 1
+            except Exception as e:
+                print(f"Could not preload sound {sound_file}: {e}")
+        return loaded
+
+    def play(self, sound_file):
+        """Play a file on a free mixer channel, returns False if not found"""
+        try:
+            sound = self.get(sound_file)
+        except Exception as e:
+            # Formats Sound can't decode still play through the music stream
+            print(f"Sound decode failed, streaming instead: {e}")
+            self.stats['fallbacks'] += 1
+            pygame.mixer.music.load(sound_file)
+            pygame.mixer.music.play()
+            return True
+
+        if sound is None:
+            return False
+
+        # find_channel(True) reuses the longest-playing channel when all are busy
+        channel = pygame.mixer.find_channel(True)
+        if channel:
+            channel.play(sound)
+        else:
+            sound.play()
+        return True
+
+class NotificationBatcher:
+    """Collect notifications and dialogs per filter and emit one summary per window.
+
+    The first alert of a group opens that group's window of `window` seconds.
+    When it closes a single summary with the match count and latest line is
+    emitted. Dialog groups are shown one at a time: the next waits, still
+    counting, until the emitter reports the open dialog closed with
+    dialog_closed(). on_change(pending) is called whenever the pending alert
+    count changes.
+    """
+
+    def __init__(self, root, window, emit, on_change=None):
+        self.root = root
+        self.window = float(window)
+        self.emit = emit  # emit(kind, message)
+        self.on_change = on_change
+        self.lock = threading.Lock()
+        self.groups = OrderedDict()  # (kind, key) -> group dict
+        self.flush_scheduled = False  # A flush timer is pending
+        self.dialog_open = False
+
+    def add(self, kind, key, message, line=""):
+        """Record an alert, emitting now when batching is disabled"""
+        if self.window <= 0 or not hasattr(self.root, 'after'):
+            self.emit(kind, message)
+            return
+
+        with self.lock:
+            group = self.groups.get((kind, key))
+            if group is None:
+                group = {'message': message, 'count': 0, 'line': "", 'first': time.time()}
+                self.groups[(kind, key)] = group
+            group['count'] += 1
+            group['message'] = message
+            group['line'] = line
+            schedule = not self.flush_scheduled
+            self.flush_scheduled = True
+            pending = self._pending_locked()
+
+        if schedule:
+            self.root.after(int(self.window * 1000), self.flush)
+        self._changed(pending)
+
+    def flush(self):
+        """Timer callback, runs on the Tk thread"""
+        with self.lock:
+            self.flush_scheduled = False
+        self._emit_ready()
+
+    def dialog_closed(self):
+        """Called by the emitter once a dialog is closed, shows the next queued one"""
+        with self.lock:
+            self.dialog_open = False
+        self._emit_ready()
+
+    def _emit_ready(self):
+        """Emit one summary per group whose window has elapsed and rearm the timer"""
+        ready = []
+        now = time.time()
+        with self.lock:
+            for group_key, group in list(self.groups.items()):
+                # Small slack so a timer firing a few ms early does not wait a whole window
+                if now - group['first'] < self.window - 0.05:
+                    continue
+                if group_key[0] == "dialog":
+                    if self.dialog_open:
+                        continue  # Queued until the open dialog is closed
+                    self.dialog_open = True
+                ready.append((group_key[0], group, now))
+                del self.groups[group_key]
+
+            # Next window to close; queued dialogs are released by dialog_closed
+            due = [group['first'] + self.window for group_key, group in self.groups.items()
+                   if not (group_key[0] == "dialog" and self.dialog_open)]
+            delay = None
+            if due and not self.flush_scheduled:
+                delay = max(0, int((min(due) - now) * 1000))
+                self.flush_scheduled = True
+            pending = self._pending_locked()
+
+        if delay is not None:
+            self.root.after(delay, self.flush)
+        self._changed(pending)
+
+        for kind, group, closed in ready:
+            self.emit(kind, self.summarize(group, closed))
+
+    def summarize(self, group, closed=None):
+        """Build the text shown for a batched group"""
+        if group['count'] == 1:
+            return group['message']
+        # Dialog groups can stay open past their window while an earlier dialog is shown
+        elapsed = max(self.window, (closed or time.time()) - group['first'])
+        summary = f"{group['count']} matches for '{group['message']}' in the last {round(elapsed, 1):g}s"
+        if group['line']:
+            summary += f"\nLatest: {group['line']}"
+        return summary
+
+    def pending_count(self):
+        with self.lock:
+            return self._pending_locked()
+
+    def _pending_locked(self):
+        return sum(group['count'] for group in self.groups.values())
+
+    def _changed(self, pending):
+        if self.on_change:
+            try:
+                self.on_change(pending)
+            except Exception as e:
+                print(f"Pending alerts callback failed: {e}")
+
 class ActionHandler:
-    def __init__(self, root):
+    def __init__(self, root, config_manager=None):
         self.root = root
-        self.tts_engine = None
+        self._tts_service = None
         self.pygame_initialized = False
-        self.init_tts()
         self.init_sound()
-    
-    def init_tts(self):
-        """Initialize text-to-speech engine with better error handling"""
-        try:
-            self.tts_engine = pyttsx3.init()
-            if self.tts_engine:
-                # Set speech properties
-                self.tts_engine.setProperty('rate', 150)
-                self.tts_engine.setProperty('volume', 0.8)
-            else:
-                print("TTS engine initialization returned None")
-        except Exception as e:
-            print(f"TTS initialization failed: {e}")
-            self.tts_engine = None
+
+        # Sound and TTS run on dispatcher workers instead of a thread per alert
+        get = config_manager.get if config_manager else (lambda key, default=None: default)
+        self.dispatcher = ActionDispatcher(
+            max_pending=get("action_queue_size", 32),
+            max_age=get("action_max_age", 10.0),
+            default_cooldown=get("action_cooldown", 0.0),
+            default_rate_limit=get("action_rate_limit", 0)
+        )
+        self.dispatcher.register("sound", self._play_sound_now)
+        self.dispatcher.register("tts", self._speak_now)
+        self.dispatcher.register("sound_preload", self._preload_sounds_now)
+        self.dispatcher.register("notification", self._show_notification_now)
+
+        # Bursts of notifications and dialogs collapse into one summary per window
+        self.notification_batcher = NotificationBatcher(
+            root, get("notification_window", 2.0), self._emit_batched
+        )
+
+        self.sound_cache = SoundCache.get_instance(
+            get("sound_cache_size", 32),
+            get("sound_channels", 8)
+        ) if self.pygame_initialized else None
+
+    @property
+    def tts_service(self):
+        """Handle to the shared TTS service, started on first use"""
+        if self._tts_service is None:
+            self._tts_service = TTSService.get_instance()
+        return self._tts_service
 
     def get_available_voices(self):
         """Get available voices from pyttsx3 and return formatted list"""
         #"HKEY_LOCAL_MACHINE\\SOFTWARE\\Microsoft\\Speech_OneCore\\Voices\\Tokens\\MSTTS_V110_enGB_SusanM" not listed
         try:
-            if not self.tts_engine:
-                print(f"Error init the engine:")
-                self.init_tts()
-            voices = self.tts_engine.getProperty('voices')
+            voices = self.tts_service.get_voices()
             if not voices:
-                self.messages(2, 3, "No TTS voices available")
+                print("No TTS voices available")
 
             voice_list = []
             for i, voice in enumerate(voices):
@@ -6458,65 +8381,81 @@ class ActionHandler:
             return []
 
     def init_sound(self):
-        """Initialize pygame mixer for sound playback"""
+        """Initialize pygame mixer for sound playback, shared by all instances"""
         try:
-            pygame.mixer.init()
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
             self.pygame_initialized = True
         except Exception as e:
             print(f"Sound initialization failed: {e}")
             self.pygame_initialized = False
     
-    def execute_action(self, action, modifier, line_content=""):
-        """Execute the specified action with the modifier"""
+    def execute_action(self, action, modifier, line_content="", filter_key=None, limits=None):
+        """Execute the specified action with the modifier
+
+        filter_key identifies the originating filter for cooldowns, rate limits
+        and coalescing. limits is the filter's own dict holding optional
+        'cooldown', 'rate_limit' and 'priority' overrides.
+        """
+        limits = limits or {}
         try:
             if action == "sound" and modifier:
-                self.play_sound(modifier)
+                self.play_sound(modifier, filter_key, limits)
             elif action == "tts":
-                self.speak_text(modifier[0],modifier[1])
+                self.speak_text(modifier[0], modifier[1], filter_key, limits)
             elif action == "skip":
                 return True  # Signal to skip this line
             elif action == "notification" and modifier:
-                self.show_notification(modifier)
+                self.show_notification(modifier, line_content, filter_key)
             elif action == "dialog" and modifier:
-                self.show_dialog(modifier)
+                self.show_dialog(modifier, line_content, filter_key)
             return False
         except Exception as e:
             print(f"Action execution error: {e}")
             return False
     
-    def play_sound(self, sound_file):
-        """Play a sound file in a separate thread"""
-        def _play_sound():
-            try:
-                if self.pygame_initialized and os.path.exists(sound_file):
-                    pygame.mixer.music.load(sound_file)
-                    pygame.mixer.music.play()
-                else:
-                    print(f"Sound file not found or sound system not available: {sound_file}")
-            except Exception as e:
-                print(f"Error playing sound: {e}")
-        
-        sound_thread = threading.Thread(target=_play_sound, daemon=True)
-        sound_thread.start()
-    
-    def speak_text(self, text, voice):
-        """Speak text using TTS in a separate thread"""
-        def _speak():
-            try:
-                if self.tts_engine:
-                    self.tts_engine.startLoop(False)
-                    if self.tts_engine._inLoop:
-                        self.tts_engine.endLoop()
-                    self.tts_engine.setProperty('voice', voice)
-                    self.tts_engine.say(text)
-                    self.tts_engine.runAndWait()
-            except Exception as e:
-                print(f"TTS error: {e} filter: {text}")
-        tts_thread = threading.Thread(target=_speak, daemon=True)
-        tts_thread.start()
-    
-    def show_notification(self, message):
-        """Show a system notification using plyer"""
+    def play_sound(self, sound_file, filter_key=None, limits=None):
+        """Queue a sound file on the sound worker"""
+        limits = limits or {}
+        self.dispatcher.submit("sound", sound_file, filter_key,
+                               priority=limits.get('priority', 5),
+                               cooldown=limits.get('cooldown'),
+                               rate_limit=limits.get('rate_limit'))
+
+    def _play_sound_now(self, sound_file):
+        """Play a cached sound on a free channel, runs on the sound worker"""
+        if not self.sound_cache or not self.sound_cache.play(sound_file):
+            print(f"Sound file not found or sound system not available: {sound_file}")
+
+    def preload_sounds(self, sound_files):
+        """Decode sound files into the cache in the background"""
+        if self.sound_cache:
+            self.dispatcher.submit("sound_preload", tuple(sorted(set(sound_files))))
+
+    def _preload_sounds_now(self, sound_files):
+        """Fill the sound cache, runs on the preload worker"""
+        loaded = self.sound_cache.preload(sound_files)
+        print(f"Preloaded {loaded} of {len(sound_files)} filter sounds")
+    
+    def speak_text(self, text, voice, filter_key=None, limits=None):
+        """Queue text on the TTS worker"""
+        limits = limits or {}
+        self.dispatcher.submit("tts", (text, voice), filter_key,
+                               priority=limits.get('priority', 5),
+                               cooldown=limits.get('cooldown'),
+                               rate_limit=limits.get('rate_limit'))
+
+    def _speak_now(self, payload):
+        """Hand text to the shared TTS service, runs on the TTS worker"""
+        text, voice = payload
+        self.tts_service.speak(text, voice or None)
+    
+    def show_notification(self, message, line_content="", filter_key=None):
+        """Queue a system notification, batched per filter"""
+        self.notification_batcher.add("notification", filter_key or message, message, line_content)
+
+    def _show_notification_now(self, message):
+        """Show a system notification using plyer, runs on the notification worker"""
         try:
             if HAS_SYSTEM_NOTIFICATIONS:
                 notification.notify(
@@ -6540,34 +8479,703 @@ class ActionHandler:
                         messagebox.showinfo("ETail Notification", message)
         except Exception as e:
             print(f"Etail Says - System notification failed: {e}")
-            # Fallback
+            # Fallback, handed to the Tk thread since this runs on a worker
             try:
-                messagebox.showinfo("ETail Notification", message)
+                self.root.after(0, lambda: messagebox.showinfo("ETail Notification", message))
             except:
                 pass
     
-    def show_dialog(self, message):
+    def show_dialog(self, message, line_content="", filter_key=None):
+        """Queue a dialog window, batched per filter"""
+        self.notification_batcher.add("dialog", filter_key or message, message, line_content)
+
+    def _emit_batched(self, kind, message):
+        """Deliver a batched alert summary"""
+        if kind == "dialog":
+            self._show_dialog_now(message)
+        else:
+            self.dispatcher.submit("notification", message)
+
+    def _show_dialog_now(self, message):
         """Show a dialog window"""
         try:
             root_window = self.root
             if hasattr(root_window, 'after'):
-                root_window.after(0, lambda: messagebox.showwarning("ETail Alert", message))
+                root_window.after(0, lambda: self._run_dialog(message))
             else:
                 messagebox.showwarning("ETail Alert", message)
         except Exception as e:
             print(f"Error showing dialog: {e}")
+            self.notification_batcher.dialog_closed()
+
+    def _run_dialog(self, message):
+        """Show the dialog, the next queued dialog batch follows once it is closed"""
+        try:
+            messagebox.showwarning("ETail Alert", message)
+        finally:
+            self.notification_batcher.dialog_closed()
 
 # ****************************************************************************
 # *************************** SERVER *****************************************
 # ****************************************************************************
 
+class RollingWindow:
+    """Per-second buckets over the last `seconds` seconds.
+
+    Adding is O(1): a bucket is cleared when its slot in the ring is reused
+    for a new second. Each bucket holds `width` values, so a row can be a
+    histogram.
+    """
+
+    def __init__(self, seconds=60, width=1):
+        self.seconds = seconds
+        self.width = width
+        self.stamps = array.array('q', [-1]) * seconds
+        self.values = array.array('d', [0.0]) * (seconds * width)
+
+    def add(self, now, value, slot=0):
+        second = int(now)
+        index = second % self.seconds
+        if self.stamps[index] != second:
+            self.stamps[index] = second
+            base = index * self.width
+            for position in range(base, base + self.width):
+                self.values[position] = 0.0
+        self.values[index * self.width + slot] += value
+
+    def totals(self, now, span):
+        """Sums per slot over the last span complete seconds"""
+        second = int(now)
+        sums = [0.0] * self.width
+        for past in range(second - min(span, self.seconds - 1), second):
+            index = past % self.seconds
+            if self.stamps[index] == past:
+                base = index * self.width
+                for slot in range(self.width):
+                    sums[slot] += self.values[base + slot]
+        return sums
+
+
+class ServerMetrics:
+    """Counters, rolling rates and ingest latency of a LogServer.
+
+    Updated from the server's event loop thread once per read, and from
+    the owning instance for latency; read by the UI through snapshot().
+    Clients are keyed by peer address so reconnects add up.
+    """
+
+    LATENCY_BOUNDS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+    MAX_CLIENTS = 1024
+
+    def __init__(self, window=60):
+        self.window = window
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.lines = RollingWindow(window)
+        self.bytes = RollingWindow(window)
+        self.latency = RollingWindow(window, len(self.LATENCY_BOUNDS_MS) + 1)
+        self.totals = {'lines': 0, 'bytes': 0, 'errors': 0, 'connections': 0, 'dropped': 0,
+                       'rejected': 0, 'throttled': 0, 'backpressure': 0}
+        self.clients = {}
+
+    def client(self, host):
+        """Counters of a client, created on first use (call with the lock held)"""
+        stats = self.clients.get(host)
+        if stats is None:
+            if len(self.clients) >= self.MAX_CLIENTS:
+                # Forget the longest idle disconnected client
+                idle = [key for key, value in self.clients.items() if not value['active']]
+                if idle:
+                    del self.clients[min(idle, key=lambda key: self.clients[key]['last_seen'])]
+            stats = self.clients[host] = {'lines': 0, 'bytes': 0, 'errors': 0, 'connections': 0,
+                                          'rejected': 0, 'throttled': 0, 'active': 0, 'last_seen': time.time(),
+                                          'rate': RollingWindow(self.window)}
+        return stats
+
+    def connected(self, host):
+        with self.lock:
+            stats = self.client(host)
+            stats['connections'] += 1
+            stats['active'] += 1
+            stats['last_seen'] = time.time()
+            self.totals['connections'] += 1
+
+    def disconnected(self, host):
+        with self.lock:
+            stats = self.client(host)
+            stats['active'] = max(0, stats['active'] - 1)
+
+    def error(self, host, count=1):
+        with self.lock:
+            self.client(host)['errors'] += count
+            self.totals['errors'] += count
+
+    def rejected(self, host):
+        """Connection refused by admission control"""
+        with self.lock:
+            self.client(host)['rejected'] += 1
+            self.totals['rejected'] += 1
+
+    def throttled(self, host):
+        """Client paused for exceeding its line rate"""
+        with self.lock:
+            self.client(host)['throttled'] += 1
+            self.totals['throttled'] += 1
+
+    def backpressure(self):
+        """A connection paused because the downstream queue is full"""
+        with self.lock:
+            self.totals['backpressure'] += 1
+
+    def dropped(self, count=1):
+        """Received data discarded before delivery"""
+        with self.lock:
+            self.totals['dropped'] += count
+
+    def record(self, host, lines, nbytes):
+        """Lines and wire bytes received in one read"""
+        now = time.time()
+        with self.lock:
+            stats = self.client(host)
+            stats['lines'] += lines
+            stats['bytes'] += nbytes
+            stats['last_seen'] = now
+            stats['rate'].add(now, lines)
+            self.totals['lines'] += lines
+            self.totals['bytes'] += nbytes
+            self.lines.add(now, lines)
+            self.bytes.add(now, nbytes)
+
+    def record_latencies(self, latencies):
+        """Seconds between receiving lines and the instance processing them"""
+        now = time.time()
+        bounds = self.LATENCY_BOUNDS_MS
+        with self.lock:
+            for seconds in latencies:
+                self.latency.add(now, 1, bisect.bisect_left(bounds, seconds * 1000))
+
+    def percentile(self, counts, fraction):
+        """Upper bound in ms of the bucket holding the given fraction, None without data"""
+        total = sum(counts)
+        if not total:
+            return None
+        running = 0
+        for slot, count in enumerate(counts):
+            running += count
+            if running >= total * fraction:
+                return self.LATENCY_BOUNDS_MS[slot] if slot < len(self.LATENCY_BOUNDS_MS) else float('inf')
+        return float('inf')
+
+    def snapshot(self, span=10):
+        """Totals, rates over the last span seconds and per-client rows, busiest first"""
+        now = time.time()
+        with self.lock:
+            latency = self.latency.totals(now, span)
+            clients = [{'client': host,
+                        'active': stats['active'],
+                        'lines': stats['lines'],
+                        'bytes': stats['bytes'],
+                        'errors': stats['errors'],
+                        'reconnects': max(0, stats['connections'] - 1),
+                        'rejected': stats['rejected'],
+                        'throttled': stats['throttled'],
+                        'last_seen': stats['last_seen'],
+                        'lines_per_s': stats['rate'].totals(now, span)[0] / span}
+                       for host, stats in self.clients.items()]
+            snapshot = dict(self.totals)
+            snapshot.update(
+                uptime=now - self.started,
+                lines_per_s=self.lines.totals(now, span)[0] / span,
+                bytes_per_s=self.bytes.totals(now, span)[0] / span,
+                latency_p50_ms=self.percentile(latency, 0.5),
+                latency_p99_ms=self.percentile(latency, 0.99),
+                active_clients=sum(1 for row in clients if row['active']))
+        clients.sort(key=lambda row: row['lines_per_s'], reverse=True)
+        snapshot['clients'] = clients
+        return snapshot
+
+    @staticmethod
+    def format_summary(snapshot):
+        """One line for the metrics stream and the Server panel"""
+        def latency(value):
+            return "-" if value is None else f"{value:g}"
+        text = (f"clients={snapshot['active_clients']} lines/s={snapshot['lines_per_s']:.1f} "
+                f"KB/s={snapshot['bytes_per_s'] / 1024:.1f} lines={snapshot['lines']} errors={snapshot['errors']} "
+                f"dropped={snapshot['dropped']} rejected={snapshot['rejected']} throttled={snapshot['throttled']} "
+                f"latency_ms p50<={latency(snapshot['latency_p50_ms'])} p99<={latency(snapshot['latency_p99_ms'])} "
+                f"queue={snapshot.get('queue_depth', 0)}")
+        if snapshot['clients'] and snapshot['clients'][0]['lines_per_s']:
+            top = snapshot['clients'][0]
+            text += f" top={top['client']}({top['lines_per_s']:.1f}/s)"
+        return text
+
+class TokenBucket:
+    """Refilling allowance of `rate` units per second, holding at most `capacity`"""
+
+    __slots__ = ('rate', 'capacity', 'tokens', 'stamp')
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.stamp = time.monotonic()
+
+    def take(self, amount, now=None):
+        """Spend amount, possibly going into debt; returns seconds until out of debt"""
+        now = time.monotonic() if now is None else now
+        self.tokens = min(self.capacity, self.tokens + (now - self.stamp) * self.rate)
+        self.stamp = now
+        self.tokens -= amount
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+
+class AdmissionControl:
+    """Connection admission and flow control of a LogServer.
+
+    Runs on the server's event loop thread. New connections are refused
+    over the server or per-host limits, or when a host reconnects faster
+    than its connect bucket allows. Lines read from each host are charged
+    to a token bucket; a host in debt has its connections paused until
+    the debt is repaid, so the client is slowed by TCP backpressure (and
+    v1 echoes and v2 acks come later) instead of losing lines. When the
+    lines queued downstream pass queue_high, every connection is paused
+    until they fall below queue_low.
+    """
+
+    def __init__(self, server, max_clients=1024, max_per_host=64, connect_rate=10.0, connect_burst=20,
+                 line_rate=50000.0, line_burst=100000, queue_high=200000, queue_low=100000):
+        self.server = server
+        self.max_clients = max_clients
+        self.max_per_host = max_per_host
+        self.connect_rate = connect_rate
+        self.connect_burst = connect_burst
+        self.line_rate = line_rate
+        self.line_burst = line_burst
+        self.queue_high = queue_high
+        self.queue_low = queue_low
+        self.active = {}  # Host -> open connections
+        self.connect_buckets = {}
+        self.line_buckets = {}
+        self.queue_paused = set()  # Connections waiting for the downstream queue to drain
+        self.queue_timer = None
+
+    def admit(self, host):
+        """None when a new connection from host may proceed, else the reason to refuse it"""
+        if len(self.server.connections) >= self.max_clients:
+            return f"connection limit ({self.max_clients}) reached"
+        if self.max_per_host and self.active.get(host, 0) >= self.max_per_host:
+            return f"per-client connection limit ({self.max_per_host}) reached"
+        if self.connect_rate:
+            bucket = self.connect_buckets.get(host)
+            if bucket is None:
+                bucket = self.connect_buckets[host] = TokenBucket(self.connect_rate, self.connect_burst)
+            if bucket.take(1):
+                bucket.tokens += 1  # Refused attempts are not charged
+                return "reconnecting too fast"
+        return None
+
+    def opened(self, host):
+        self.active[host] = self.active.get(host, 0) + 1
+
+    def closed(self, connection):
+        host = connection.host
+        count = self.active.get(host, 0) - 1
+        if count > 0:
+            self.active[host] = count
+        else:
+            self.active.pop(host, None)
+        self.queue_paused.discard(connection)
+        # Buckets outlive connections so reconnecting does not refill them
+        if len(self.line_buckets) > 4096 or len(self.connect_buckets) > 4096:
+            for buckets in (self.line_buckets, self.connect_buckets):
+                for key in [key for key in buckets if key not in self.active]:
+                    del buckets[key]
+
+    def queue_depth(self):
+        depth = self.server.sink_depth() if self.server.sink_depth is not None else 0
+        if self.server.writer is not None:
+            depth += len(self.server.writer.pending)
+        return depth
+
+    def overloaded(self):
+        return self.queue_high > 0 and self.queue_depth() >= self.queue_high
+
+    def after_read(self, connection, lines):
+        """Charge the lines of one read, pausing the connection when over budget"""
+        if not lines or connection.reading_paused:
+            return
+        if self.line_rate:
+            bucket = self.line_buckets.get(connection.host)
+            if bucket is None:
+                bucket = self.line_buckets[connection.host] = TokenBucket(self.line_rate, self.line_burst)
+            wait = bucket.take(lines)
+            if wait:
+                self.server.metrics.throttled(connection.host)
+                self._pause(connection)
+                self.server.loop.call_later(min(wait, 5.0), self._resume, connection)
+                return
+        if self.overloaded():
+            self.server.metrics.backpressure()
+            self._pause(connection)
+            self._wait_for_queue(connection)
+
+    def _pause(self, connection):
+        connection.reading_paused = True
+        connection.transport.pause_reading()
+
+    def _resume(self, connection):
+        if connection.transport.is_closing():
+            return
+        if self.overloaded():
+            self._wait_for_queue(connection)
+            return
+        connection.reading_paused = False
+        connection.transport.resume_reading()
+
+    def _wait_for_queue(self, connection):
+        self.queue_paused.add(connection)
+        if self.queue_timer is None:
+            self.queue_timer = self.server.loop.call_later(0.05, self._check_queue)
+
+    def _check_queue(self):
+        """Resume connections paused for the downstream queue once it is below queue_low"""
+        self.queue_timer = None
+        if self.queue_depth() > self.queue_low:
+            self.queue_timer = self.server.loop.call_later(0.05, self._check_queue)
+            return
+        paused, self.queue_paused = self.queue_paused, set()
+        for connection in paused:
+            if not connection.transport.is_closing():
+                connection.reading_paused = False
+                connection.transport.resume_reading()
+
+class ServerLogWriter:
+    """Group-commit writer for the server log file.
+
+    Lines from every client connection are appended to one in-memory batch
+    in arrival order; a single thread owns the open file and writes the
+    batch when it reaches flush_bytes or flush_interval has passed.
+
+    fsync policy: "none" leaves syncing to the OS, "interval" syncs at most
+    every fsync_interval seconds, "batch" syncs after every written batch.
+    """
+
+    FSYNC_POLICIES = ("none", "interval", "batch")
+
+    def __init__(self, path, flush_bytes=262144, flush_interval=0.2, fsync="none", fsync_interval=1.0):
+        self.path = Path(path)
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self.fsync = fsync if fsync in self.FSYNC_POLICIES else "none"
+        self.fsync_interval = fsync_interval
+        self.pending = []
+        self.pending_bytes = 0
+        self.condition = threading.Condition()
+        self.running = False
+        self.thread = None
+        self.stats = {'lines': 0, 'batches': 0, 'bytes': 0, 'syncs': 0, 'errors': 0}
+
+    def start(self):
+        self.running = True
+        self.thread = threading.Thread(target=self._run, daemon=True, name="ServerLogWriter")
+        self.thread.start()
+
+    def write(self, text, shard=None):
+        """Queue formatted text for the next batch (any thread)"""
+        with self.condition:
+            self.pending.append(text)
+            self.pending_bytes += len(text)
+            if self.pending_bytes >= self.flush_bytes:
+                self.condition.notify()
+
+    def close(self):
+        """Write what is pending and close the file"""
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join(timeout=5)
+        self.thread = None
+
+    def _take_batch(self):
+        with self.condition:
+            if self.running and self.pending_bytes < self.flush_bytes:
+                self.condition.wait(self.flush_interval)
+            batch, self.pending, self.pending_bytes = self.pending, [], 0
+            return batch, self.running
+
+    def _run(self):
+        last_sync = time.monotonic()
+        self._open()
+        running = True
+        while running:
+            batch, running = self._take_batch()
+            if not batch:
+                continue
+            try:
+                self._write_batch(batch)
+                self.stats['lines'] += len(batch)
+                self.stats['batches'] += 1
+                now = time.monotonic()
+                if self.fsync == "batch" or (self.fsync == "interval" and now - last_sync >= self.fsync_interval):
+                    self._sync()
+                    self.stats['syncs'] += 1
+                    last_sync = now
+            except OSError as e:
+                self.stats['errors'] += 1
+                print(f"[LogServer] Error writing log batch: {e}")
+        try:
+            if self.fsync != "none":
+                self._sync()
+        except OSError:
+            pass
+        self._close()
+
+    def _open(self):
+        self.handle = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.handle = open(self.path, 'a', encoding='utf-8', errors='replace')
+        except OSError as e:
+            print(f"[LogServer] Cannot open {self.path}: {e}")
+
+    def _write_batch(self, batch):
+        if self.handle is None:
+            return
+        data = "".join(batch)
+        self.handle.write(data)
+        self.handle.flush()
+        self.stats['bytes'] += len(data)
+
+    def _sync(self):
+        if self.handle is not None:
+            os.fsync(self.handle.fileno())
+
+    def _close(self):
+        if self.handle is not None:
+            try:
+                self.handle.close()
+            except OSError:
+                pass
+
+
+class ShardedLogWriter(ServerLogWriter):
+    """ServerLogWriter that keeps one file per shard in a directory.
+
+    Each shard "<name>.log" is rotated once it reaches rotate_bytes or is
+    older than rotate_seconds: it is renamed to "<name>.<stamp>.log" and
+    gzipped in the background. Archives beyond keep_archives per shard, or
+    older than retention_days, are deleted. shards.json in the directory
+    indexes the active shards.
+    """
+
+    INDEX_NAME = "shards.json"
+
+    def __init__(self, directory, flush_bytes=262144, flush_interval=0.2, fsync="none", fsync_interval=1.0,
+                 rotate_bytes=64 * 1024 * 1024, rotate_seconds=86400, keep_archives=10, retention_days=14,
+                 max_open=64):
+        super().__init__(Path(directory) / self.INDEX_NAME, flush_bytes, flush_interval, fsync, fsync_interval)
+        self.directory = Path(directory)
+        self.rotate_bytes = rotate_bytes
+        self.rotate_seconds = rotate_seconds
+        self.keep_archives = keep_archives
+        self.retention_days = retention_days
+        self.max_open = max_open
+        self.handles = OrderedDict()  # Shard name -> open binary handle, least recently used first
+        self.index = {}  # Shard name -> {'file', 'bytes', 'lines', 'created', 'updated', 'archives'}
+        self.index_saved = 0.0
+        self.archive_lock = threading.Lock()  # One archiver at a time per writer
+        self.stats['rotations'] = 0
+
+    def write(self, text, shard=None):
+        with self.condition:
+            self.pending.append((shard or "unknown", text))
+            self.pending_bytes += len(text)
+            if self.pending_bytes >= self.flush_bytes:
+                self.condition.notify()
+
+    def _open(self):
+        self.handle = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+        # Compress archives a previous run left plain and apply retention
+        for name in list(self.index):
+            self._archive(name, None)
+
+    def _write_batch(self, batch):
+        groups = {}
+        for shard, text in batch:
+            groups.setdefault(shard, []).append(text)
+        now = time.time()
+        for shard, texts in groups.items():
+            handle, info = self._shard(shard, now)
+            data = "".join(texts).encode('utf-8', 'replace')
+            handle.write(data)
+            handle.flush()
+            info['bytes'] += len(data)
+            info['lines'] += len(texts)
+            info['updated'] = now
+            self.stats['bytes'] += len(data)
+            if info['bytes'] >= self.rotate_bytes or (self.rotate_seconds and now - info['created'] >= self.rotate_seconds):
+                self._rotate(shard, info)
+        if now - self.index_saved >= 5:
+            self._save_index()
+
+    def _shard(self, name, now):
+        """Open handle and index entry of a shard, opening it if needed"""
+        handle = self.handles.get(name)
+        if handle is not None:
+            self.handles.move_to_end(name)
+            return handle, self.index[name]
+        path = self.directory / f"{name}.log"
+        info = self.index.get(name)
+        if info is None or not path.exists():
+            info = self.index[name] = {'file': path.name, 'bytes': 0, 'lines': 0,
+                                       'created': now, 'updated': now,
+                                       'archives': info['archives'] if info else 0}
+        if len(self.handles) >= self.max_open:
+            _, oldest = self.handles.popitem(last=False)
+            oldest.close()
+        handle = self.handles[name] = open(path, 'ab')
+        info['bytes'] = handle.tell()
+        return handle, info
+
+    def _rotate(self, name, info):
+        self.handles.pop(name).close()
+        path = self.directory / f"{name}.log"
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        archive = self.directory / f"{name}.{stamp}.log"
+        counter = 1
+        while archive.exists() or archive.with_name(archive.name + ".gz").exists():
+            archive = self.directory / f"{name}.{stamp}-{counter}.log"
+            counter += 1
+        path.rename(archive)
+        info.update(bytes=0, lines=0, created=time.time())
+        self.stats['rotations'] += 1
+        threading.Thread(target=self._archive, args=(name, archive), daemon=True,
+                         name="ShardArchiver").start()
+
+    def _archive(self, name, archive):
+        """Gzip a rotated file, then drop archives beyond the retention policy.
+
+        With archive None, every plain archive of the shard is compressed.
+        """
+        pattern = re.compile(re.escape(name) + r"\.(\d{8}-\d{6})(?:-(\d+))?\.log(\.gz)?")
+
+        def archives(compressed):
+            found = []
+            for path in self.directory.iterdir():
+                match = pattern.fullmatch(path.name)
+                if match and bool(match.group(3)) == compressed:
+                    found.append(((match.group(1), int(match.group(2) or 0)), path))
+            return [path for _, path in sorted(found)]  # Oldest first
+
+        try:
+            with self.archive_lock:
+                self._compress_archives(archives(False), archive)
+                self._prune_archives(archives(True))
+                if name in self.index:
+                    self.index[name]['archives'] = len(archives(True))
+        except OSError as e:
+            print(f"[LogServer] Error archiving shard {name}: {e}")
+
+    def _compress_archives(self, paths, archive):
+        for path in paths:
+            if archive is None or path == archive:
+                with open(path, 'rb') as source, gzip.open(f"{path}.gz", 'wb') as target:
+                    shutil.copyfileobj(source, target, 1024 * 1024)
+                path.unlink()
+
+    def _prune_archives(self, archives):
+        cutoff = time.time() - self.retention_days * 86400
+        for position, path in enumerate(archives):
+            if (position < len(archives) - self.keep_archives
+                    or (self.retention_days and path.stat().st_mtime < cutoff)):
+                path.unlink()
+
+    def _save_index(self):
+        self.index_saved = time.time()
+        temp_path = self.path.with_suffix(".tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, indent=1)
+        os.replace(temp_path, self.path)
+
+    def _sync(self):
+        for handle in self.handles.values():
+            os.fsync(handle.fileno())
+
+    def _close(self):
+        for handle in self.handles.values():
+            try:
+                handle.close()
+            except OSError:
+                pass
+        self.handles.clear()
+        try:
+            self._save_index()
+        except OSError as e:
+            print(f"[LogServer] Error saving shard index: {e}")
+
 class LogServer:
+    """TCP log receiver for the helper clients.
+
+    One background thread runs an asyncio event loop that accepts every
+    client, so the number of connections does not cost threads.
+
+    Protocol v1: the client's first message is its password hash, answered
+    with AUTH_SUCCESS or AUTH_FAILED, then each log line is echoed back as
+    confirmation.
+
+    Protocol v2 is negotiated by appending options to the first message:
+    "<hash or -> PROTO=2". The server answers
+    "AUTH_SUCCESS PROTO=2 ACK=<lines> ACKMS=<ms>\n". The client then
+    pipelines batches, each a "#B <first seq> <count>\n" header followed by
+    count newline-terminated lines, and the server sends a cumulative
+    "ACK <seq>\n" for the last line it delivered, which may be inside a
+    batch, every ACK lines or ACKMS milliseconds.
+
+    A v2 client may add "COMP=zlib"; if the server agrees it appends
+    "COMP=zlib" to its reply and everything after the reply, in both
+    directions, is one deflate stream per direction, sync-flushed after
+    each write so every batch can be decoded as soon as it arrives.
+    The helper clients shipped in helpers/ speak v1, so v2 batching and
+    compression only serve third-party clients that opt in for now.
+
+    Each connection is a LogClientProtocol that frames lines itself from a
+    receive buffer instead of reading through a stream.
+
+    Optional syslog listeners (server_syslog_udp_port, server_syslog_tcp_port)
+    normalise RFC 3164/5424 messages with SyslogParser into the same path.
+
+    Received lines go to line_sink, when the owning instance sets one, and
+    to the server log file unless server_persist is off. With
+    server_shard_by set to "client" (peer address) or "source" (the
+    "[source]" prefix helper clients put on each line) they are stored in
+    one rotated file per shard under server_shard_dir instead.
+
+    STREAM_TARGET ("server:stream", or "server:stream/<shard>") names the
+    live line stream itself, so an instance can show it without any file,
+    which is the only way to see the lines when server_persist is off.
+    """
+
+    STREAM_TARGET = "server:stream"
+    PROTOCOL_VERSION = 2
+    COMPRESSIONS = ("zlib",)
+    SHARD_KEYS = ("none", "client", "source")
+
     def __init__(self, config_manager, instance_id: str):
         self.config_manager = config_manager
         self.instance_id = instance_id
-        self.server_socket = None
         self.is_running = False
-        self.connected_clients = {}
+        self.connected_clients = {}  # Authenticated clients by "host:port"
+        self.connections = set()  # Every open LogClientProtocol
+        self.loop = None
+        self.server = None
+        self.server_thread = None
         
         # Server configuration
         self.port = int(self.config_manager.get("server_port", 21327))
@@ -6576,10 +9184,57 @@ class LogServer:
         self.server_log_file = Path(self.config_manager.get("server_log_file", "temp_mon.log"))
         self.ssl_certfile = Path(self.config_manager.get("ssl_certfile", "server.crt"))
         self.ssl_keyfile = Path(self.config_manager.get("ssl_keyfile", "server.key"))
+        self.max_clients = int(self.config_manager.get("server_max_clients", 1024))
+        self.admission = AdmissionControl(
+            self,
+            max_clients=self.max_clients,
+            max_per_host=int(self.config_manager.get("server_max_per_client", 64)),
+            connect_rate=float(self.config_manager.get("server_connect_rate", 10)),
+            connect_burst=int(self.config_manager.get("server_connect_burst", 20)),
+            line_rate=float(self.config_manager.get("server_client_rate", 50000)),
+            line_burst=int(self.config_manager.get("server_client_burst", 100000)),
+            queue_high=int(self.config_manager.get("server_queue_high", 200000)),
+            queue_low=int(self.config_manager.get("server_queue_low", 100000)))
+        self.backlog = int(self.config_manager.get("server_backlog", 512))
+        self.auth_timeout = float(self.config_manager.get("server_auth_timeout", 10.0))
+        self.ack_lines = int(self.config_manager.get("server_ack_lines", 1000))
+        self.ack_interval = int(self.config_manager.get("server_ack_ms", 50)) / 1000.0
+        self.max_line_bytes = int(self.config_manager.get("server_max_line_bytes", 1024 * 1024))
+        self.compression = bool(self.config_manager.get("server_compression", True))
+        self.compression_level = int(self.config_manager.get("server_compression_level", 6))
+        # Bytes on the wire and after decompression, over all connections
+        self.wire_stats = {'bytes_in': 0, 'bytes_raw': 0, 'bytes_out': 0}
+        self.flush_bytes = int(self.config_manager.get("server_flush_kb", 256)) * 1024
+        self.flush_interval = int(self.config_manager.get("server_flush_ms", 200)) / 1000.0
+        self.fsync_policy = self.config_manager.get("server_fsync", "none")
+        self.fsync_interval = float(self.config_manager.get("server_fsync_interval", 1.0))
+        self.persist = bool(self.config_manager.get("server_persist", True))
+        self.line_sink = None  # Callable taking each formatted line, called on the loop thread
+        self.shard_by = self.config_manager.get("server_shard_by", "none")
+        if self.shard_by not in self.SHARD_KEYS:
+            self.shard_by = "none"
+        self.shard_dir = Path(self.config_manager.get("server_shard_dir", "server_shards"))
+        self.rotate_bytes = int(self.config_manager.get("server_rotate_mb", 64)) * 1024 * 1024
+        self.rotate_seconds = float(self.config_manager.get("server_rotate_hours", 24)) * 3600
+        self.keep_archives = int(self.config_manager.get("server_keep_archives", 10))
+        self.retention_days = float(self.config_manager.get("server_retention_days", 14))
+        self._shard_names = {}  # Shard key -> sanitized file name
+        self.metrics = ServerMetrics()
+        self.metrics_interval = float(self.config_manager.get("server_metrics_interval", 60))
+        self.sink_depth = None  # Callable giving the owning instance's queued line count
+        self.syslog_udp_port = int(self.config_manager.get("server_syslog_udp_port", 0))
+        self.syslog_tcp_port = int(self.config_manager.get("server_syslog_tcp_port", 0))
+        self.syslog_rcvbuf = int(self.config_manager.get("server_syslog_rcvbuf_mb", 8)) * 1024 * 1024
+        self.syslog_udp = None
+        self.syslog_server = None
+        self.writer = None
+        self._stamp_second = None  # Timestamp text is formatted once per second
+        self._stamp_text = ""
         
         # Ensure instance directory exists
         self.instance_dir = Path(self.config_manager.config_file).parent
         self.server_log_file = self.instance_dir / self.server_log_file
+        self.shard_dir = self.instance_dir / self.shard_dir
         
         # Simple print-based status tracking
         self._print(f"LogServer initialized for instance {instance_id}")
@@ -6589,7 +9244,7 @@ class LogServer:
         print(f"[LogServer] {time.strftime('%H:%M:%S')} - {message}")
         
     def start_server(self):
-        """Start the log server in a separate thread"""
+        """Start the log server on its own event loop thread"""
         if self.is_running:
             self._print("Server is already running")
             return False
@@ -6607,143 +9262,216 @@ class LogServer:
             else:
                 self._print("SSL/TLS disabled - using plaintext connections")
             
-            # Create server socket
-            self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.server_socket.bind(('0.0.0.0', self.port))
-            self.server_socket.listen(5)
-            
             if ssl_enabled and context:
-                self.server_socket = context.wrap_socket(self.server_socket, server_side=True)
                 self.ssl_enabled = True
                 self.ssl_sw = " SSL"
             else:
                 self.ssl_enabled = False
                 self.ssl_sw = " NO Encryption"
+
+            self.metrics = ServerMetrics()
+
+            # One writer owns the log file for all clients
+            if self.persist and self.shard_by != "none":
+                self.writer = ShardedLogWriter(self.shard_dir, self.flush_bytes, self.flush_interval,
+                                               self.fsync_policy, self.fsync_interval, self.rotate_bytes,
+                                               self.rotate_seconds, self.keep_archives, self.retention_days)
+                self.writer.start()
+            elif self.persist:
+                self.writer = ServerLogWriter(self.server_log_file, self.flush_bytes, self.flush_interval,
+                                              self.fsync_policy, self.fsync_interval)
+                self.writer.start()
+
+            # Bind inside the loop thread, wait until it is listening or failed
+            started = threading.Event()
+            self._start_error = None
+            self.loop = asyncio.new_event_loop()
+            self.server_thread = threading.Thread(
+                target=self._run_loop, args=(context, started), daemon=True, name="LogServer")
+            self.server_thread.start()
+            started.wait(timeout=10)
+            if self._start_error or self.server is None:
+                raise self._start_error or RuntimeError("server did not start")
+            if self.syslog_udp_port:
+                self.syslog_udp = SyslogUDPListener(self, self.syslog_udp_port, self.syslog_rcvbuf)
+                self.syslog_udp.start()
+                self._print(f"Syslog UDP listener on port {self.syslog_udp_port}")
             
             self.is_running = True
-            server_thread = threading.Thread(target=self._server_loop, daemon=True)
-            server_thread.start()
-            
             self._print(f"Server started on port {self.port}")
             self._print(f"SSL: {'ENABLED' if self.ssl_enabled else 'DISABLED'}")
             return True
             
         except Exception as e:
             self._print(f"Failed to start server: {e}")
+            self.stop_server()
             return False
-    
+
+    def _run_loop(self, context, started):
+        """Event loop thread: listen, then serve until stop_server"""
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.server = self.loop.run_until_complete(self.loop.create_server(
+                lambda: LogClientProtocol(self), '0.0.0.0', self.port,
+                ssl=context, backlog=self.backlog, reuse_address=True))
+            if self.syslog_tcp_port:
+                self.syslog_server = self.loop.run_until_complete(self.loop.create_server(
+                    lambda: SyslogStreamProtocol(self), '0.0.0.0', self.syslog_tcp_port,
+                    backlog=self.backlog, reuse_address=True))
+                self._print(f"Syslog TCP listener on port {self.syslog_tcp_port}")
+        except Exception as e:
+            if self.server is not None:
+                self.server.close()
+            self._start_error = e
+            started.set()
+            self.loop.close()
+            return
+        started.set()
+        if self.metrics_interval > 0:
+            self.loop.call_later(self.metrics_interval, self._emit_metrics)
+        try:
+            self.loop.run_forever()
+        finally:
+            # Let closing transports and pending tasks finish before closing the loop
+            self.loop.run_until_complete(asyncio.sleep(0))
+            pending = asyncio.all_tasks(self.loop)
+            for task in pending:
+                task.cancel()
+            self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            self.loop.close()
+
     def stop_server(self):
         """Stop the log server"""
         self.is_running = False
-        if self.server_socket:
-            self.server_socket.close()
-            self.server_socket = None
-        
-        # Close all client connections
-        for client_info in self.connected_clients.values():
+        if self.syslog_udp is not None:
+            self.syslog_udp.stop()
+            self.syslog_udp = None
+        loop, thread = self.loop, self.server_thread
+        if loop is not None and not loop.is_closed():
+            def shutdown():
+                if self.server is not None:
+                    self.server.close()
+                if self.syslog_server is not None:
+                    self.syslog_server.close()
+                # Close all client connections
+                for connection in list(self.connections):
+                    connection.transport.close()
+                loop.stop()
             try:
-                client_info['socket'].close()
-            except:
-                pass
+                loop.call_soon_threadsafe(shutdown)
+            except RuntimeError:
+                pass  # Loop already closed
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        self.server = None
+        self.syslog_server = None
+        self.loop = None
+        self.server_thread = None
         self.connected_clients.clear()
+        self.connections.clear()
         self._print("Server stopped")
     
-    def _server_loop(self):
-        """Main server loop to accept client connections"""
-        while self.is_running:
+    def metrics_snapshot(self):
+        """ServerMetrics snapshot plus the lines queued for the instance and the writer"""
+        snapshot = self.metrics.snapshot()
+        snapshot['queue_depth'] = self.admission.queue_depth()
+        return snapshot
+
+    def _emit_metrics(self):
+        """Write a metrics line into the received stream, then reschedule"""
+        if not self.is_running:
+            return
+        self._deliver_line("[METRICS] " + ServerMetrics.format_summary(self.metrics_snapshot()), "SERVER")
+        self.loop.call_later(self.metrics_interval, self._emit_metrics)
+
+    @staticmethod
+    def parse_auth_message(auth_data: str):
+        """Split a handshake message into (password hash, options).
+
+        v1 clients send the bare hash; anything after it is only read as
+        KEY=VALUE options when a PROTO option is present.
+        """
+        tokens = auth_data.split()
+        if len(tokens) > 1 and any(token.startswith("PROTO=") for token in tokens[1:]):
+            options = dict(token.split("=", 1) for token in tokens[1:] if "=" in token)
+            password_hash = "" if tokens[0] == "-" else tokens[0]
+            return password_hash, options
+        return auth_data, {}
+
+    def _deliver_line(self, log_line: str, client_id: str):
+        """Timestamp a received line and hand it to the sink and the log file"""
+        now = int(time.time())
+        if now != self._stamp_second:
+            self._stamp_second = now
+            self._stamp_text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        formatted_line = f"[{self._stamp_text}] [{client_id}] {log_line}"
+        shard = self.shard_name(log_line, client_id) if self.shard_by != "none" else None
+        if self.line_sink is not None:
             try:
-                client_socket, client_address = self.server_socket.accept()
-                client_thread = threading.Thread(
-                    target=self._handle_client,
-                    args=(client_socket, client_address),
-                    daemon=True
-                )
-                client_thread.start()
-                
+                self.line_sink(formatted_line, shard)
             except Exception as e:
-                if self.is_running:  # Only log if we're supposed to be running
-                    self._print(f"Error accepting connection: {e}")
-    
-    def _handle_client(self, client_socket: socket.socket, client_address: tuple):
-        """Handle individual client connection"""
-        client_id = f"{client_address[0]}:{client_address[1]}"
-        self._print(f"Client connected: {client_id}")
-        
-        try:
-            # Authenticate client
-            if not self._authenticate_client(client_socket, client_address):
-                self._print(f"Authentication failed for client {client_id}")
-                client_socket.close()
-                return
-            
-            self.connected_clients[client_id] = {
-                'socket': client_socket,
-                'address': client_address,
-                'connected_at': time.time()
-            }
-            
-            # Process log lines from client
-            self._process_client_logs(client_socket, client_id)
-            
-        except Exception as e:
-            self._print(f"Error handling client {client_id}: {e}")
-        finally:
-            if client_id in self.connected_clients:
-                del self.connected_clients[client_id]
-            try:
-                client_socket.close()
-            except:
-                pass
-            self._print(f"Client disconnected: {client_id}")
-    
-    def _authenticate_client(self, client_socket: socket.socket, client_address: tuple) -> bool:
-        """Authenticate client using password"""
-        try:
-            # Receive authentication data
-            auth_data = client_socket.recv(1024).decode('utf-8').strip()
-            
-            # Simple password authentication
-            if self.password_hash and auth_data != self.password_hash:
-                client_socket.send(b"AUTH_FAILED")
-                return False
-            
-            client_socket.send(b"AUTH_SUCCESS")
-            return True
-            
-        except Exception as e:
-            self._print(f"Authentication error: {e}")
-            return False
-    
-    def _process_client_logs(self, client_socket: socket.socket, client_id: str):
-        """Process log lines from authenticated client"""
-        try:
-            while self.is_running:
-                # Receive log line
-                log_line = client_socket.recv(4096).decode('utf-8').strip()
-                if not log_line:
-                    break
-                
-                # Write to server log file
-                self._write_log_line(log_line, client_id)
-                
-                # Send confirmation
-                client_socket.send(log_line.encode('utf-8'))
-                
-        except Exception as e:
-            self._print(f"Error processing logs from {client_id}: {e}")
-    
-    def _write_log_line(self, log_line: str, client_id: str):
-        """Write log line to server log file with timestamp"""
-        try:
-            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-            formatted_line = f"[{timestamp}] [{client_id}] {log_line}\n"
-            
-            with open(self.server_log_file, 'a', encoding='utf-8') as f:
-                f.write(formatted_line)
-                
-        except Exception as e:
-            self._print(f"Error writing log line: {e}")
+                self._print(f"Error delivering log line: {e}")
+        if self.writer is not None:
+            self.writer.write(formatted_line + "\n", shard)
+
+    def _deliver_syslog(self, data, frames):
+        """Deliver a batch of UDP syslog datagrams, frames are (start, end, address)"""
+        view = memoryview(data)
+        counts = {}
+        for start, end, address in frames:
+            host = address[0]
+            message = str(view[start:end], 'utf-8', 'replace')
+            if not message.strip():
+                continue
+            self._deliver_line(SyslogParser.normalize(message, host), f"{host}:{address[1]}")
+            lines, nbytes = counts.get(host, (0, 0))
+            counts[host] = (lines + 1, nbytes + end - start)
+        for host, (lines, nbytes) in counts.items():
+            self.metrics.record(host, lines, nbytes)
+
+    def shard_name(self, log_line: str, client_id: str) -> str:
+        """File name of the shard a line belongs to"""
+        if self.shard_by == "client":
+            key = client_id.rsplit(":", 1)[0]
+        else:
+            end = log_line.find("]") if log_line.startswith("[") else -1
+            key = log_line[1:end] if end > 1 else "unknown"
+        name = self._shard_names.get(key)
+        if name is None:
+            if len(self._shard_names) > 4096:
+                self._shard_names.clear()
+            name = re.sub(r"[^A-Za-z0-9_-]+", "_", os.path.basename(key.rstrip("/\\")) or key)[:80].strip("_") or "unknown"
+            self._shard_names[key] = name
+        return name
+
+    @classmethod
+    def is_stream_target(cls, target) -> bool:
+        """True for the virtual live stream target rather than a file path"""
+        target = str(target or "")
+        return target == cls.STREAM_TARGET or target.startswith(cls.STREAM_TARGET + "/")
+
+    def stream_target(self, shard=None) -> str:
+        """Target showing the live lines of every shard, or only of shard"""
+        return f"{self.STREAM_TARGET}/{shard}" if shard else self.STREAM_TARGET
+
+    def delivered_shard(self, filepath):
+        """For the stream target or a file this server writes: (True, shard name or None), else (False, None)"""
+        if self.is_stream_target(filepath):
+            shard = str(filepath)[len(self.STREAM_TARGET) + 1:] or None
+            if shard is not None and self.shard_by == "none":
+                return False, None  # Lines carry no shard to select by
+            return True, shard
+        if not self.persist:
+            return False, None  # Nothing is written, no file carries this server's lines
+        path = Path(filepath)
+        if self.shard_by == "none":
+            return path == self.server_log_file, None
+        if path.parent == self.shard_dir and path.suffix == ".log" and "." not in path.stem:
+            return True, path.stem
+        return False, None
 
     def generate_ssl_certificates(self):
         """Generate self-signed SSL certificates for testing"""
@@ -6821,10 +9549,538 @@ class LogServer:
             'port': self.port,
             'ssl_enabled': ssl_status,
             'connected_clients': len(self.connected_clients),
-            'log_file': str(self.server_log_file),
-            'clients': list(self.connected_clients.keys())
+            'log_file': str(self.server_log_file) if self.persist and self.shard_by == "none" else None,
+            'shard_dir': str(self.shard_dir) if self.persist and self.shard_by != "none" else None,
+            'clients': list(self.connected_clients.keys()),
+            'bytes_in': self.wire_stats['bytes_in'],
+            'bytes_raw': self.wire_stats['bytes_raw'],
+            'bytes_out': self.wire_stats['bytes_out'],
+            'compression_ratio': round(self.wire_stats['bytes_raw'] / self.wire_stats['bytes_in'], 2)
+                                 if self.wire_stats['bytes_in'] else None,
+            'metrics': self.metrics_snapshot(),
+            'syslog_udp_port': self.syslog_udp_port or None,
+            'syslog_tcp_port': self.syslog_tcp_port or None,
+            'syslog_udp': dict(self.syslog_udp.stats) if self.syslog_udp is not None else None
+        }
+
+
+class LogClientProtocol(asyncio.BufferedProtocol):
+    """One client connection of a LogServer.
+
+    The transport reads straight into a preallocated bytearray (the asyncio
+    form of recv_into). Complete lines are found by scanning for newlines
+    in place and decoded from memoryview slices; a partial line stays in
+    the buffer and is moved to the front only when the buffer runs out of
+    room. Lines longer than the server's max_line_bytes are truncated and the
+    rest up to the next newline is discarded, so every received line is
+    exactly one protocol line (and one v2 sequence number).
+
+    With compression the transport reads into a separate raw buffer and the
+    inflated bytes are copied into the line buffer.
+    """
+
+    INFLATE_CHUNK = 262144  # Bounds the memory one compressed read can expand to
+
+    def __init__(self, server, buffer_size=65536):
+        self.server = server
+        self.buffer = bytearray(buffer_size)
+        self.view = memoryview(self.buffer)
+        self.start = 0  # First unconsumed byte
+        self.end = 0  # One past the last received byte
+        self.scan = 0  # Where the next newline search resumes
+        self.discarding = False  # Dropping the tail of a truncated overlong line
+        self.transport = None
+        self.client_id = None
+        self.address = None
+        self.host = None
+        self.lines = 0  # Lines received, reported to the metrics once per read
+        self.lines_reported = 0
+        self.reading_paused = False  # Paused by admission control
+        self.state = 'auth'
+        self.protocol = 1
+        self.batch_size = 0
+        self.batch_remaining = 0  # v2: lines still expected in the current batch
+        self.last_seq = None
+        self.acked_seq = None
+        self.unacked = 0
+        self.timer = None
+        self.compressor = None
+        self.decompressor = None
+        self.raw_view = None
+        self.bytes_in = 0  # On the wire
+        self.bytes_raw = 0  # After decompression
+        self.bytes_out = 0
+
+    # Connection lifecycle
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.address = transport.get_extra_info('peername') or ('unknown', 0)
+        self.client_id = f"{self.address[0]}:{self.address[1]}"
+        self.host = str(self.address[0])
+        server = self.server
+        reason = server.admission.admit(self.host)
+        if reason:
+            server._print(f"Rejecting {self.client_id}: {reason}")
+            server.metrics.rejected(self.host)
+            transport.close()
+            return
+        server.admission.opened(self.host)
+        server.connections.add(self)
+        server.metrics.connected(self.host)
+        server._print(f"Client connected: {self.client_id}")
+        self.timer = server.loop.call_later(server.auth_timeout, self._auth_timeout)
+
+    def connection_lost(self, exc):
+        server = self.server
+        if self.timer is not None:
+            self.timer.cancel()
+        if self not in server.connections:
+            return
+        server.connections.discard(self)
+        server.admission.closed(self)
+        server.connected_clients.pop(self.client_id, None)
+        server.metrics.disconnected(self.host)
+        if exc is not None:
+            server._print(f"Error processing logs from {self.client_id}: {exc}")
+            server.metrics.error(self.host)
+        server._print(f"Client disconnected: {self.client_id}")
+
+    def eof_received(self):
+        self.send_ack()
+        return False  # Close the transport
+
+    def _auth_timeout(self):
+        if self.state == 'auth':
+            self.server._print(f"Authentication error: timed out for {self.client_id}")
+            self.server.metrics.error(self.host)
+            self.transport.close()
+
+    # Receive path
+
+    def get_buffer(self, sizehint):
+        if self.decompressor is not None:
+            return self.raw_view
+        if self.end == len(self.buffer):
+            self._make_room()
+        return self.view[self.end:]
+
+    def _make_room(self):
+        """Free space at the end of a full line buffer"""
+        pending = self.end - self.start
+        if self.start:
+            # Move the partial line to the front, the only copy on this path
+            self.buffer[:pending] = self.view[self.start:self.end]
+        elif len(self.buffer) < self.server.max_line_bytes:
+            # Double the buffer up to the line limit
+            self.view.release()
+            self.buffer.extend(bytes(min(len(self.buffer), self.server.max_line_bytes - len(self.buffer))))
+            self.view = memoryview(self.buffer)
+        else:
+            # A line longer than the limit: deliver it truncated, drop the rest up to its newline
+            self.server._print(f"Line from {self.client_id} exceeds {self.server.max_line_bytes} bytes, truncating it")
+            self.server.metrics.error(self.host)
+            self.handle_line(self.view[:self.end])
+            self.discarding = True
+            pending = 0
+        self.start, self.scan, self.end = 0, self.scan - self.start if pending else 0, pending
+
+    def buffer_updated(self, nbytes):
+        self.bytes_in += nbytes
+        self.server.wire_stats['bytes_in'] += nbytes
+        if self.decompressor is None:
+            self.end += nbytes
+            self.bytes_raw += nbytes
+            self.server.wire_stats['bytes_raw'] += nbytes
+            self._process()
+        else:
+            self._inflate(nbytes)
+        lines = self.lines - self.lines_reported
+        self.lines_reported = self.lines
+        self.server.metrics.record(self.host, lines, nbytes)
+        self.server.admission.after_read(self, lines)
+
+    def _inflate(self, nbytes):
+        try:
+            data = self.decompressor.decompress(self.raw_view[:nbytes], self.INFLATE_CHUNK)
+            while True:
+                self._feed(data)
+                if not self.decompressor.unconsumed_tail or self.transport.is_closing():
+                    break
+                data = self.decompressor.decompress(self.decompressor.unconsumed_tail, self.INFLATE_CHUNK)
+        except zlib.error as e:
+            self.server._print(f"Compressed stream error from {self.client_id}: {e}")
+            self.server.metrics.error(self.host)
+            self.transport.close()
+
+    def _feed(self, data):
+        """Copy inflated bytes into the line buffer, processing as it fills"""
+        self.bytes_raw += len(data)
+        self.server.wire_stats['bytes_raw'] += len(data)
+        data = memoryview(data)
+        while data and not self.transport.is_closing():
+            if self.end == len(self.buffer):
+                self._make_room()
+            count = min(len(data), len(self.buffer) - self.end)
+            self.buffer[self.end:self.end + count] = data[:count]
+            self.end += count
+            data = data[count:]
+            self._process()
+
+    def _process(self):
+        """Consume the complete lines between start and end"""
+        if self.state == 'auth':
+            # v1 clients send the hash without a terminator, take the whole first read
+            message = str(self.view[self.start:self.end], 'utf-8', 'replace')
+            self.start = self.scan = self.end
+            self.handle_auth(message)
+        else:
+            buffer, view = self.buffer, self.view
+            while self.transport is not None and not self.transport.is_closing():
+                newline = buffer.find(b"\n", self.scan, self.end)
+                if newline == -1:
+                    if self.discarding:
+                        self.start = self.end  # More of the truncated line, drop it as it arrives
+                    self.scan = self.end
+                    break
+                if self.discarding:
+                    self.discarding = False  # End of the truncated line
+                else:
+                    line_end = newline - 1 if newline > self.start and buffer[newline - 1] == 13 else newline
+                    self.handle_line(view[self.start:line_end])
+                self.start = self.scan = newline + 1
+        if self.start == self.end:
+            self.start = self.scan = self.end = 0
+
+    def send(self, data):
+        """Write to the client, through the compressor once it is negotiated"""
+        if self.compressor is not None:
+            data = self.compressor.compress(data) + self.compressor.flush(zlib.Z_SYNC_FLUSH)
+        self.bytes_out += len(data)
+        self.server.wire_stats['bytes_out'] += len(data)
+        self.transport.write(data)
+
+    # Protocol handling
+
+    def handle_auth(self, message):
+        server = self.server
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        password_hash, options = server.parse_auth_message(message.strip())
+        if server.password_hash and password_hash != server.password_hash:
+            server._print(f"Authentication failed for client {self.client_id}")
+            server.metrics.error(self.host)
+            self.send(b"AUTH_FAILED")
+            self.transport.close()
+            return
+
+        if 'PROTO' not in options:
+            self.send(b"AUTH_SUCCESS")
+        else:
+            # Negotiate down to the highest version both sides speak
+            try:
+                self.protocol = max(1, min(int(options['PROTO']), server.PROTOCOL_VERSION))
+            except ValueError:
+                self.protocol = 1
+            reply = f"AUTH_SUCCESS PROTO={self.protocol}"
+            if self.protocol >= 2:
+                reply += f" ACK={server.ack_lines} ACKMS={int(server.ack_interval * 1000)}"
+                self.timer = server.loop.call_later(server.ack_interval, self._ack_tick)
+                if server.compression and options.get('COMP') in server.COMPRESSIONS:
+                    reply += f" COMP={options['COMP']}"
+            self.send(f"{reply}\n".encode('utf-8'))
+            if " COMP=zlib" in reply:
+                # Both streams live for the whole connection so the history keeps helping
+                self.compressor = zlib.compressobj(server.compression_level)
+                self.decompressor = zlib.decompressobj()
+                self.raw_view = memoryview(bytearray(65536))
+
+        self.state = 'lines'
+        server.connected_clients[self.client_id] = {
+            'connection': self,
+            'address': self.address,
+            'connected_at': time.time(),
+            'protocol': self.protocol,
+            'compression': 'zlib' if self.compressor else None
         }
 
+    def handle_line(self, data):
+        """One received line as a memoryview, without its line terminator"""
+        if self.protocol >= 2:
+            self.handle_v2_line(data)
+            return
+        log_line = str(data, 'utf-8', 'replace').strip()
+        if not log_line:
+            return
+        self.lines += 1
+        self.server._deliver_line(log_line, self.client_id)
+        # Send confirmation
+        self.send(log_line.encode('utf-8'))
+
+    def handle_v2_line(self, data):
+        if self.batch_remaining:
+            self.batch_remaining -= 1
+            self.lines += 1
+            self.server._deliver_line(str(data, 'utf-8', 'replace'), self.client_id)
+            if not self.batch_remaining:
+                self.unacked += self.batch_size
+                if self.unacked >= self.server.ack_lines:
+                    self.send_ack()
+            return
+        if data[:3] != b"#B ":
+            # Stray line outside a batch, keep it but it carries no sequence
+            line = str(data, 'utf-8', 'replace').strip()
+            if line:
+                self.lines += 1
+                self.server._deliver_line(line, self.client_id)
+            return
+        try:
+            _, first_seq, count = bytes(data).split()
+            first_seq, count = int(first_seq), int(count)
+        except ValueError:
+            self.server._print(f"Malformed batch header from {self.client_id}: {bytes(data[:80])!r}")
+            self.server.metrics.error(self.host)
+            self.transport.close()
+            return
+        if self.last_seq is not None and first_seq != self.last_seq + 1:
+            self.server._print(f"Sequence gap from {self.client_id}: expected {self.last_seq + 1}, got {first_seq}")
+            self.server.metrics.error(self.host)
+        # The batch is acknowledged once all its lines are in
+        self.last_seq = first_seq + count - 1
+        self.batch_size = self.batch_remaining = count
+
+    def send_ack(self):
+        """Cumulative ack of the last delivered line, mid-batch on a timer tick or EOF"""
+        self.unacked = 0
+        # last_seq ends the current batch, its lines still expected are not acked
+        last = self.last_seq - self.batch_remaining if self.last_seq is not None else None
+        if self.protocol < 2 or last is None or last == self.acked_seq:
+            return
+        if self.transport is not None and not self.transport.is_closing():
+            self.acked_seq = last
+            self.send(f"ACK {last}\n".encode('utf-8'))
+
+    def _ack_tick(self):
+        self.send_ack()
+        if self.transport is not None and not self.transport.is_closing():
+            self.timer = self.server.loop.call_later(self.server.ack_interval, self._ack_tick)
+
+
+class SyslogParser:
+    """Normalises RFC 5424 and RFC 3164 syslog messages into one line.
+
+    "<PRI>..." headers become "[host] timestamp facility.severity app[procid]: msg";
+    fields a message lacks are "-", and the sender address stands in for a
+    missing host. Text without a PRI header is kept as the message.
+    """
+
+    FACILITIES = ("kern", "user", "mail", "daemon", "auth", "syslog", "lpr", "news", "uucp", "cron",
+                  "authpriv", "ftp", "ntp", "audit", "alert", "clock", "local0", "local1", "local2",
+                  "local3", "local4", "local5", "local6", "local7")
+    SEVERITIES = ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug")
+    RFC5424 = re.compile(r"<(\d{1,3})>1 (\S+) (\S+) (\S+) (\S+) \S+ (-|(?:\[(?:[^\]\\]|\\.)*\])+) ?(.*)", re.DOTALL)
+    RFC3164 = re.compile(r"<(\d{1,3})>([A-Z][a-z]{2} [ \d]\d \d\d:\d\d:\d\d) (\S+) ([^:\[\s]+)(?:\[([^\]]*)\])?: ?(.*)",
+                         re.DOTALL)
+    PRI_ONLY = re.compile(r"<(\d{1,3})>(.*)", re.DOTALL)
+
+    @classmethod
+    def normalize(cls, message: str, sender: str) -> str:
+        message = message.rstrip("\r\n\x00")
+        match = cls.RFC5424.match(message)
+        if match:
+            pri, timestamp, host, app, procid, _, text = match.groups()
+            if text.startswith("\ufeff"):
+                text = text[1:]
+        else:
+            match = cls.RFC3164.match(message)
+            if match:
+                pri, timestamp, host, app, procid, text = match.groups()
+            else:
+                match = cls.PRI_ONLY.match(message)
+                pri, text = match.groups() if match else (None, message)
+                timestamp = host = app = procid = "-"
+        if pri is None:
+            level = "-"
+        else:
+            facility, severity = divmod(int(pri), 8)
+            level = f"{cls.FACILITIES[facility] if facility < len(cls.FACILITIES) else facility}.{cls.SEVERITIES[severity]}"
+        if host == "-":
+            host = sender
+        app = app if not procid or procid == "-" else f"{app}[{procid}]"
+        return f"[{host}] {timestamp} {level} {app}: {text}".replace("\n", " ")
+
+
+class SyslogUDPListener:
+    """UDP syslog receiver for a LogServer.
+
+    A thread waits for the socket to become readable, then drains every
+    queued datagram (up to batch) into one preallocated buffer, the
+    portable stand-in for recvmmsg, and hands the batch to the server's
+    event loop. Datagrams arriving while more than max_pending are still
+    waiting for the loop, or while the server's downstream queue is over
+    its high mark, are dropped and counted.
+    """
+
+    def __init__(self, server, port, rcvbuf=8 * 1024 * 1024, batch=1024, max_pending=100000):
+        self.server = server
+        self.port = port
+        self.rcvbuf = rcvbuf
+        self.batch = batch
+        self.max_pending = max_pending
+        self.sock = None
+        self.thread = None
+        self.running = False
+        self.handed = 0  # Datagrams handed to the loop, written by the listener thread only
+        self.processed = 0  # Datagrams the loop has delivered, written by the loop thread only
+        self.stats = {'datagrams': 0, 'bytes': 0, 'batches': 0, 'dropped': 0, 'errors': 0}
+
+    def start(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.rcvbuf)
+        except OSError as e:
+            self.server._print(f"Could not set syslog receive buffer: {e}")
+        self.sock.bind(('0.0.0.0', self.port))
+        self.sock.setblocking(False)
+        self.running = True
+        self.thread = threading.Thread(target=self._run, daemon=True, name="SyslogUDP")
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join(timeout=2)
+        if self.sock is not None:
+            self.sock.close()
+        self.thread = None
+        self.sock = None
+
+    def _run(self):
+        buffer = bytearray(max(self.batch, 64) * 2048 + 65536)
+        view = memoryview(buffer)
+        limit = len(buffer) - 65536  # Room left for one maximum size datagram
+        while self.running:
+            try:
+                readable, _, _ = select.select([self.sock], [], [], 0.5)
+            except (OSError, ValueError):
+                break
+            if not readable:
+                continue
+            frames = []
+            offset = 0
+            dropped = 0
+            errors = 0
+            overloaded = self.server.admission.overloaded()  # Datagrams cannot be pushed back
+            while len(frames) + dropped + errors < self.batch and offset <= limit:
+                try:
+                    size, address = self.sock.recvfrom_into(view[offset:], 65536)
+                except (BlockingIOError, InterruptedError):
+                    break
+                except OSError:
+                    # e.g. ICMP port unreachable reported on Windows, counted against the batch
+                    errors += 1
+                    continue
+                if self.handed + len(frames) - self.processed >= self.max_pending or overloaded:
+                    dropped += 1
+                    continue
+                frames.append((offset, offset + size, address))
+                offset += size
+            self.stats['dropped'] += dropped
+            self.stats['errors'] += errors
+            if dropped:
+                self.server.metrics.dropped(dropped)
+            if not frames:
+                if errors and not dropped:
+                    time.sleep(0.1)  # Only errors: a persistent socket error must not spin
+                continue
+            self.stats['datagrams'] += len(frames)
+            self.stats['bytes'] += offset
+            self.stats['batches'] += 1
+            self.handed += len(frames)
+            try:
+                self.server.loop.call_soon_threadsafe(self._deliver, bytes(view[:offset]), frames)
+            except (RuntimeError, AttributeError):
+                break  # Loop closed
+
+    def _deliver(self, data, frames):
+        """Loop thread: normalise and deliver one drained batch"""
+        self.processed += len(frames)
+        self.server._deliver_syslog(data, frames)
+
+
+class SyslogStreamProtocol(LogClientProtocol):
+    """TCP syslog connection (RFC 6587).
+
+    Frames are octet counted ("<length> <message>") or, when a frame does
+    not start with a digit, newline terminated. There is no handshake.
+    """
+
+    def connection_made(self, transport):
+        super().connection_made(transport)
+        self.state = 'syslog'
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        if self in self.server.connections:
+            self.server.connected_clients[self.client_id] = {
+                'connection': self,
+                'address': self.address,
+                'connected_at': time.time(),
+                'protocol': 'syslog'
+            }
+
+    def _process(self):
+        buffer = self.buffer
+        while self.start < self.end and not self.transport.is_closing():
+            if self.discarding:
+                # Rest of an overlong newline framed message, _make_room delivered its start
+                newline = buffer.find(b"\n", self.start, self.end)
+                if newline == -1:
+                    self.start = self.scan = self.end
+                    break
+                self.discarding = False
+                self.start = self.scan = newline + 1
+                continue
+            if 48 <= buffer[self.start] <= 57:
+                space = buffer.find(b" ", self.start, min(self.end, self.start + 11))
+                if space == -1:
+                    if self.end - self.start >= 11:
+                        self._frame_error("bad octet count")
+                    break
+                try:
+                    length = int(buffer[self.start:space])
+                except ValueError:
+                    self._frame_error("bad octet count")
+                    break
+                if length > self.server.max_line_bytes - 16:
+                    self._frame_error(f"frame of {length} bytes")
+                    break
+                if self.end < space + 1 + length:
+                    break  # Wait for the rest of the frame
+                self.handle_line(self.view[space + 1:space + 1 + length])
+                self.start = self.scan = space + 1 + length
+            else:
+                newline = buffer.find(b"\n", max(self.scan, self.start), self.end)
+                if newline == -1:
+                    self.scan = self.end
+                    break
+                self.handle_line(self.view[self.start:newline])
+                self.start = self.scan = newline + 1
+        if self.start == self.end:
+            self.start = self.scan = self.end = 0
+
+    def _frame_error(self, reason):
+        self.server._print(f"Syslog framing error from {self.client_id}: {reason}")
+        self.server.metrics.error(self.host)
+        self.transport.close()
+
+    def handle_line(self, data):
+        message = str(data, 'utf-8', 'replace')
+        if message.strip():
+            self.lines += 1
+            self.server._deliver_line(SyslogParser.normalize(message, self.host), self.client_id)
+
 
 class ServerConfigDialog(tk.Toplevel):
     def __init__(self, parent, config_manager, instance_id):
@@ -6834,7 +10090,7 @@ class ServerConfigDialog(tk.Toplevel):
         self.result = None
         
         self.title("Log Server Configuration")
-        self.geometry("500x400")
+        self.geometry("500x520")
         self.resizable(False, False)
         
         self.create_widgets()
@@ -6867,9 +10123,35 @@ class ServerConfigDialog(tk.Toplevel):
         
         ttk.Button(main_frame, text="Browse", command=self.browse_log_file).grid(row=2, column=3, pady=5)
         
+        # Disk sync policy of the log file writer
+        ttk.Label(main_frame, text="Disk Sync:").grid(row=3, column=0, sticky="w", pady=5)
+        self.fsync_var = tk.StringVar()
+        ttk.Combobox(main_frame, textvariable=self.fsync_var, values=ServerLogWriter.FSYNC_POLICIES,
+                     state="readonly", width=10).grid(row=3, column=1, sticky="w", pady=5)
+        self.persist_var = tk.BooleanVar()
+        ttk.Checkbutton(main_frame, text="Save received lines to the log file",
+                        variable=self.persist_var).grid(row=3, column=2, sticky="w", pady=5)
+        
+        # Storage layout: one file, or one rotated file per client or source
+        ttk.Label(main_frame, text="Shard By:").grid(row=4, column=0, sticky="w", pady=5)
+        self.shard_by_var = tk.StringVar()
+        ttk.Combobox(main_frame, textvariable=self.shard_by_var, values=LogServer.SHARD_KEYS,
+                     state="readonly", width=10).grid(row=4, column=1, sticky="w", pady=5)
+        ttk.Label(main_frame, text="(files rotate and are gzipped)").grid(row=4, column=2, sticky="w", pady=5)
+        
+        # Syslog listeners, 0 disables
+        ttk.Label(main_frame, text="Syslog UDP/TCP:").grid(row=5, column=0, sticky="w", pady=5)
+        syslog_frame = ttk.Frame(main_frame)
+        syslog_frame.grid(row=5, column=1, sticky="w", pady=5)
+        self.syslog_udp_var = tk.StringVar()
+        self.syslog_tcp_var = tk.StringVar()
+        ttk.Entry(syslog_frame, textvariable=self.syslog_udp_var, width=6).pack(side=tk.LEFT)
+        ttk.Entry(syslog_frame, textvariable=self.syslog_tcp_var, width=6).pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Label(main_frame, text="(ports, 0 = off, e.g. 5514)").grid(row=5, column=2, sticky="w", pady=5)
+        
         # SSL certificate section
         ssl_frame = ttk.LabelFrame(main_frame, text="SSL/TLS Configuration", padding="5")
-        ssl_frame.grid(row=3, column=0, columnspan=4, sticky="we", pady=10)
+        ssl_frame.grid(row=6, column=0, columnspan=4, sticky="we", pady=10)
         
         ttk.Button(ssl_frame, text="Generate SSL Certificates", 
                   command=self.generate_ssl_certificates).pack(pady=5)
@@ -6878,7 +10160,7 @@ class ServerConfigDialog(tk.Toplevel):
         
         # Test server section
         test_frame = ttk.LabelFrame(main_frame, text="Test Server", padding="5")
-        test_frame.grid(row=4, column=0, columnspan=4, sticky="we", pady=10)
+        test_frame.grid(row=7, column=0, columnspan=4, sticky="we", pady=10)
         
         ttk.Button(test_frame, text="Start Test Server", 
                   command=self.test_server).pack(side=tk.LEFT, padx=(0, 5))
@@ -6888,7 +10170,7 @@ class ServerConfigDialog(tk.Toplevel):
         
         # Buttons
         button_frame = ttk.Frame(main_frame)
-        button_frame.grid(row=5, column=0, columnspan=4, pady=20)
+        button_frame.grid(row=8, column=0, columnspan=4, pady=20)
         
         ttk.Button(button_frame, text="OK", command=self.save_configuration).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(button_frame, text="Cancel", command=self.destroy).pack(side=tk.LEFT)
@@ -6902,6 +10184,11 @@ class ServerConfigDialog(tk.Toplevel):
         
         # Don't load password for security
         self.log_file_var.set(self.config_manager.get("server_log_file", "temp_mon.log"))
+        self.fsync_var.set(self.config_manager.get("server_fsync", "none"))
+        self.persist_var.set(self.config_manager.get("server_persist", True))
+        self.shard_by_var.set(self.config_manager.get("server_shard_by", "none"))
+        self.syslog_udp_var.set(self.config_manager.get("server_syslog_udp_port", 0))
+        self.syslog_tcp_var.set(self.config_manager.get("server_syslog_tcp_port", 0))
         
         # Initialize server log file
         self.initialize_server_log()
@@ -6984,11 +10271,19 @@ class ServerConfigDialog(tk.Toplevel):
             port = int(self.port_var.get())
             if not (1024 <= port <= 65535):
                 raise ValueError("Port must be between 1024 and 65535")
+            syslog_ports = (int(self.syslog_udp_var.get() or 0), int(self.syslog_tcp_var.get() or 0))
+            if any(not (value == 0 or 1 <= value <= 65535) for value in syslog_ports):
+                raise ValueError("Syslog ports must be between 1 and 65535, or 0 for off")
             
             # Save configuration
             self.config_manager.set("server_port", port)
             self.config_manager.set("server_password_hash", self._hash_password(self.password_var.get()))
             self.config_manager.set("server_log_file", self.log_file_var.get())
+            self.config_manager.set("server_fsync", self.fsync_var.get())
+            self.config_manager.set("server_persist", self.persist_var.get())
+            self.config_manager.set("server_shard_by", self.shard_by_var.get())
+            self.config_manager.set("server_syslog_udp_port", syslog_ports[0])
+            self.config_manager.set("server_syslog_tcp_port", syslog_ports[1])
             
             self.config_manager.save_config()
             self.destroy()
@@ -7044,7 +10339,7 @@ class LogTailApp(ttk.Frame):
         
         # Initialize core components
         self.config_manager = ConfigManager(str(self.config_file))
-        self.action_handler = ActionHandler(parent)        
+        self.action_handler = ActionHandler(parent, self.config_manager)
 
         # Control variables
         self.stop_event = Event()
@@ -7063,6 +10358,21 @@ class LogTailApp(ttk.Frame):
 
         self.advanced_filters = {}
         self.editing_advanced_filter_key = None
+        self.filter_plan = None  # Compiled FilterPlan, rebuilt on demand after changes
+        self.log_indexer = None  # LogIndexer when history indexing is enabled
+        self.spill_buffer = None  # SpillBuffer collecting display lines while paused
+        self.bulk_loading = False  # Initial load stores lines and renders once at the end
+        self.bulk_printed = 0  # Filter-printed lines of the current bulk load
+        self.display_active = True  # False while the browser shows another instance
+        self._pending_status_id = None
+        self.remote_lines = deque()  # (line, received at) from the log server waiting for the Tk thread
+        self._remote_drain_scheduled = False
+        # Server lines: "off" rejects them, "loading" holds them back until the
+        # initial history is shown, "live" shows them
+        self.remote_mode = "off"
+        self.remote_shard = None  # While not "off": only this shard's lines, None for all of them
+        self.tailed_file = None  # Path given to the last start_tail
+        self._server_panel_id = None
 
         # Predefined regex patterns
         self.predefined_patterns = {
@@ -7164,12 +10474,14 @@ class LogTailApp(ttk.Frame):
                 for filter_key, filter_info in filter_data['simple_filters'].items():
                     if filter_key not in self.filters:
                         self.filters[filter_key] = filter_info
+                        self.invalidate_filter_plan()
                         self.refresh_filter_listbox()
             
             if 'advanced_filters' in filter_data:
                 for filter_key, filter_info in filter_data['advanced_filters'].items():
                     if filter_key not in self.advanced_filters:
                         self.advanced_filters[filter_key] = filter_info
+                        self.invalidate_filter_plan()
                         self.refresh_advanced_filters_listbox()
             
             self.messages(2, 9, f"Imported filters from {filter_data.get('source_instance', 'another instance')}")
@@ -7232,10 +10544,12 @@ class LogTailApp(ttk.Frame):
             
             if 'simple_filters' in config_data:
                 self.filters = config_data['simple_filters'].copy()
+                self.invalidate_filter_plan()
                 self.refresh_filter_listbox()
             
             if 'advanced_filters' in config_data:
                 self.advanced_filters = config_data['advanced_filters'].copy()
+                self.invalidate_filter_plan()
                 self.refresh_advanced_filters_listbox()
             
             self.messages(2, 9, "Configuration imported successfully")
@@ -7261,6 +10575,8 @@ class LogTailApp(ttk.Frame):
         try:
             # Stop tailing if running
             self.stop_tail()
+            if self.log_indexer:
+                self.log_indexer.stop()
     
             # SYNC AND SAVE: Ensure all UI state is captured
             self.sync_ui_to_config()
@@ -7286,17 +10602,8 @@ class LogTailApp(ttk.Frame):
             
             # Clean up action handler
             if hasattr(self, 'action_handler') and self.action_handler:
-                if self.action_handler.tts_engine:
-                    try:
-                        self.action_handler.tts_engine.stop()
-                    except:
-                        pass
-                
-                if self.action_handler.pygame_initialized:
-                    try:
-                        pygame.mixer.quit()
-                    except:
-                        pass
+                # TTS service and mixer are shared with other tabs, only stop our workers
+                self.action_handler.dispatcher.shutdown()
                         
         except Exception as e:
             print(f"Error during instance cleanup: {e}")
@@ -7427,7 +10734,7 @@ class LogTailApp(ttk.Frame):
             'regex': re.compile(filter_pattern) if filter_pattern else None
         }
         self.plugin_filters[plugin_filename].append(plugin_filter)
-
+        self.invalidate_filter_plan()
 
         self.messages(2, 9, f"Plugin filter registered(main): {plugin_filename} - {filter_id}")
         return True
@@ -7435,20 +10742,12 @@ class LogTailApp(ttk.Frame):
     def process_plugin_filters(self, line):
         """Process all plugin filters against a line - instance specific"""
         if not hasattr(self, 'plugin_manager') or not self.plugin_manager:
-            print(f"DEBUG: not self.plugin_manager:  {plugin_filename}")
             return
 
-        for plugin_filename, filters in self.plugin_filters.items():
-            # Only process plugins loaded in this instance
-            if plugin_filename in self.plugin_manager.loaded_plugins:
-                for filter_obj in filters:
-                    if filter_obj['regex']:
-                        matches = filter_obj['regex'].findall(line)
-                        if matches:
-                            callback = self.plugin_filter_callbacks.get(plugin_filename)
-                            if callback:
-                                # Pass instance context to callback
-                                callback(filter_obj['id'], matches, line, self.instance_id)
+        plan = self.get_filter_plan()
+        plugin_entries = [entry for entry in plan.entries if entry['kind'] == FilterPlan.KIND_PLUGIN]
+        if plugin_entries:
+            plan.dispatch_plugin_matches(plan.match(line, plugin_entries), line, self.instance_id)
 
     def remove_plugin_filter(self, plugin_name, filter_id):
         """Remove a specific plugin filter"""
@@ -7461,8 +10760,31 @@ class LogTailApp(ttk.Frame):
             if not self.plugin_filters[plugin_name]:
                 del self.plugin_filters[plugin_name]
                 del self.plugin_filter_callbacks[plugin_name]
+            self.invalidate_filter_plan()
         return True  # ← ADD THIS LINE                
 
+    def invalidate_filter_plan(self):
+        """Mark the compiled filter plan stale after filters or plugins change"""
+        self.filter_plan = None
+
+    def get_filter_plan(self):
+        """Return the compiled filter plan, rebuilding it if filters changed"""
+        plan = self.filter_plan
+        if plan is None:
+            plugin_manager = getattr(self, 'plugin_manager', None)
+            plan = FilterPlan.build(
+                self.filters,
+                self.advanced_filters,
+                getattr(self, 'plugin_filters', {}),
+                getattr(self, 'plugin_filter_callbacks', {}),
+                plugin_manager.loaded_plugins if plugin_manager else {},
+                scan_limit=int(self.config_manager.get("line_scan_kb", 64)) * 1024
+            )
+            for filter_key, error in plan.errors:
+                self.messages(2, 3, f"Advanced filter regex error in {filter_key}: {error}")
+            self.filter_plan = plan
+        return plan
+
     def test_plugin_integration(self):
         """Test if plugins are receiving data"""
         test_line = "2025-10-04 12:04:53 [System] [] You received Test Item x (1) Value: 0.0100 PED"
@@ -7546,16 +10868,15 @@ class LogTailApp(ttk.Frame):
                 modifier_display = f" ({filter_data['action_modifier']})" if filter_data.get('action_modifier') else ""
                 display_text = f"{filter_data['pattern']} → {action_display}{modifier_display}"
                 self.filter_listbox.insert(tk.END, display_text)
-            
-                # Configure text tag
-                self.log_text.tag_configure(filter_key, 
-                                      foreground=filter_data['fg_color'], 
-                                      background=filter_data['bg_color'])
+
         
+            self.invalidate_filter_plan()
+
             # Update recent filters list
             self.config_manager.update_recent_list("recent_filters", str(filters_path))
             self.update_recent_combos()
         
+            self.preload_filter_sounds()
             self.messages(2, 9, f"Loaded {len(self.filters)} filters automatically")
         
         except Exception as e:
@@ -7650,8 +10971,15 @@ class LogTailApp(ttk.Frame):
                 print(f"[{self.instance_id}] {self.str_out}")
                 self.update_status(self.str_out)
 
-    def simple_encoding_detect(self, file_path):
-        """Detects file encoding efficiently."""
+    def post_message(self, par_1, par_2, par_3):
+        """messages() for worker threads, delivered on the UI thread"""
+        try:
+            self.after(0, self.messages, par_1, par_2, par_3)
+        except (RuntimeError, tk.TclError):
+            pass  # Instance closed
+
+    def simple_encoding_detect(self, file_path, report=None):
+        """Detects file encoding efficiently. Worker threads pass report=self.post_message."""
         try:
             # Only read first 10KB for encoding detection
             with open(file_path, 'rb') as file:
@@ -7665,43 +10993,34 @@ class LogTailApp(ttk.Frame):
             confidence = detected.get('confidence', 0)
             return encoding if encoding and confidence > 0.8 else 'utf-8'
         except Exception as e:
-            self.messages(2,3,f"Encoding detection failed: {e}. Using fallback 'utf-8'.")
+            (report or self.messages)(2,3,f"Encoding detection failed: {e}. Using fallback 'utf-8'.")
             return 'utf-8'
 
-    def get_last_lines(self, filepath, num_lines=50, encoding='utf-8'):
+    def get_last_lines(self, filepath, num_lines=50, encoding='utf-8', report=None):
         """Efficiently get only the last N lines of a file."""
         try:
-            with open(filepath, 'r', encoding=encoding, errors='replace') as file:
+            with open(filepath, 'rb') as file:
                 # Move to end of file
                 file.seek(0, os.SEEK_END)
-                file_size = file.tell()
+                position = file.tell()
 
-                # Start reading backwards from the end
-                buffer_size = 8192
-                buffer = bytearray()
+                # Read blocks backwards until enough newlines are seen, joining once at the end
+                buffer_size = 65536
+                chunks = []
                 lines_found = 0
-                position = file_size
-                
                 while position > 0 and lines_found < num_lines + 1:
-                    # Read chunk from current position
                     chunk_size = min(buffer_size, position)
                     position -= chunk_size
                     file.seek(position)
                     chunk = file.read(chunk_size)
-                    # Add chunk to buffer and count lines
-                    buffer = bytearray(chunk.encode(encoding) if isinstance(chunk, str) else chunk) + buffer
-                    lines_found = buffer.count(b'\n') if isinstance(buffer, bytearray) else chunk.count('\n')
-                
-                # Convert to string and get last N lines
-                if isinstance(buffer, bytearray):
-                    content = buffer.decode(encoding, errors='replace')
-                else:
-                    content = buffer
-                
+                    chunks.append(chunk)
+                    lines_found += chunk.count(b'\n')
+
+                content = b"".join(reversed(chunks)).decode(encoding, errors='replace')
                 lines = content.splitlines()
                 return lines[-num_lines:] if len(lines) > num_lines else lines              
         except Exception as e:
-            self.messages(2,3,f"Error reading last lines: {e}")
+            (report or self.messages)(2,3,f"Error reading last lines: {e}")
             return []
 
 
@@ -7730,6 +11049,8 @@ class LogTailApp(ttk.Frame):
         # Create notebook (same as before)
         notebook = ttk.Notebook(main_container, style='Custom.TNotebook')
         notebook.pack(fill=tk.BOTH, expand=True)
+        notebook.bind("<<NotebookTabChanged>>", lambda e: self.update_log_visibility())
+        self.tabs_notebook = notebook
 
         # Create tabs (same as before)
         self.log_tab = ttk.Frame(notebook, style='Primary.TFrame')
@@ -7759,11 +11080,30 @@ class LogTailApp(ttk.Frame):
         status_frame = ttk.Frame(self)
         status_frame.pack(side=tk.BOTTOM, fill=tk.X)
         
+        # Pending batched alerts badge, hidden while nothing is waiting
+        self.pending_alerts_var = tk.StringVar(value="")
+        self.pending_alerts_label = ttk.Label(status_frame, textvariable=self.pending_alerts_var,
+                                              anchor=tk.E, style='Status.Paused.TLabel')
+        self.pending_alerts_label.pack(side=tk.RIGHT)
+        self.action_handler.notification_batcher.on_change = self.on_pending_alerts_changed
+
         self.status_var = tk.StringVar()
         self.status_var.set("Ready")
         status_bar = ttk.Label(status_frame, textvariable=self.status_var, 
                              relief=tk.SUNKEN, anchor=tk.W)
-        status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+        status_bar.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+    def on_pending_alerts_changed(self, pending):
+        """Show how many batched alerts are waiting, may be called from any thread"""
+        self.after(0, self._update_pending_alerts_badge, pending)
+
+    def _update_pending_alerts_badge(self, pending):
+        if pending:
+            self.pending_alerts_var.set(f" Alerts pending: {pending} ")
+            self.pending_alerts_label.config(relief=tk.SUNKEN)
+        else:
+            self.pending_alerts_var.set("")
+            self.pending_alerts_label.config(relief=tk.FLAT)
 
     # *************************************************************************
 
@@ -7871,6 +11211,8 @@ class LogTailApp(ttk.Frame):
         self.stop_button.pack(side=tk.LEFT, padx=(0, 5))
 
         ttk.Button(left_controls, text="Clear Display", command=self.clear_display).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(left_controls, text="Export", command=self.export_display).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(left_controls, text="History", command=self.open_history_search).pack(side=tk.LEFT, padx=(0, 5))
 
         self.pause_var = tk.BooleanVar(value=False)
         self.pause_button = ttk.Button(left_controls, text="Pause", state="disabled", command=self.toggle_pause, style='Primary.TButton')
@@ -7890,9 +11232,17 @@ class LogTailApp(ttk.Frame):
         self.search_entry = ttk.Entry(right_controls, textvariable=self.search_var, width=25, style='Modern.TEntry')
         self.search_entry.pack(side=tk.LEFT, padx=(0, 5))
         self.search_entry.bind('<Return>', lambda e: self.search_log())
+        self.search_var.trace_add('write', self.on_search_typed)
 
-        ttk.Button(right_controls, text="Find", command=self.search_log, style='Primary.TButton').pack(side=tk.LEFT, padx=(0, 5))
+        self.search_regex_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(right_controls, text="Regex", variable=self.search_regex_var,
+                        command=self.on_search_typed).pack(side=tk.LEFT, padx=(0, 5))
+
+        self.find_button = ttk.Button(right_controls, text="Find", command=self.search_log, style='Primary.TButton')
+        self.find_button.pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(right_controls, text="Clear", command=self.clear_search).pack(side=tk.LEFT, padx=(0, 5))
+        self.search_progress_var = tk.StringVar(value="")
+        ttk.Label(right_controls, textvariable=self.search_progress_var, width=5).pack(side=tk.LEFT, padx=(0, 5))
 
         # Search navigation buttons
         self.prev_button = ttk.Button(right_controls, text="▲ Prev", command=self.search_previous, state="disabled", style='Primary.TButton')
@@ -7901,17 +11251,67 @@ class LogTailApp(ttk.Frame):
         self.next_button.pack(side=tk.LEFT, padx=(0, 5))
   
         # Initialize search state
-        self.search_matches = []
+        self.search_matches = []  # (absolute line index, column, length), sorted
         self.current_match_index = -1
+        self.active_search = None  # Running LogSearch
+        self._search_poll_id = None
+        self._search_typed_id = None
+
+        # View filter bar: show only the history lines matching a transient query
+        view_frame = ttk.LabelFrame(main_frame, text="View Filter", style='Custom.TLabelframe')
+        view_frame.pack(fill=tk.X, pady=(0, 5))
+
+        ttk.Label(view_frame, text="Text:").pack(side=tk.LEFT, padx=(0, 5))
+        self.view_text_var = tk.StringVar()
+        view_entry = ttk.Entry(view_frame, textvariable=self.view_text_var, width=25, style='Modern.TEntry')
+        view_entry.pack(side=tk.LEFT, padx=(0, 5))
+        view_entry.bind('<Return>', lambda e: self.apply_view_filter())
+        self.view_regex_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(view_frame, text="Regex", variable=self.view_regex_var).pack(side=tk.LEFT, padx=(0, 10))
+
+        ttk.Label(view_frame, text="Filter:").pack(side=tk.LEFT, padx=(0, 5))
+        self.view_filter_var = tk.StringVar()
+        self.view_filter_combo = ttk.Combobox(view_frame, textvariable=self.view_filter_var, width=25,
+                                              state="readonly", postcommand=self.update_view_filter_choices)
+        self.view_filter_combo.pack(side=tk.LEFT, padx=(0, 10))
+        self.view_filter_combo.bind('<<ComboboxSelected>>', lambda e: self.apply_view_filter())
+        self.view_filter_keys = {}  # Combobox label -> filter key
+
+        # Compared with the time each line reached the view, not a time inside the line
+        ttk.Label(view_frame, text="Arrived from:").pack(side=tk.LEFT, padx=(0, 5))
+        self.view_since_var = tk.StringVar()
+        ttk.Entry(view_frame, textvariable=self.view_since_var, width=17).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Label(view_frame, text="to:").pack(side=tk.LEFT, padx=(0, 5))
+        self.view_until_var = tk.StringVar()
+        ttk.Entry(view_frame, textvariable=self.view_until_var, width=17).pack(side=tk.LEFT, padx=(0, 10))
+
+        ttk.Button(view_frame, text="Apply", command=self.apply_view_filter, style='Primary.TButton').pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(view_frame, text="Show All", command=self.clear_view_filter).pack(side=tk.LEFT, padx=(0, 5))
+        self.view_count_var = tk.StringVar(value="")
+        ttk.Label(view_frame, textvariable=self.view_count_var).pack(side=tk.LEFT, padx=(5, 0))
 
         # Log display area
         log_display_frame = ttk.LabelFrame(main_frame, text="Log Content", style='Custom.TLabelframe')
         log_display_frame.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
 
-        self.log_text = scrolledtext.ScrolledText(log_display_frame, wrap=tk.WORD, width=80, height=25,
-                                            font=('IBM Plex Mono Text', 10))  # Monospace font for logs
+        # Virtualized display: lines live in log_model, log_text only holds the visible rows
+        log_scrollbar = ttk.Scrollbar(log_display_frame, orient=tk.VERTICAL)
+        log_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=2)
+        self.log_text = tk.Text(log_display_frame, wrap=tk.WORD, width=80, height=25,
+                                font=('IBM Plex Mono Text', 10))  # Monospace font for logs
         self.log_text.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
 
+        self.log_model = LogLineModel(self.config_manager.get("history_lines", 200000))
+        self.log_view = VirtualLogView(self.log_text, log_scrollbar, self.log_model)
+        self.log_view.render_hooks.append(self.apply_search_highlights)
+        self.log_view.render_hooks.append(self.apply_long_line_markers)
+        self.long_lines = LongLineStore()
+        self.style_pool = StyleTagPool(self.log_text)
+        self.log_text.tag_configure("long_line", foreground="#2980b9", underline=True)
+        self.log_text.tag_bind("long_line", "<Button-1>", self.expand_long_line)
+        self.log_text.tag_bind("long_line", "<Enter>", lambda e: self.log_text.config(cursor="hand2"))
+        self.log_text.tag_bind("long_line", "<Leave>", lambda e: self.log_text.config(cursor=""))
+
         # Configure text tags with modern colors
         self.log_text.tag_configure("default", foreground="#2c3e50")
         self.log_text.tag_configure("search_highlight", background="#f39c12", foreground="black")
@@ -8530,6 +11930,22 @@ class LogTailApp(ttk.Frame):
         ttk.Button(file_frame, text="Load", command=lambda: self.browse_filter_file("advanced_filters_file")).grid(row=2, column=2, pady=2)
         ttk.Button(file_frame, text="Save", command=lambda: self.save_advanced_filters(True)).grid(row=2, column=3, sticky="e", pady=2)
 
+        # Remote log server metrics, refreshed while the server runs
+        server_frame = ttk.LabelFrame(main_frame, text="Server", padding="10")
+        server_frame.pack(fill=tk.X, pady=(0, 10))
+        self.server_summary_var = tk.StringVar(value="Server: Stopped")
+        ttk.Label(server_frame, textvariable=self.server_summary_var).pack(anchor="w")
+        columns = ("state", "lines", "rate", "bytes", "errors", "reconnects", "throttled", "last_seen")
+        self.server_clients_tree = ttk.Treeview(server_frame, columns=columns, height=4)
+        self.server_clients_tree.heading("#0", text="Client")
+        self.server_clients_tree.column("#0", width=140)
+        for column, heading, width in zip(columns, ("State", "Lines", "Lines/s", "Bytes", "Errors", "Reconnects",
+                                                    "Refused/Paused", "Last Seen"),
+                                          (70, 90, 70, 90, 60, 80, 100, 80)):
+            self.server_clients_tree.heading(column, text=heading)
+            self.server_clients_tree.column(column, width=width, anchor="e")
+        self.server_clients_tree.pack(fill=tk.X, pady=(5, 0))
+
         # Application Settings Section
         app_frame = ttk.LabelFrame(main_frame, text="Application Settings", padding="10")
         app_frame.pack(fill=tk.X, pady=(0, 10))
@@ -8544,6 +11960,11 @@ class LogTailApp(ttk.Frame):
         self.refresh_interval_var = tk.StringVar(value=str(self.config_manager.get("refresh_interval", 100)))
         ttk.Entry(app_frame, textvariable=self.refresh_interval_var, width=10).grid(row=0, column=3, sticky="w", pady=2)
 
+        # Display history size
+        ttk.Label(app_frame, text="History Lines:").grid(row=0, column=4, sticky="w", padx=(20, 10), pady=2)
+        self.history_lines_var = tk.StringVar(value=str(self.config_manager.get("history_lines", 200000)))
+        ttk.Entry(app_frame, textvariable=self.history_lines_var, width=10).grid(row=0, column=5, sticky="w", pady=2)
+
       
         # Auto-load checkbox
         self.auto_load_var = tk.BooleanVar(value=self.config_manager.get("auto_load_config", True))
@@ -8551,7 +11972,12 @@ class LogTailApp(ttk.Frame):
        
         # Verbosity checkbox
         self.verbose_var = tk.BooleanVar(value=self.config_manager.get("verbose", True))
-        ttk.Checkbutton(app_frame, text="Verbosity", variable=self.verbose_var).grid(row=1, column=2, columnspan=4, sticky="w", pady=10)
+        ttk.Checkbutton(app_frame, text="Verbosity", variable=self.verbose_var).grid(row=1, column=2, columnspan=2, sticky="w", pady=10)
+
+        # Full-text history index checkbox
+        self.index_history_var = tk.BooleanVar(value=self.config_manager.get("index_history", False))
+        ttk.Checkbutton(app_frame, text="Index full log for history search", variable=self.index_history_var,
+                        command=self.update_log_indexer).grid(row=1, column=4, columnspan=2, sticky="w", pady=10)
 
 
         # Styling
@@ -8567,6 +11993,12 @@ class LogTailApp(ttk.Frame):
         self.style_list_combo.current(0)
         
         ttk.Button(app_frame, text="Change theme", command=lambda: self.change_theme(self.style_list_combo.get(),self.auto_style_var), style='Danger.TButton').grid(row=2, column=2, pady=2)
+
+        # Actions for the initial lines loaded on start
+        ttk.Label(app_frame, text="Initial Line Actions:").grid(row=3, column=0, sticky="w", padx=(0, 10), pady=2)
+        self.initial_actions_var = tk.StringVar(value=self.config_manager.get("initial_actions", "summarize"))
+        ttk.Combobox(app_frame, textvariable=self.initial_actions_var, values=["run", "summarize", "suppress"],
+                     state="readonly", width=12).grid(row=3, column=1, sticky="w", padx=(10, 5), pady=2)
        
         # Recent Files Section
         recent_frame = ttk.LabelFrame(main_frame, text="Recent Files", padding="10")
@@ -8602,6 +12034,9 @@ class LogTailApp(ttk.Frame):
             # Start server
             if not hasattr(self, 'log_server'):
                 self.log_server = LogServer(self.config_manager, self.instance_id)
+            # Received lines come straight into this instance, not through the file
+            self.log_server.line_sink = self.receive_remote_line
+            self.log_server.sink_depth = self.remote_lines.__len__
             
             if self.log_server.start_server():
                 # Update GUI status
@@ -8612,15 +12047,29 @@ class LogTailApp(ttk.Frame):
                 
                 self.status_label.config(text=status_text)
                 self.status_label.configure(style='Status.Running.TLabel')
+                self.refresh_server_panel()
                 
                 # Disable local log file selection in config tab
                 self._safe_widget_config(self._config_log_file_entry, 'state', 'disabled')
                 self._safe_widget_config(self._config_browse_button, 'state', 'disabled')
                 
-                # Update log file to use server log file
-                server_log_path = str(self.log_server.server_log_file)
-                self.log_file_var.set(server_log_path)
-                print(f"Server enabled - log file set to: {server_log_path}")
+                # Update log file to use server log file, its history is loaded on start
+                if self.log_server.persist and self.log_server.shard_by != "none":
+                    print(f"Server enabled - shards are written to: {self.log_server.shard_dir}")
+                elif self.log_server.persist:
+                    server_log_path = str(self.log_server.server_log_file)
+                    self.log_file_var.set(server_log_path)
+                    print(f"Server enabled - log file set to: {server_log_path}")
+                else:
+                    # Nothing is written to disk, Start shows the live stream itself
+                    self.log_file_var.set(LogServer.STREAM_TARGET)
+                    print("Server enabled - not persisting, showing the live stream")
+
+                # Already tailing the file the server writes or its stream: switch to its direct lines
+                tailing = ((self.tail_thread and self.tail_thread.is_alive())
+                           or LogServer.is_stream_target(self.tailed_file))
+                if tailing and not self.stop_event.is_set():
+                    self.set_remote_mode(self.tailed_file, "live")
             else:
                 self.server_enabled_var.set(False)
                 self.server_status_label.config(text="Server: Failed to start")
@@ -8629,6 +12078,8 @@ class LogTailApp(ttk.Frame):
             if hasattr(self, 'log_server'):
                 self.log_server.stop_server()
             
+            self.remote_mode = "off"
+            self.remote_lines.clear()
             self.status_label.config(text="Server: Stopped")
             self.status_label.configure(style='Status.Stopped.TLabel')
             
@@ -8638,6 +12089,26 @@ class LogTailApp(ttk.Frame):
             
             print("Server disabled - log file widgets enabled")
     
+    def refresh_server_panel(self):
+        """Show the log server metrics in the config tab, every second while it runs"""
+        if self._server_panel_id is not None:
+            self.after_cancel(self._server_panel_id)
+            self._server_panel_id = None
+        server = getattr(self, 'log_server', None)
+        if server is None or not server.is_running:
+            self.server_summary_var.set("Server: Stopped")
+            return
+        snapshot = server.metrics_snapshot()
+        self.server_summary_var.set(f"Port {server.port}: " + ServerMetrics.format_summary(snapshot))
+        tree = self.server_clients_tree
+        tree.delete(*tree.get_children())
+        for row in snapshot['clients'][:100]:
+            tree.insert("", tk.END, text=row['client'], values=(
+                "connected" if row['active'] else "gone", row['lines'], f"{row['lines_per_s']:.1f}",
+                row['bytes'], row['errors'], row['reconnects'], f"{row['rejected']}/{row['throttled']}",
+                time.strftime("%H:%M:%S", time.localtime(row['last_seen']))))
+        self._server_panel_id = self.after(1000, self.refresh_server_panel)
+
     def _safe_widget_config(self, widget, option, value):
         """Safely configure a widget with error handling"""
         try:
@@ -8925,54 +12396,326 @@ class LogTailApp(ttk.Frame):
     
     def clear_display(self):
         """Clear the log display area."""
-        self.log_text.delete(1.0, tk.END)
+        self.log_model.clear()
+        self.clear_search()
+        self.log_view.render()
+
+    def reset_log_model(self):
+        """Start a fresh display history sized from the History Lines setting"""
+        try:
+            history_lines = int(self.history_lines_var.get())
+        except (ValueError, AttributeError):
+            history_lines = self.config_manager.get("history_lines", 200000)
+        self.log_model = LogLineModel(history_lines)
+        self.long_lines.close()
+        if self.spill_buffer is not None:
+            self.spill_buffer.close()
+            self.spill_buffer = None
+        self.cancel_search()
+        self.search_matches = []
+        self.current_match_index = -1
+        self.log_view.set_model(self.log_model)
+        if self.log_view.query:
+            self.apply_view_filter()  # Filter bits are assigned per model
+
+    def append_display_line(self, line, tag=None, mask=0, spans=None):
+        """Add a line to the display history and let the view render it"""
+        if self.spill_buffer is not None:
+            # Paused or still replaying: keep order by queueing behind the held lines
+            self.spill_buffer.push(line, tag, mask, spans=spans)
+            self.update_pending_status()
+            return None
+        index = self.store_display_line(line, tag, mask, spans=spans)
+        if not self.bulk_loading:
+            self.log_view.on_append(index)
+            if index in self.long_lines:
+                self.apply_long_line_markers(index, index + 1)
+        return index
+
+    def store_display_line(self, line, tag=None, mask=0, timestamp=None, spans=None):
+        """Append to the history, keeping only a preview of very long lines"""
+        limit = self.config_manager.get("line_display_chars", 8192)
+        if not limit or len(line) <= limit:
+            return self.log_model.append(line, tag, mask, timestamp, spans)
+        preview = f"{line[:limit]} … [+{len(line) - limit} chars, click to expand]"
+        if spans:
+            spans = [(start, min(end, limit), span_tag) for start, end, span_tag in spans if start < limit]
+        index = self.log_model.append(preview, tag, mask, timestamp, spans)
+        self.long_lines.discard_before(self.log_model.start)
+        self.long_lines.add(index, line)
+        return index
+
+    def apply_long_line_markers(self, start, stop):
+        """Render hook: make the expand marker of truncated lines clickable"""
+        limit = self.config_manager.get("line_display_chars", 8192)
+        for index in self.long_lines.indexes(start, stop):
+            position = self.log_view.widget_index(index, limit + 1)
+            if position is not None:
+                self.log_text.tag_add("long_line", position, position.split(".")[0] + ".end")
+
+    def expand_long_line(self, event):
+        """Open the full text of a truncated line in its own window"""
+        index = self.log_view.index_at(f"@{event.x},{event.y}")
+        text = self.long_lines.get(index) if index is not None else None
+        if text is None:
+            self.messages(2, 3, "Full line is no longer available")
+            return
+        window = tk.Toplevel(self)
+        window.title(f"Line {index} ({len(text)} chars)")
+        window.geometry("900x500")
+        viewer = scrolledtext.ScrolledText(window, wrap=tk.NONE, font=('IBM Plex Mono Text', 10))
+        viewer.pack(fill=tk.BOTH, expand=True)
+        # Tk slows to a crawl on one huge logical line, show it in fixed-width rows
+        width = 1000
+        viewer.insert("1.0", "\n".join(text[i:i + width] for i in range(0, len(text), width)))
+        viewer.config(state=tk.DISABLED)
+
+    def set_display_active(self, active):
+        """Called by the browser when this instance's tab is shown or hidden"""
+        self.display_active = active
+        self.update_log_visibility()
+
+    def update_log_visibility(self):
+        """Render the log only while its tab is on screen, headless otherwise"""
+        if not hasattr(self, 'log_view'):
+            return
+        visible = self.display_active
+        if visible and hasattr(self, 'tabs_notebook'):
+            visible = self.tabs_notebook.select() == str(self.log_tab)
+        self.log_view.set_visible(visible)
+
+    def export_display(self):
+        """Save the display history to a text file"""
+        filename = filedialog.asksaveasfilename(
+            title="Export Display History",
+            defaultextension=".log",
+            filetypes=[("Log files", "*.log"), ("Text files", "*.txt"), ("All files", "*.*")],
+            initialfile=f"etail_{self.instance_id}.log"
+        )
+        if not filename:
+            return
+        try:
+            with open(filename, 'wb') as f:
+                for index in range(self.log_model.start, self.log_model.end):
+                    # Truncated lines are exported in full, not as their preview
+                    full_text = self.long_lines.get(index) if index in self.long_lines else None
+                    if full_text is not None:
+                        f.write(full_text.encode('utf-8', errors='replace'))
+                    else:
+                        f.write(self.log_model.get_bytes(index))
+                    f.write(b"\n")
+            self.messages(2, 9, f"Exported {len(self.log_model)} lines to {filename}")
+        except Exception as e:
+            self.messages(2, 3, f"Error exporting display: {e}")
+
+    def update_log_indexer(self, encoding=None):
+        """Start, restart or stop the history indexer to match the settings"""
+        log_file = self.log_file_var.get()
+        wanted = self.index_history_var.get() and log_file and Path(log_file).exists()
+        indexer = self.log_indexer
+        if indexer and (not wanted or indexer.log_path != Path(log_file)
+                        or (encoding and encoding != indexer.encoding)):
+            indexer.stop()
+            self.log_indexer = indexer = None
+        if not wanted or indexer:
+            return
+        if not LogIndexer.available():
+            self.messages(2, 3, "History index needs SQLite with FTS5 support")
+            return
+        db_path = Path(self.config_file).with_suffix(".index.db")
+        encoding = encoding or self.simple_encoding_detect(log_file)
+        self.log_indexer = LogIndexer(db_path, log_file, encoding,
+                                      report=lambda message: self.post_message(2, 3, message)).start()
+        self.messages(2, 2, f"Indexing history of {Path(log_file).name}")
+
+    def open_history_search(self):
+        """Search the full-text index of the log file and its rotated siblings"""
+        if not self.log_indexer:
+            self.update_log_indexer()
+        if not self.log_indexer:
+            self.messages(2, 3, "Enable 'Index full log for history search' in Configuration first")
+            return
+        HistorySearchDialog(self, self.log_indexer)
+
+    def on_search_typed(self, *args):
+        """Restart the search shortly after the query changes"""
+        self.cancel_search()
+        if self._search_typed_id is not None:
+            self.after_cancel(self._search_typed_id)
+            self._search_typed_id = None
+        if self.search_var.get().strip():
+            self._search_typed_id = self.after(300, self.search_log)
+
+    def update_view_filter_choices(self):
+        """Fill the view filter combobox with the current simple and advanced filters"""
+        self.view_filter_keys = {"(any)": None}
+        for filter_key in self.filters:
+            self.view_filter_keys[filter_key] = filter_key
+        for filter_key, filter_data in self.advanced_filters.items():
+            self.view_filter_keys[f"Advanced: {filter_data.get('name', filter_key)}"] = filter_key
+        self.view_filter_combo['values'] = list(self.view_filter_keys)
+
+    def parse_view_time(self, text):
+        """Timestamp for 'HH:MM[:SS]' (today) or 'YYYY-MM-DD HH:MM[:SS]', None if empty"""
+        text = text.strip()
+        if not text:
+            return None
+        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%H:%M:%S", "%H:%M"):
+            try:
+                parsed = datetime.strptime(text, fmt)
+            except ValueError:
+                continue
+            if not fmt.startswith("%Y"):
+                parsed = datetime.combine(datetime.now().date(), parsed.time())
+            return parsed.timestamp()
+        raise ValueError(f"Unrecognised time '{text}', use HH:MM[:SS] or YYYY-MM-DD HH:MM[:SS]")
+
+    def apply_view_filter(self):
+        """Show only the history lines matching the view filter bar"""
+        filter_key = self.view_filter_keys.get(self.view_filter_var.get())
+        mask = self.log_model.mask_for([filter_key]) if filter_key else 0
+        if filter_key and not mask:
+            # A zero mask means "any filter", the view would show every line
+            self.messages(2, 3, f"Cannot view by '{self.view_filter_var.get()}': only the first "
+                                f"{LogLineModel.MAX_FILTER_BITS} filters are tracked per line")
+            return
+        try:
+            query = LogViewQuery(
+                text=self.view_text_var.get().strip(),
+                regex=self.view_regex_var.get(),
+                mask=mask,
+                since=self.parse_view_time(self.view_since_var.get()),
+                until=self.parse_view_time(self.view_until_var.get()))
+        except re.error as e:
+            self.messages(2, 3, f"Invalid view pattern: {e}")
+            return
+        except ValueError as e:
+            self.messages(2, 3, str(e))
+            return
+        started = time.perf_counter()
+        shown = self.log_view.set_query(query)
+        elapsed = (time.perf_counter() - started) * 1000
+        if self.log_view.query is None:
+            self.view_count_var.set("")
+        else:
+            self.view_count_var.set(f"{shown} of {len(self.log_model)} lines")
+            self.messages(2, 2, f"View filter matched {shown} lines in {elapsed:.0f} ms")
+
+    def clear_view_filter(self):
+        """Show the whole history again"""
+        self.view_text_var.set("")
+        self.view_filter_var.set("")
+        self.view_since_var.set("")
+        self.view_until_var.set("")
+        self.log_view.set_query(None)
+        self.view_count_var.set("")
 
     def search_log(self):
-        """Search for text in the log display and highlight matches"""
+        """Start a background search of the display history"""
+        # Enter or Find searches now, drop the pending typed search
+        if self._search_typed_id is not None:
+            self.after_cancel(self._search_typed_id)
+            self._search_typed_id = None
+        self.cancel_search()
         search_text = self.search_var.get().strip()
         if not search_text:
             self.clear_search()
             return
 
-        # Remove previous search highlights
-        self.log_text.tag_remove("search_highlight", "1.0", tk.END)
-        self.log_text.tag_remove("search_current", "1.0", tk.END)
-    
         # Reset search state
         self.search_matches = []
         self.current_match_index = -1
+        self.prev_button.config(state="disabled")
+        self.next_button.config(state="disabled")
+        self.log_text.tag_remove("search_highlight", "1.0", tk.END)
+        self.log_text.tag_remove("search_current", "1.0", tk.END)
 
-        # Search for matches (case-insensitive)
-        content = self.log_text.get("1.0", tk.END).lower()
-        search_lower = search_text.lower()
-    
-        start_pos = "1.0"
-        while True:
-            start_pos = self.log_text.search(search_text, start_pos, tk.END, nocase=1)
-            if not start_pos:
-                break
-            
-            end_pos = f"{start_pos}+{len(search_text)}c"
-
-            # Add to matches list
-            self.search_matches.append(start_pos)
-
-            # Apply highlight tag
-            self.log_text.tag_add("search_highlight", start_pos, end_pos)
-        
-            start_pos = end_pos
-
-        # Update UI based on results
-        match_count = len(self.search_matches)
-        if match_count > 0:
-            self.messages(2, 9, f"Found {match_count} match(es)")
+        try:
+            self.active_search = LogSearch(self.log_model, search_text, long_lines=self.long_lines,
+                                           regex=self.search_regex_var.get()).start()
+        except re.error as e:
+            self.messages(2, 3, f"Invalid search pattern: {e}")
+            return
+        self.find_button.config(text="Cancel", command=self.cancel_search)
+        self.messages(2, 2, f"Searching {len(self.log_model)} lines...")
+        self.poll_search()
+
+    def poll_search(self):
+        """Merge results from the running search and update progress"""
+        self._search_poll_id = None
+        search = self.active_search
+        if search is None:
+            return
+        matches = search.poll()
+        if matches:
+            self.add_search_matches(matches)
+        if search.done and not search.results:
+            self.finish_search()
+            return
+        self.search_progress_var.set(f"{int(search.progress * 100)}%")
+        self._search_poll_id = self.after(50, self.poll_search)
+
+    def add_search_matches(self, matches):
+        """Append a chunk of matches and highlight the ones on screen"""
+        first_new = len(self.search_matches)
+        self.search_matches.extend(matches)
+        if first_new == 0:
             self.prev_button.config(state="normal")
             self.next_button.config(state="normal")
             self.jump_to_match(0)  # Jump to first match
+            return
+        view = self.log_view
+        start = max(matches[0][0], view.rendered_start)
+        stop = min(matches[-1][0] + 1, view.rendered_stop)
+        if start < stop:
+            self.apply_search_highlights(start, stop)
+
+    def finish_search(self):
+        """Report the result of a completed search"""
+        self.active_search = None
+        self.search_progress_var.set("")
+        self.find_button.config(text="Find", command=self.search_log)
+        match_count = len(self.search_matches)
+        if match_count > 0:
+            self.messages(2, 9, f"Found {match_count} match(es)")
         else:
             self.messages(2, 3, "No matches found")
-            self.prev_button.config(state="disabled")
-            self.next_button.config(state="disabled")
+
+    def cancel_search(self):
+        """Stop the running search, keeping the matches found so far"""
+        if self.active_search is None:
+            return
+        self.active_search.cancel()
+        self.active_search = None
+        if self._search_poll_id is not None:
+            self.after_cancel(self._search_poll_id)
+            self._search_poll_id = None
+        self.search_progress_var.set("")
+        self.find_button.config(text="Find", command=self.search_log)
+
+    def apply_search_highlights(self, start, stop):
+        """Render hook: tag the search matches that fall in the rendered rows"""
+        if not self.search_matches:
+            return
+        # Keep search tags above the filter color tags
+        self.log_text.tag_raise("search_highlight")
+        self.log_text.tag_raise("search_current")
+        limit = self.config_manager.get("line_display_chars", 8192)
+        first = bisect.bisect_left(self.search_matches, (start, -1, 0))
+        for match_number in range(first, len(self.search_matches)):
+            index, column, length = self.search_matches[match_number]
+            if index >= stop:
+                break
+            tag = "search_current" if match_number == self.current_match_index else "search_highlight"
+            if limit and column + length > limit and index in self.long_lines:
+                # Match runs past the preview, highlight up to and over the expand marker
+                start_pos = self.log_view.widget_index(index, min(column, limit + 1))
+                if start_pos is not None:
+                    self.log_text.tag_add(tag, start_pos, start_pos.split(".")[0] + ".end")
+                continue
+            start_pos = self.log_view.widget_index(index, column)
+            if start_pos is not None:
+                self.log_text.tag_add(tag, start_pos, f"{start_pos}+{length}c")
 
     def search_next(self):
         """Jump to the next search match"""
@@ -8994,26 +12737,18 @@ class LogTailApp(ttk.Frame):
         """Jump to a specific match and highlight it"""
         if not self.search_matches or index < 0 or index >= len(self.search_matches):
             return
-        
-        # Remove current match highlighting
-        self.log_text.tag_remove("search_current", "1.0", tk.END)
-    
-        # Get match position
-        match_pos = self.search_matches[index]
-        end_pos = f"{match_pos}+{len(self.search_var.get())}c"
-    
-        # Highlight current match
-        self.log_text.tag_add("search_current", match_pos, end_pos)
-    
-        # Scroll to make the match visible
-        self.log_text.see(match_pos)
+
+        # Scrolling re-renders the window, the render hook applies the highlights
+        self.current_match_index = index
+        line_index = self.search_matches[index][0]
+        self.log_view.see_line(line_index)
     
         # Update status
-        self.current_match_index = index
         self.messages(2, 2, f"Match {index + 1} of {len(self.search_matches)}")
 
     def clear_search(self):
         """Clear search highlights and reset search state"""
+        self.cancel_search()
         self.log_text.tag_remove("search_highlight", "1.0", tk.END)
         self.log_text.tag_remove("search_current", "1.0", tk.END)
         self.search_var.set("")
@@ -9131,6 +12866,7 @@ class LogTailApp(ttk.Frame):
 
         # Now add the new filter
         self.filters[new_filter_key] = filter_data
+        self.invalidate_filter_plan()
 
         # Also add the new filter to the listbox (we just refreshed, so we can add the new one)
         action_display = action if action != "none" else "color only"
@@ -9141,10 +12877,6 @@ class LogTailApp(ttk.Frame):
         display_text = f"{filter_pattern} → {action_display}{modifier_display}"
         self.filter_listbox.insert(tk.END, display_text)
 
-        # Update the text widget tags: remove the old tag and add the new one
-        self.log_text.tag_delete(old_filter_key)
-        self.log_text.tag_configure(new_filter_key, foreground=fg, background=bg)
-
         # Save the filters to disk
         self.save_filters()
 
@@ -9170,6 +12902,9 @@ class LogTailApp(ttk.Frame):
         """Populate the voice combobox with available voices"""
         self.available_voices = self.action_handler.get_available_voices()
         if not self.available_voices:
+            if not self.action_handler.tts_service.ready.is_set():
+                self.after(500, self.refresh_voices)  # Engine still starting on the service thread
+                return
             self.messages(2, 3, "No TTS voices available")
             return
             # Create display names for the combobox
@@ -9204,28 +12939,15 @@ class LogTailApp(ttk.Frame):
     def test_selected_voice(self):
         """Test the selected voice with sample text"""
         voice_id = self.get_selected_voice_id()
-        if not self.action_handler.tts_engine:
+        if not self.action_handler.tts_service.ready.is_set():
+            self.messages(2, 3, "TTS engine is still starting")
+            return
+        if not self.action_handler.tts_service.engine_available:
             self.messages(2, 3, "TTS engine not initialized")
             return
-        if voice_id and self.action_handler.tts_engine:
-            # Use threading to prevent GUI freezing :cite[9]
-            import threading
-            def speak_test():
-                try:
-                    if self.action_handler.tts_engine:
-                        self.action_handler.tts_engine.startLoop(False)
-                        if self.action_handler.tts_engine._inLoop:
-                            self.action_handler.tts_engine.endLoop()
-                        self.original_voice = self.action_handler.tts_engine.getProperty('voice')
-                        self.action_handler.tts_engine.setProperty('voice', voice_id)
-                        self.action_handler.tts_engine.say("This is a test of the selected voice")
-                        self.action_handler.tts_engine.runAndWait()                 
-                        self.action_handler.tts_engine.setProperty('voice', self.original_voice)
-                except Exception as e:
-                    self.messages(2,3,f"TTS: {e} voice: {voice_id}")
-            thread = threading.Thread(target=speak_test)
-            thread.daemon = True
-            thread.start()
+        if voice_id:
+            # Spoken on the shared TTS service thread, the GUI never waits
+            self.action_handler.tts_service.speak("This is a test of the selected voice", voice_id)
 
     def on_action_changed(self, event=None):
         """Show/hide relevant controls based on selected action"""
@@ -9365,16 +13087,15 @@ class LogTailApp(ttk.Frame):
     
         # Add the updated filter (with potentially new key)
         self.filters[new_filter_key] = updated_filter_data
+        self.invalidate_filter_plan()
     
         # Refresh the listbox display
         self.refresh_filter_listbox()
     
-        # Update text widget tags
-        self.log_text.tag_delete(self.original_filter_key)  # Remove old tag
-        self.log_text.tag_configure(new_filter_key, foreground=fg, background=bg)
-    
         # Save to file
         self.save_filters(None)
+        if action == "sound":
+            self.action_handler.preload_sounds([action_modifier])
     
         # Reset editing state
         self.cancel_edit()
@@ -9444,6 +13165,7 @@ class LogTailApp(ttk.Frame):
     
         # Store the enhanced filter
         self.filters[filter_key] = filter_data
+        self.invalidate_filter_plan()
     
         # Update the listbox display
         action_display = action if action != "none" else "color only"
@@ -9457,11 +13179,10 @@ class LogTailApp(ttk.Frame):
         display_text = f"{filter_pattern} → {action_display}{modifier_display}"
         self.filter_listbox.insert(tk.END, display_text)
     
-        # Configure text widget tag for coloring
-        self.log_text.tag_configure(filter_key, foreground=fg, background=bg)
-    
         # Save filters to file
         self.save_filters(False)
+        if action == "sound":
+            self.action_handler.preload_sounds([action_modifier])
     
         # Clear input fields
         self.filter_string.set("")
@@ -9484,13 +13205,11 @@ class LogTailApp(ttk.Frame):
             
             # Remove from filters dict
             del self.filters[filter_key]
+            self.invalidate_filter_plan()
             
             # Remove from listbox
             self.filter_listbox.delete(index)
             
-            # Remove tag from text widget
-            self.log_text.tag_delete(filter_key)
-            
             # Save changes
             self.save_filters(False)
             self.messages(2,9,"Filter removed")
@@ -9892,9 +13611,11 @@ class LogTailApp(ttk.Frame):
             "generated_regex": self.generated_regex.get(),
             "actions": actions
         }
+        self.invalidate_filter_plan()
 
         self.refresh_advanced_filters_listbox()
         self.save_advanced_filters(False)
+        self.preload_filter_sounds()
         self.messages(2, 9, f"Advanced filter stored: {filter_name}")
 
     def save_advanced_filters(self, dialog=False):
@@ -9958,6 +13679,7 @@ class LogTailApp(ttk.Frame):
             for filter_key, filter_data in advanced_filters_data.items():
                 self.advanced_filters[filter_key] = filter_data
                 print(f"DEBUG: Loaded filter: {filter_data.get('name', 'Unnamed')}")
+            self.invalidate_filter_plan()
     
             # Refresh listbox
             self.refresh_advanced_filters_listbox()
@@ -9966,6 +13688,7 @@ class LogTailApp(ttk.Frame):
             self.config_manager.update_recent_list("recent_advanced_filters", str(filters_path))
             self.update_recent_combos()
     
+            self.preload_filter_sounds()
             self.messages(2, 9, f"Loaded {len(self.advanced_filters)} advanced filters")
     
         except Exception as e:
@@ -10134,6 +13857,7 @@ class LogTailApp(ttk.Frame):
             if confirm:
                 # Remove from dictionary
                 del self.advanced_filters[filter_key]
+                self.invalidate_filter_plan()
                 
                 # Update listbox
                 self.refresh_advanced_filters_listbox()
@@ -10170,6 +13894,7 @@ class LogTailApp(ttk.Frame):
             # Toggle enabled state
             filter_data["enabled"] = not filter_data["enabled"]
             new_state = "enabled" if filter_data["enabled"] else "disabled"
+            self.invalidate_filter_plan()
         
             # Update listbox display
             self.refresh_advanced_filters_listbox()
@@ -10221,6 +13946,8 @@ class LogTailApp(ttk.Frame):
                 voice_names = [voice['name'] for voice in self.advanced_available_voices]
                 self.advanced_voice_combobox['values'] = voice_names
                 # Don't auto-select, preserve current selection if any
+            elif not self.action_handler.tts_service.ready.is_set():
+                self.after(500, self.refresh_advanced_voices)  # Engine still starting
             else:
                 self.messages(2, 3, "No TTS voices available")
         except Exception as e:
@@ -10483,6 +14210,15 @@ class LogTailApp(ttk.Frame):
         except ValueError:
             self.messages(2, 3, "Invalid refresh interval, using default")
             self.config_manager.set("refresh_interval", 100)
+
+        try:
+            self.config_manager.set("history_lines", int(self.history_lines_var.get()))
+        except ValueError:
+            self.messages(2, 3, "Invalid history lines value, using default")
+            self.config_manager.set("history_lines", 200000)
+
+        self.config_manager.set("index_history", self.index_history_var.get())
+        self.config_manager.set("initial_actions", self.initial_actions_var.get())
         
         self.config_manager.set("auto_load_config", self.auto_load_var.get())
         
@@ -10546,6 +14282,9 @@ class LogTailApp(ttk.Frame):
             # Application settings with validation
             self.initial_lines_var.set(str(self.config_manager.get("initial_lines", 50)))
             self.refresh_interval_var.set(str(self.config_manager.get("refresh_interval", 100)))
+            self.history_lines_var.set(str(self.config_manager.get("history_lines", 200000)))
+            self.index_history_var.set(self.config_manager.get("index_history", False))
+            self.initial_actions_var.set(self.config_manager.get("initial_actions", "summarize"))
             self.auto_load_var.set(self.config_manager.get("auto_load_config", True))
             self.verbose_var.set(self.config_manager.get("verbose", True))          
             
@@ -10624,9 +14363,25 @@ class LogTailApp(ttk.Frame):
     # *************************** Tail Actions  **********************************
     # ****************************************************************************
 
+    def preload_filter_sounds(self):
+        """Queue every sound referenced by simple and advanced filters for preloading"""
+        sound_files = [filter_data.get('action_modifier', '')
+                       for filter_data in self.filters.values()
+                       if filter_data.get('action') == "sound"]
+        for filter_data in self.advanced_filters.values():
+            actions = filter_data.get('actions', {})
+            if actions.get('action') == "sound":
+                sound_files.append(actions.get('action_modifier', ''))
+        sound_files = [f for f in sound_files if f]
+        if sound_files:
+            self.action_handler.preload_sounds(sound_files)
+
     def start_tail(self):
-        """Start tailing the log file in a separate thread."""
+        """Load the last lines in the background, then start tailing the log file."""
         #self.config_manager.get("log_file", "") #Get from config file
+        if LogServer.is_stream_target(self.log_file_var.get()):
+            self.start_stream_view(self.log_file_var.get())
+            return
         filepath = Path(self.log_file_var.get()) #Get from UI var
         if not filepath or not filepath.exists():
             self.messages(2,3,f"File {filepath} can't be accessed.")
@@ -10637,22 +14392,103 @@ class LogTailApp(ttk.Frame):
             num_initial_lines = int(self.initial_lines_var.get())
         except:
             num_initial_lines = 50
-        
-        # Display last N lines instead of entire file
-        encoding = self.simple_encoding_detect(filepath)
-        last_lines = self.get_last_lines(filepath, num_initial_lines, encoding)
-        if last_lines == []:
-            print("Falling back to utf-8")
-            encoding = "utf-8"
-            last_lines = self.get_last_lines(filepath, num_initial_lines, "utf-8")
+
+        self.preload_filter_sounds()
+        self.reset_log_model()  # Clear display
+        self.tailed_file = filepath
+        self.set_remote_mode(filepath, "loading")
+        plan = self.get_filter_plan()
+        self.start_button['state']="disabled"
+        self.status_label.config(text="Loading", foreground="orange")
+        Thread(target=self.load_initial_lines, args=(filepath, num_initial_lines, plan), daemon=True).start()
+
+    def start_stream_view(self, target):
+        """Show the log server's live lines directly, there is no file or history to load"""
+        if not self.server_delivers(target):
+            self.messages(2,3,f"Enable the log server to show {target}")
+            return
+        self.preload_filter_sounds()
+        self.reset_log_model()  # Clear display
+        self.tailed_file = target
+        self.stop_event.clear()
+        self.set_remote_mode(target, "live")
+        self.pause_button['state']="normal"
+        self.stop_button['state']="normal"
+        self.start_button['state']="disabled"
+        self.status_label.config(text="Running", foreground="green")
+        self.messages(2,0,f"Showing live server lines: {target}")
+
+    def load_initial_lines(self, filepath, num_initial_lines, plan):
+        """Worker: read the last lines and match them against the plan in batches"""
+        try:
+            # Runs on a worker, messages go back to the UI thread
+            encoding = self.simple_encoding_detect(filepath, report=self.post_message)
+            last_lines = self.get_last_lines(filepath, num_initial_lines, encoding, report=self.post_message)
+            if last_lines == []:
+                print("Falling back to utf-8")
+                encoding = "utf-8"
+                last_lines = self.get_last_lines(filepath, num_initial_lines, "utf-8", report=self.post_message)
+            # Tail from the end of what was read
+            position = os.path.getsize(filepath)
+
+            results = []
+            for batch_start in range(0, len(last_lines), 5000):
+                results.extend(plan.match_batch(last_lines[batch_start:batch_start + 5000]))
+        except Exception as e:
+            print(f"Initial load error: {e}")
+            try:
+                self.after(0, self.fail_initial_load, filepath, e)
+            except (RuntimeError, tk.TclError):
+                pass  # Instance closed while loading
+            return
+        try:
+            self.after(0, self.finish_initial_load, filepath, num_initial_lines, encoding,
+                       last_lines, results, plan, position)
+        except (RuntimeError, tk.TclError):
+            pass  # Instance closed while loading
+
+    def fail_initial_load(self, filepath, error):
+        """Report a failed initial load and leave the view ready for another Start"""
+        self.remote_mode = "off"
+        self.remote_lines.clear()
+        self.start_button['state']="normal"
+        self.status_label.config(text="Load failed", foreground="red")
+        self.messages(2,3,f"Could not load {filepath}: {error}")
+
+    def finish_initial_load(self, filepath, num_initial_lines, encoding, last_lines, results, plan, position):
+        """Store the pre-matched initial lines, render once and start the tail thread"""
         self.encoding_label.config(text=f"Encoding: {encoding} ")
-        
-        self.log_text.delete(1.0, tk.END)  # Clear display
-        for line in last_lines:
-            self.update_display(line)
-        
-        # Start tailing from current end of file
-        self.last_position = os.path.getsize(filepath)
+        self.update_log_indexer(encoding)
+
+        # Backfilled lines are history: actions run, are summarised or are suppressed
+        mode = self.initial_actions_var.get()
+        summary = None if mode == "run" else {}
+        self.bulk_loading = True
+        self.bulk_printed = 0
+        try:
+            for line, line_results in zip(last_lines, results):
+                if not line:
+                    continue
+                self.plugin_manager.call_plugin_method('on_log_line', line)
+                mask = self.match_mask(line_results)
+                if not self.apply_filter_results(line, line_results, plan, mask, summary):
+                    self.append_display_line(line, mask=mask)
+        finally:
+            self.bulk_loading = False
+        self.log_view.set_query(self.log_view.query)  # Single render of the loaded history
+        if summary and mode == "summarize":
+            matches = ", ".join(f"{count} for '{key}'" for key, count in summary.items())
+            self.messages(2, 2, f"Initial lines matched filters (actions not run): {matches}")
+        elif self.bulk_printed:
+            self.messages(2, 2, f"ACTION PRINTED for {self.bulk_printed} initial lines")
+
+        # Server lines held back during the load follow the history
+        if self.remote_mode == "loading":
+            self.remote_mode = "live"
+            self.schedule_remote_drain()
+
+        # Start tailing from the end of the initial read
+        self.last_position = position
         self.stop_event.clear()
         self.tail_thread = Thread(target=self.tail_loop, daemon=True)
         self.tail_thread.start()
@@ -10663,9 +14499,17 @@ class LogTailApp(ttk.Frame):
         self.messages(2,0,f"Started tailing: {filepath} (showing last {num_initial_lines} lines)")
 
     def toggle_pause(self):
-        """Pause or resume log updates."""
+        """Pause or resume log updates.
+
+        While paused, filters and actions keep running and display lines are
+        held in a spill buffer; resuming replays them into the history.
+        """
         self.pause_var.set(not self.pause_var.get())
         if self.pause_var.get():
+            if self.spill_buffer is None:
+                self.spill_buffer = SpillBuffer(
+                    self.config_manager.get("pause_buffer_lines", 50000),
+                    self.config_manager.get("pause_spill_mb", 512) * 1024 * 1024)
             self.status_label.config(text="PAUSED", foreground="orange")
             self.messages(2,4,"")
             self.stop_button['state']="disabled"
@@ -10675,6 +14519,41 @@ class LogTailApp(ttk.Frame):
             self.stop_button['state']="normal"
             self.status_label.config(text="Resumed", foreground="orange")
             self.messages(2,0,"")
+            self.replay_spill_buffer()
+
+    def replay_spill_buffer(self, chunk_lines=20000):
+        """Move paused lines into the history a chunk per event loop pass, then render once"""
+        spill = self.spill_buffer
+        if spill is None or self.pause_var.get():
+            return
+        # Lines the history cannot hold would be evicted straight away
+        excess = len(spill) - self.log_model.max_lines
+        if excess > 0:
+            spill.skip(excess)
+        for line, tag, mask, timestamp, spans in spill.pop_many(chunk_lines):
+            self.store_display_line(line, tag, mask, timestamp, spans)
+        if len(spill):
+            self.update_pending_status()
+            self.after(1, self.replay_spill_buffer, chunk_lines)
+            return
+        if spill.dropped:
+            self.messages(2, 3, f"{spill.dropped} paused lines were dropped, spill limit reached")
+        spill.close()
+        self.spill_buffer = None
+        self.log_view.set_query(self.log_view.query)  # Rebuilds the filtered rows and renders
+        self.status_label.config(text="Running", foreground="green")
+
+    def update_pending_status(self):
+        """Show how many paused lines are waiting, at most a few times per second"""
+        if self._pending_status_id is None:
+            self._pending_status_id = self.after(250, self._show_pending_status)
+
+    def _show_pending_status(self):
+        self._pending_status_id = None
+        if self.spill_buffer is None:
+            return
+        state = "PAUSED" if self.pause_var.get() else "Replaying"
+        self.status_label.config(text=f"{state} ({len(self.spill_buffer)} lines pending)", foreground="orange")
             
     def stop_tail(self):
         """Stop the tailing process."""
@@ -10682,6 +14561,10 @@ class LogTailApp(ttk.Frame):
         self.stop_button['state']="disabled"
         self.start_button['state']="normal"
         self.stop_event.set()
+        # Not tailing: reject server lines rather than falling back to every shard
+        self.remote_mode = "off"
+        self.remote_shard = None
+        self.remote_lines.clear()
         if self.tail_thread and self.tail_thread.is_alive():
             self.tail_thread.join(timeout=2.0)
         self.messages(2,1,"Stopped tailing")
@@ -10714,9 +14597,17 @@ class LogTailApp(ttk.Frame):
                     self.last_position = 0
                     file_rotation_detected = True
 
+                # Lines the server delivers directly are not read back from its file
+                if self.server_delivers(filepath):
+                    self.last_position = current_size
+                    file_rotation_detected = False
+                    time.sleep(0.1)
+                    continue
+
                 # Read new content
                 if current_size > self.last_position or file_rotation_detected:
-                    self.status_label.config(text="Running", foreground="green")
+                    if self.spill_buffer is None:
+                        self.status_label.config(text="Running", foreground="green")
                     with open(filepath, 'r', encoding=encoding, errors='replace') as file:
                         file.seek(self.last_position)
                         new_lines = file.readlines()
@@ -10724,9 +14615,8 @@ class LogTailApp(ttk.Frame):
                         for line in new_lines:
                             if self.stop_event.is_set():
                                 break
-                            # Only process if not paused
-                            if not self.pause_var.get():
-                                self.after(0, self.update_display, line.rstrip())
+                            # Paused lines are still filtered, the display holds them back
+                            self.after(0, self.update_display, line.rstrip())
 
                         self.last_position = file.tell()
                         file_rotation_detected = False
@@ -10746,6 +14636,59 @@ class LogTailApp(ttk.Frame):
                 print(f"Error in tail loop (attempt {error_count}): {e}")
                 time.sleep(1)
   
+    def server_delivers(self, filepath):
+        """True when the running log server already delivers filepath's lines"""
+        server = getattr(self, 'log_server', None)
+        return (server is not None and server.is_running and server.line_sink is not None
+                and server.delivered_shard(filepath)[0])
+
+    def receive_remote_line(self, line, shard=None):
+        """Log server sink, called on the server thread for each received line"""
+        if self.remote_mode == "off" or (self.remote_shard is not None and shard != self.remote_shard):
+            return
+        self.remote_lines.append((line, time.monotonic()))
+        if self.remote_mode == "live":
+            self.schedule_remote_drain()
+
+    def set_remote_mode(self, filepath, mode):
+        """Accept server lines in mode while tailing filepath, if the server delivers its lines"""
+        server = getattr(self, 'log_server', None)
+        self.remote_mode = "off"  # Called while the server thread delivers, switch through off
+        self.remote_lines.clear()
+        if self.server_delivers(filepath):
+            # Tailing one shard of the server storage shows only that shard's live lines
+            self.remote_shard = server.delivered_shard(filepath)[1]
+            self.remote_mode = mode
+        else:
+            self.remote_shard = None
+
+    def schedule_remote_drain(self):
+        """Drain the server lines on the Tk thread, callable from any thread"""
+        if not self._remote_drain_scheduled:
+            self._remote_drain_scheduled = True
+            try:
+                self.after(0, self.drain_remote_lines)
+            except (RuntimeError, tk.TclError):
+                pass  # Instance closed
+
+    def drain_remote_lines(self, chunk_lines=2000):
+        """Run received lines through the filters, a chunk per event loop turn"""
+        self._remote_drain_scheduled = False
+        if self.remote_mode != "live":
+            return
+        lines = self.remote_lines
+        latencies = []
+        for _ in range(min(chunk_lines, len(lines))):
+            line, received = lines.popleft()
+            latencies.append(time.monotonic() - received)
+            self.update_display(line)
+        server = getattr(self, 'log_server', None)
+        if server is not None and latencies:
+            server.metrics.record_latencies(latencies)
+        if lines and not self._remote_drain_scheduled:
+            self._remote_drain_scheduled = True
+            self.after(1, self.drain_remote_lines)
+
     def update_display(self, line):
         """Update the log display with highlighting and execute actions"""
         if not line:
@@ -10755,30 +14698,39 @@ class LogTailApp(ttk.Frame):
         self.plugin_manager.call_plugin_method('on_log_line', line)
 
         # Check if any filter matches and should skip the line
-        should_skip = self.apply_filters_and_actions(line)
+        plan = self.get_filter_plan()
+        results = plan.match(line)
+        mask = self.match_mask(results)
+        should_skip = self.apply_filter_results(line, results, plan, mask)
         if should_skip:       
             return
 
-        # Insert the line at the end
-        self.log_text.insert(tk.END, line + "\n")
+        # Store in the display history, the view renders it if visible
+        self.append_display_line(line, mask=mask)
 
-        # Auto-scroll to the bottom
-        self.log_text.see(tk.END)
-        self.log_text.update()        
+    def match_mask(self, results):
+        """History match bitmask for the simple and advanced filters in results"""
+        return self.log_model.mask_for(entry['key'] for entry, _ in results
+                                       if entry['kind'] != FilterPlan.KIND_PLUGIN)
 
-        # Optional: Limit total lines to prevent memory bloat
-        lines_count = int(self.log_text.index('end-1c').split('.')[0])
-        if lines_count > 10000:  # Keep last 10,000 lines
-            self.log_text.delete(1.0, "1000.0")  # Remove first 5,000 lines
+    def apply_filter_results(self, line, results, plan, mask=0, summary=None):
+        """Run plugin callbacks, actions and highlighting for plan match results.
 
-    def apply_filters_and_actions(self, line):
+        With a summary dict, actions are not executed; instead the number of
+        matches per filter key is counted into it.
+        """
         sw_skip = False
         ac_skip = True
+        spans = []  # Highlight spans of the filters that print the line
 
-        # Apply simple filters
-        self.process_plugin_filters(line)
-        for filter_str, filter_data in self.filters.items():
-            if self.line_matches_filter(line, filter_data):
+        # Plugin filters, routed by the plan that produced the results
+        if self.plugin_manager:
+            plan.dispatch_plugin_matches(results, line, self.instance_id)
+
+        for entry, result in results:
+            # Apply simple filters
+            if entry['kind'] == FilterPlan.KIND_SIMPLE:
+                filter_str, filter_data = entry['key'], entry['data']
                 action = filter_data.get('action', 'none') 
                 modifier = filter_data.get('action_modifier', '')
                 match action:
@@ -10792,88 +14744,57 @@ class LogTailApp(ttk.Frame):
                 # Execute action (if not skip, since we already handled that)
                 if sw_skip != True and action != 'none':
                     ac_skip = False
-                    # Apply coloring
-                    tag_name = filter_str
-                    bg_color = filter_data.get('bg_color', 'yellow')
-                    fg_color = filter_data.get('fg_color', 'black')
+                    # Apply coloring to the matched text, one pooled tag per color pair
+                    style_tag = self.style_pool.tag_for(*entry['style'])
+                    spans.extend((start, end, style_tag) for start, end in result)
                     
-                    self.action_handler.execute_action(action, modifier, line)
+                    if summary is None:
+                        self.action_handler.execute_action(action, modifier, line, filter_str, filter_data)
+                    else:
+                        summary[filter_str] = summary.get(filter_str, 0) + 1
                 # Call plugin on_filter_match method
                 self.plugin_manager.call_plugin_method('on_filter_match', filter_data, line)
 
-        # Apply advanced filters
-        for filter_key, filter_data in self.advanced_filters.items():
-            if filter_data.get('enabled', True):  # Only process enabled advanced filters
-                if self.line_matches_advanced_filter(line, filter_data):
-                    # Apply advanced filter coloring and actions
-                    actions = filter_data.get('actions', {})
-                    # Execute advanced filter actions
-                    action = actions.get('action', 'none')
-                    if action != 'none':
-                        modifier = actions.get('action_modifier', '')
-                        match action:
-                            case "skip":
-                                sw_skip = True
-                                ac_skip = True
-                            case "tts":
-                                voice = actions.get('voice_id', '')
-                                modifier = (actions.get('action_modifier', ''), actions.get('voice_id', ''))
-                        # Execute action (if not skip, since we already handled that)
-                        if sw_skip != True and action != 'none':
-                            ac_skip = False
-                            self.action_handler.execute_action(action, modifier, line)
-                            # Apply coloring
-                            # Create a unique tag for this advanced filter
-                            tag_name = f"advanced_{filter_key}"
-    
-                            # Configure the tag if not already configured
-                            bg_color = actions.get('bg_color', 'yellow')
-                            fg_color = actions.get('fg_color', 'black')
+            # Apply advanced filters
+            elif entry['kind'] == FilterPlan.KIND_ADVANCED:
+                filter_key, filter_data = entry['key'], entry['data']
+                # Apply advanced filter coloring and actions
+                actions = filter_data.get('actions', {})
+                # Execute advanced filter actions
+                action = actions.get('action', 'none')
+                if action != 'none':
+                    modifier = actions.get('action_modifier', '')
+                    match action:
+                        case "skip":
+                            sw_skip = True
+                            ac_skip = True
+                        case "tts":
+                            voice = actions.get('voice_id', '')
+                            modifier = (actions.get('action_modifier', ''), actions.get('voice_id', ''))
+                    # Execute action (if not skip, since we already handled that)
+                    if sw_skip != True and action != 'none':
+                        ac_skip = False
+                        if summary is None:
+                            self.action_handler.execute_action(action, modifier, line, f"advanced_{filter_key}", actions)
+                        else:
+                            summary[filter_data.get('name', filter_key)] = summary.get(filter_data.get('name', filter_key), 0) + 1
+                        # Apply coloring to the matched text, one pooled tag per color pair
+                        style_tag = self.style_pool.tag_for(*entry['style'])
+                        spans.extend((start, end, style_tag) for start, end in result)
 
         if self.verbose_var.get() != True:
             sw_skip = True
         if ac_skip == False: #Print and colour if matched line
-            self.messages(2, 2, f"ACTION PRINTED")
-            self.log_text.insert(tk.END, line + "\n")
-           
-            # Auto-scroll to the bottom
-            self.log_text.see(tk.END)
-            self.log_text.update()        
-
-            start_index = self.log_text.index("end-2l")
-            end_index = self.log_text.index("end-1c")
-
-            #self.log_text.tag_configure(tag_name, foreground=fg_color, background=bg_color)
-            self.log_text.tag_add(tag_name, start_index, end_index)
+            if self.bulk_loading:
+                self.bulk_printed += 1  # Reported once when the load finishes
+            else:
+                self.messages(2, 2, f"ACTION PRINTED")
+            # Stored with its match spans, rendered with the style tags when visible
+            self.append_display_line(line, None, mask, sorted(spans))
 
             sw_skip = True # Skip the line since we already printed it.
         return sw_skip
 
-    def line_matches_advanced_filter(self, line, filter_data):
-        """Check if a line matches an advanced filter pattern"""
-        regex_pattern = filter_data.get('generated_regex', '')
-        if not regex_pattern:
-            return False
-        try:
-            return bool(re.findall(regex_pattern, line))
-        except re.error as e:
-            self.messages(2, 3, f"Advanced filter regex error: {e}")
-            return False
-
-    def line_matches_filter(self, line, filter_data):
-        """Check if a line matches a filter pattern"""
-        pattern = filter_data['pattern']
-        is_regex = filter_data.get('is_regex', False)
-        if is_regex:
-            try:
-                #if hasattr(self, 'plugin_manager'):
-                    #self.broadcast_regex_match(re.findall(pattern, line), line, pattern)
-                return bool(re.findall(pattern, line))
-            except re.error:
-                return pattern in line
-        else:
-            return pattern in line
-
     def detect_log_rotation(self, filepath):
         """Detect if log file has been rotated"""
         try:
@@ -10959,6 +14880,14 @@ class LogTailApp(ttk.Frame):
             self.config_manager.set("refresh_interval", int(self.refresh_interval_var.get()))
         except ValueError:
             pass
+
+        try:
+            self.config_manager.set("history_lines", int(self.history_lines_var.get()))
+        except ValueError:
+            pass
+
+        self.config_manager.set("index_history", self.index_history_var.get())
+        self.config_manager.set("initial_actions", self.initial_actions_var.get())
         
         self.config_manager.set("auto_load_config", self.auto_load_var.get())
         
@@ -11237,6 +15166,14 @@ class ETailBrowser:
         
         # Finally cleanup instances
         self.cleanup_all_instances()
+
+        # Shared audio services outlive single tabs, stop them last
+        TTSService.shutdown_instance()
+        try:
+            if pygame.mixer.get_init():
+                pygame.mixer.quit()
+        except Exception:
+            pass
         
         print("DEBUG: Browser closing completed")
         self.root.destroy()
@@ -11341,6 +15278,10 @@ class ETailBrowser:
                 self.active_instance = instance_id
                 instance_name = self.instances[instance_id]['name']
                 self.status_var.set(f"Active: {instance_name}")
+            # Hidden instances keep filtering but skip all widget work
+            for other_id, instance_info in self.instances.items():
+                if instance_info.get('app'):
+                    instance_info['app'].set_display_active(other_id == instance_id)
                 
     def receive_instance_data(self, instance_id, data_type, data):
         """Receive data from instances for sharing"""
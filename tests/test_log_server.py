@@ -0,0 +1,163 @@
+"""LogServer receive path, driven through LogClientProtocol without sockets.
+
+Run with: python -m unittest discover tests
+"""
+
+import asyncio
+import sys
+import tempfile
+import unittest
+import zlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import etail
+
+
+class FakeTransport:
+    """Just enough of an asyncio transport for LogClientProtocol"""
+
+    def __init__(self):
+        self.written = bytearray()
+        self.closed = False
+
+    def get_extra_info(self, name):
+        return ("127.0.0.1", 50000) if name == "peername" else None
+
+    def write(self, data):
+        self.written += data
+
+    def is_closing(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+    def pause_reading(self):
+        pass
+
+    def resume_reading(self):
+        pass
+
+
+def feed(protocol, data, chunk=None):
+    """Deliver data the way the event loop does, in reads of at most chunk bytes"""
+    data = memoryview(data)
+    while data:
+        buffer = protocol.get_buffer(len(data))
+        count = min(len(buffer), len(data), chunk or len(data))
+        buffer[:count] = data[:count]
+        protocol.buffer_updated(count)
+        data = data[count:]
+
+
+class LogServerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.loop = asyncio.new_event_loop()
+        self.received = []
+
+    def tearDown(self):
+        self.loop.close()
+        self.directory.cleanup()
+
+    def make_server(self, **settings):
+        config = etail.ConfigManager(Path(self.directory.name) / "instance.json")
+        config.set("server_password_hash", "")
+        config.set("server_persist", False)
+        for key, value in settings.items():
+            config.set(key, value)
+        server = etail.LogServer(config, "test")
+        server.loop = self.loop
+        server.line_sink = lambda line, shard: self.received.append(line)
+        return server
+
+    def connect(self, server, handshake):
+        protocol = etail.LogClientProtocol(server)
+        transport = FakeTransport()
+        protocol.connection_made(transport)
+        feed(protocol, handshake)
+        return protocol, transport
+
+
+class V2ProtocolTest(LogServerTestCase):
+
+    def test_overlong_line_inside_batch_keeps_sequence(self):
+        server = self.make_server(server_max_line_bytes=65536)
+        protocol, transport = self.connect(server, b"- PROTO=2")
+        lines = ["l0", "l1", "X" * 200000, "l3", "l4"]
+        payload = "#B 0 5\n" + "".join(line + "\n" for line in lines) + "#B 5 1\nl5\n"
+        feed(protocol, payload.encode("utf-8"), chunk=4096)
+
+        self.assertEqual(len(self.received), 6)
+        self.assertTrue(self.received[2].endswith("XXXX"))
+        self.assertLess(len(self.received[2]), 65536 + 100)
+        self.assertTrue(self.received[3].endswith(" l3"))
+        self.assertTrue(self.received[5].endswith(" l5"))
+        self.assertEqual(protocol.lines, 6)
+        self.assertEqual(protocol.batch_remaining, 0)
+        self.assertEqual(protocol.last_seq, 5)
+
+        protocol.send_ack()
+        self.assertTrue(transport.written.endswith(b"ACK 5\n"))
+
+
+class CompressionTest(LogServerTestCase):
+
+    def test_compressed_batch_in_split_reads(self):
+        server = self.make_server()
+        protocol, transport = self.connect(server, b"- PROTO=2 COMP=zlib")
+        reply, _, compressed_replies = bytes(transport.written).partition(b"\n")
+        self.assertIn(b"COMP=zlib", reply)
+        self.assertEqual(compressed_replies, b"")
+
+        compressor = zlib.compressobj()
+        lines = [f"[src] line {number} " + "payload " * 20 for number in range(200)]
+        payload = "#B 0 200\n" + "".join(line + "\n" for line in lines)
+        data = compressor.compress(payload.encode("utf-8")) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        handshake_bytes = protocol.bytes_in
+        # Reads that cut the deflate stream at arbitrary points
+        feed(protocol, data, chunk=7)
+
+        self.assertEqual([line.split("] ", 2)[2] for line in self.received], lines)
+        self.assertEqual(protocol.last_seq, 199)
+        self.assertEqual(protocol.bytes_in - handshake_bytes, len(data))
+        self.assertEqual(protocol.bytes_raw - handshake_bytes, len(payload))
+        self.assertLess(len(data), len(payload))
+
+        protocol.send_ack()
+        acks = bytes(transport.written)[len(reply) + 1:]
+        self.assertEqual(zlib.decompressobj().decompress(acks), b"ACK 199\n")
+
+
+class DeliveryTest(LogServerTestCase):
+
+    def test_stream_target_without_persistence(self):
+        server = self.make_server(server_persist=False)
+        # No file is written, so no path may claim to carry the server's lines
+        self.assertEqual(server.delivered_shard(server.server_log_file), (False, None))
+        self.assertEqual(server.delivered_shard(etail.LogServer.STREAM_TARGET), (True, None))
+        self.assertTrue(etail.LogServer.is_stream_target(server.stream_target()))
+        self.assertFalse(etail.LogServer.is_stream_target(str(server.server_log_file)))
+
+        protocol, transport = self.connect(server, b"- PROTO=2")
+        feed(protocol, b"#B 0 2\n[web] first\n[web] second\n")
+        self.assertIsNone(server.writer)
+        self.assertEqual([line.split("] ", 2)[2] for line in self.received], ["[web] first", "[web] second"])
+
+    def test_sharded_stream_target(self):
+        server = self.make_server(server_persist=False, server_shard_by="source")
+        self.assertEqual(server.delivered_shard(server.stream_target("web")), (True, "web"))
+        self.assertEqual(server.delivered_shard(server.shard_dir / "web.log"), (False, None))
+
+    def test_persisted_file_is_delivered(self):
+        server = self.make_server(server_persist=True)
+        self.assertEqual(server.delivered_shard(server.server_log_file), (True, None))
+        # A shard of the stream only exists when lines are sharded
+        self.assertEqual(server.delivered_shard(server.stream_target("web")), (False, None))
+
+
+if __name__ == "__main__":
+    unittest.main()